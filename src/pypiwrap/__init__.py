@@ -1,8 +1,15 @@
 """pypiwrap is an API wrapper for the Python Package Index."""
 
-from .client import PyPIClient, PyPIFeedClient, SimpleRepoClient
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .consts import __author__, __license__, __name__, __version__
 
+if TYPE_CHECKING:
+    from .client import PyPIClient, PyPIFeedClient, SimpleRepoClient
+
 __all__ = (
     "SimpleRepoClient",
     "PyPIClient",
@@ -12,3 +19,62 @@ __all__ = (
     "__version__",
     "__license__",
 )
+
+# Clients and submodules are imported on first access to keep `import pypiwrap` cheap.
+_LAZY_ATTRIBUTES = {
+    "SimpleRepoClient": "client",
+    "PyPIClient": "client",
+    "PyPIFeedClient": "client",
+}
+
+_LAZY_SUBMODULES = frozenset(
+    {
+        "audit",
+        "bulk",
+        "cache",
+        "cli",
+        "client",
+        "consts",
+        "deadlines",
+        "diffing",
+        "exceptions",
+        "hosts",
+        "interning",
+        "invalidation",
+        "merging",
+        "objects",
+        "requirements",
+        "search",
+        "simple_html",
+        "store",
+        "tags",
+        "transport",
+        "utils",
+        "verify",
+        "versions",
+    }
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        value = getattr(module, name)
+    elif name in _LAZY_SUBMODULES:
+        try:
+            value = importlib.import_module(f".{name}", __name__)
+        except ImportError as exc:
+            # a submodule requiring a missing optional dependency is unavailable,
+            # which hasattr() should report rather than raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r} ({exc})"
+            ) from exc
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
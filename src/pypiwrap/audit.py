@@ -0,0 +1,185 @@
+"""Utilities for auditing a set of pinned requirements for known vulnerabilities.
+
+.. versionadded:: 2.1.0
+
+.. note::
+    This module requires the ``packaging`` library which can be installed alongside
+    pypiwrap with ``pip install pypiwrap[packaging]``.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, NamedTuple, Union
+
+from .deadlines import gather
+from .exceptions import ClientError, DeadlineExceeded
+from .utils import normalize_name
+from .versions import parse_version
+
+if TYPE_CHECKING:
+    from .client import PyPIClient
+    from .objects import Project, Vulnerability
+
+PIN_PATTERN = re.compile(
+    r"^(?P<name>[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)\s*(?:\[[^\]]*\])?"
+    r"\s*===?\s*(?P<version>[^\s;,]+)\s*(?:;.*)?$"
+)
+
+
+class Pin(NamedTuple):
+    """A requirement pinned to an exact version."""
+
+    name: str
+    """The name of the project."""
+
+    version: str
+    """The pinned version."""
+
+
+PinLike = Union[str, Pin, tuple[str, str]]
+
+
+def parse_pins(requirements: Iterable[PinLike]) -> tuple[list[Pin], list[str]]:
+    """Parses pinned requirements such as the lines of a requirements file.
+
+    Comments, blank lines, and options (such as ``-r`` or ``--hash``) are ignored.
+    Name and version pairs and :class:`.Pin` objects are accepted as is, which allows
+    passing entries already extracted from lock files.
+
+    Returns:
+        A tuple including the pins found and the requirements that could not be
+        understood as exact pins (for example, ``requests>=2``).
+    """
+
+    pins: list[Pin] = []
+    skipped: list[str] = []
+
+    for requirement in requirements:
+        if not isinstance(requirement, str):
+            pins.append(Pin(*requirement))
+            continue
+
+        line = requirement.split("#", 1)[0].rstrip(" \\").strip()
+        line = line.split(" --hash", 1)[0].strip()
+        if not line or line.startswith("-"):
+            continue
+
+        match = PIN_PATTERN.match(line)
+        if match is None:
+            skipped.append(line)
+        else:
+            pins.append(Pin(match["name"], match["version"]))
+
+    return pins, skipped
+
+
+@dataclass
+class AffectedPin:
+    """A pinned requirement affected by one or more vulnerabilities."""
+
+    pin: Pin
+    """The pinned requirement."""
+
+    vulnerabilities: list[Vulnerability]
+    """The active (not withdrawn) vulnerabilities affecting this pin."""
+
+    fixed_in: list[str]
+    """The versions, newer than the pinned version, that address at least one of the
+    vulnerabilities in ascending order."""
+
+
+@dataclass
+class AuditReport:
+    """The result of auditing a set of pinned requirements."""
+
+    audited: list[Pin] = field(default_factory=list)
+    """The unique pins that were audited."""
+
+    affected: list[AffectedPin] = field(default_factory=list)
+    """The pins affected by active vulnerabilities."""
+
+    withdrawn: list[tuple[Pin, Vulnerability]] = field(default_factory=list)
+    """Withdrawn advisories matching an audited pin. These do not affect the pin."""
+
+    skipped: list[str] = field(default_factory=list)
+    """The requirements that were not exact pins and thus were not audited."""
+
+    errors: dict[Pin, Exception] = field(default_factory=dict)
+    """A mapping of pins to the errors that occurred while fetching them, for
+    example, if the release does not exist, the connection failed, or the request
+    timed out."""
+
+    @property
+    def ok(self) -> bool:
+        """Whether no audited pin is affected and no errors occurred."""
+        return not self.affected and not self.errors
+
+
+def _newer_fixes(version: str, vulns: list[Vulnerability]) -> list[str]:
+    pinned = parse_version(version)
+    fixes = {}
+
+    for vuln in vulns:
+        for fix in vuln.fixed_in:
+            parsed = parse_version(fix)
+            if parsed is not None and (pinned is None or parsed > pinned):
+                fixes[parsed] = fix
+
+    return [fixes[key] for key in sorted(fixes)]
+
+
+def audit(
+    client: PyPIClient, requirements: Iterable[PinLike], max_workers: int = 10
+) -> AuditReport:
+    """Audits ``requirements`` for vulnerabilities reported by the PyPI JSON API.
+
+    Repeated pins (after name normalization) are only fetched once and releases are
+    fetched concurrently. This is the implementation of :meth:`.PyPIClient.audit`.
+    """
+
+    pins, skipped = parse_pins(requirements)
+
+    unique: dict[tuple[str, str], Pin] = {}
+    for pin in pins:
+        unique.setdefault((normalize_name(pin.name), pin.version), pin)
+
+    report = AuditReport(audited=list(unique.values()), skipped=skipped)
+
+    # A failed pin (an error response, a connection error, a timeout or an invalid
+    # body) is recorded rather than aborting the whole audit. Only an expired
+    # overall deadline does, whether raised by gather or by a request.
+    recorded = (ClientError, TimeoutError, ValueError, *client.transport.errors)
+
+    def fetch(pin: Pin) -> Project | Exception:
+        try:
+            return client.get_project(pin.name, pin.version)
+        except DeadlineExceeded:
+            raise
+        except recorded as exc:
+            return exc
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = gather(executor, fetch, report.audited)
+
+        for pin, result in zip(report.audited, results):
+            if isinstance(result, Exception):
+                report.errors[pin] = result
+                continue
+
+            active = []
+            for vuln in result.vulnerabilities:
+                if vuln.withdrawn is not None:
+                    report.withdrawn.append((pin, vuln))
+                else:
+                    active.append(vuln)
+
+            if active:
+                report.affected.append(
+                    AffectedPin(pin, active, _newer_fixes(pin.version, active))
+                )
+
+    return report
@@ -0,0 +1,286 @@
+"""Parallel parsing of raw API responses across several processes.
+
+Decoding JSON and building model objects is CPU-bound, so parsing many responses in
+one process is limited to a single core even when downloading them concurrently.
+:class:`BulkParser` hands the raw response bodies to a pool of worker processes and
+yields the parsed objects in the order the bodies were given.
+
+Workers send the objects back as tuples of their field values, which the parent
+process unpickles and rebuilds considerably faster than the objects themselves. For
+``project`` payloads, a ``fields`` projection is applied in the workers so large
+unrequested fields (such as descriptions) are never sent back at all.
+
+Example::
+
+    with BulkParser() as parser:
+        for page in parser.parse("project_page", bodies):
+            ...
+
+.. versionadded:: 2.1.0
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import os
+import warnings
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from functools import lru_cache
+from itertools import starmap
+from operator import itemgetter
+from typing import Any
+
+from .deadlines import current_deadline
+from .exceptions import DeadlineExceeded, verify_api_version
+from .objects.base import APIObject
+
+KINDS = ("project", "stats", "index_page", "project_page", "provenance")
+"""The kinds of payloads that can be parsed."""
+
+
+# Models are sent back to the parent process as tables: their class, a tuple with
+# the field values of each model, the indices of the fields holding nested tables,
+# the attributes of each model that are not fields (if any), and whether the table
+# holds a single model rather than a list.
+_Table = tuple[type, list[Any], tuple[int, ...], "list[dict[str, Any]] | None", bool]
+
+
+@lru_cache(maxsize=64)
+def _field_getter(cls: type) -> Callable[[dict[str, Any]], tuple[Any, ...]]:
+    names = [field.name for field in dataclasses.fields(cls)]
+    getter = itemgetter(*names)
+    return getter if len(names) > 1 else lambda state: (getter(state),)
+
+
+def _has_models(value: Any) -> bool:
+    return isinstance(value, APIObject) or (
+        type(value) is list and bool(value) and isinstance(value[0], APIObject)
+    )
+
+
+def _pack_value(value: Any) -> Any:
+    if isinstance(value, APIObject):
+        return _pack([value], single=True)
+    elif _has_models(value):
+        return _pack(value)
+    return value
+
+
+def _pack(models: list[Any], single: bool = False) -> _Table | list[Any]:
+    cls = type(models[0])
+    if any(type(model) is not cls for model in models):
+        return models
+
+    get_fields = _field_getter(cls)
+    rows = [get_fields(model.__dict__) for model in models]
+
+    nested = tuple(
+        index
+        for index, column in enumerate(zip(*rows))
+        if any(map(_has_models, column))
+    )
+    if nested:
+        rows = [list(row) for row in rows]
+        for row in rows:
+            for index in nested:
+                row[index] = _pack_value(row[index])
+
+    size = len(rows[0])
+    extras = None
+    if any(len(model.__dict__) != size for model in models):
+        extras = [dict(list(model.__dict__.items())[size:]) for model in models]
+
+    return cls, rows, nested, extras, single
+
+
+def _unpack(table: _Table) -> Any:
+    cls, rows, nested, extras, single = table
+
+    for row in rows if nested else ():
+        for index in nested:
+            if type(row[index]) is tuple:
+                row[index] = _unpack(row[index])
+
+    models = list(starmap(cls, rows))
+    if extras is not None:
+        for model, extra in zip(models, extras):
+            model.__dict__.update(extra)
+
+    return models[0] if single else models
+
+
+def _parse_payload(
+    kind: str, raw: bytes | str, fields: frozenset[str] | None = None
+) -> tuple[Any, list[tuple[str, type[Warning]]]]:
+    # runs in a worker process: warnings are returned to be emitted by the parent
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        model = _parse_model(kind, json.loads(raw), fields)
+
+    return _pack_value(model), [
+        (str(warning.message), warning.category) for warning in caught
+    ]
+
+
+def _parse_model(
+    kind: str, data: dict[str, Any], fields: frozenset[str] | None = None
+) -> Any:
+    # the models are imported here so that workers only pay for what they parse
+    if kind in ("index_page", "project_page"):
+        verify_api_version(data["meta"]["api-version"])
+
+    if kind == "project":
+        from .objects.pypi import Project
+
+        return Project.from_json(data, fields)
+    elif kind == "stats":
+        from .objects.pypi import Stats
+
+        return Stats.from_json(data)
+    elif kind == "index_page":
+        from .objects.simple_repo import IndexPage
+
+        return IndexPage.from_json(data)
+    elif kind == "project_page":
+        from .objects.simple_repo import ProjectPage
+
+        return ProjectPage.from_json(data)
+    elif kind == "provenance":
+        from .objects.integrity import Provenance
+
+        return Provenance.from_json(data)
+
+    raise ValueError(f"Unknown payload kind {kind!r}. Expected one of {KINDS}.")
+
+
+class BulkParser:
+    """Parses raw API responses in a pool of worker processes.
+
+    The pool is started on first use and reused until :meth:`.close` is called, so a
+    parser should be kept around rather than created for each batch.
+
+    Arguments:
+        max_workers (int, optional):
+            The amount of worker processes. If none specified, one per CPU is used.
+
+        max_in_flight (int, optional):
+            The maximum amount of payloads submitted to the pool but not yet yielded.
+            Payloads are only consumed from the input as results are yielded, which
+            bounds memory usage when the input is itself a stream of downloads.
+            Defaults to four times the amount of workers.
+    """
+
+    def __init__(
+        self, max_workers: int | None = None, *, max_in_flight: int | None = None
+    ) -> None:
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight
+        self._executor: ProcessPoolExecutor | None = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shuts down the worker processes."""
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def parse(
+        self,
+        kind: str,
+        payloads: Iterable[bytes | str],
+        *,
+        fields: Iterable[str] | None = None,
+    ) -> Iterator[Any]:
+        """Parses ``payloads`` of a given ``kind`` and yields the resulting objects in
+        input order.
+
+        If parsing a payload fails, its exception is raised when its result would have
+        been yielded and the remaining payloads are cancelled. As with the clients,
+        pages declaring an unsupported API version raise
+        :class:`~pypiwrap.exceptions.UnsupportedVersionError` and those declaring a
+        newer minor version emit an
+        :class:`~pypiwrap.exceptions.UnexpectedVersionWarning`. The same applies if the
+        deadline set with :func:`~pypiwrap.deadlines.deadline` expires, in which case
+        :class:`~pypiwrap.exceptions.DeadlineExceeded` is raised.
+
+        Arguments:
+            kind (str):
+                The kind of payload, one of ``project``, ``stats``, ``index_page``,
+                ``project_page`` or ``provenance``.
+
+            payloads (Iterable[bytes | str]):
+                The raw JSON bodies of the responses.
+
+            fields (Iterable[str], optional):
+                For ``project`` payloads, the fields to parse. See
+                :meth:`.Project.from_json`. Other fields are discarded by the workers
+                rather than sent back.
+        """
+
+        if kind not in KINDS:
+            raise ValueError(f"Unknown payload kind {kind!r}. Expected one of {KINDS}.")
+
+        projection = frozenset(fields) if fields is not None else None
+
+        executor = self._get_executor()
+        limit = self.max_in_flight or 4 * (self.max_workers or os.cpu_count() or 1)
+
+        current = current_deadline()
+        pending: deque[Future[Any]] = deque()
+
+        def next_result() -> Any:
+            future = pending[0]
+            try:
+                packed, caught = future.result(current.remaining() if current else None)
+            except FuturesTimeoutError:
+                raise DeadlineExceeded(
+                    f"Deadline of {current.timeout} seconds exceeded."
+                ) from None
+
+            pending.popleft()
+            for message, category in caught:
+                warnings.warn(message, category, stacklevel=3)
+
+            return _unpack(packed) if type(packed) is tuple else packed
+
+        try:
+            for raw in payloads:
+                if len(pending) >= limit:
+                    yield next_result()
+                pending.append(executor.submit(_parse_payload, kind, raw, projection))
+
+            while pending:
+                yield next_result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def parse_payloads(
+    kind: str,
+    payloads: Iterable[bytes | str],
+    *,
+    fields: Iterable[str] | None = None,
+    max_workers: int | None = None,
+) -> list[Any]:
+    """Parses ``payloads`` of a given ``kind`` in a temporary pool of worker processes
+    and returns the resulting objects in input order. See :meth:`.BulkParser.parse`.
+    """
+
+    with BulkParser(max_workers) as parser:
+        return list(parser.parse(kind, payloads, fields=fields))
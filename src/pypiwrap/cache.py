@@ -0,0 +1,401 @@
+"""A response cache for clients that serves stale results while refreshing them.
+
+Clients accepting a ``cache`` argument (see :class:`~pypiwrap.client.PyPIClient` and
+:class:`~pypiwrap.client.SimpleRepoClient`) store the objects they return under keys
+of the form ``(kind, host, name, version, fields)``, where ``kind`` is either
+``"project"`` or ``"project_page"``, ``name`` is the normalized project name,
+``version`` is None unless a specific release was requested, and ``fields`` is None
+unless a field projection was requested (as a frozenset).
+
+.. versionadded:: 2.1.0
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, NamedTuple
+
+
+class CacheEntry(NamedTuple):
+    """A cached value alongside the information needed to refresh it."""
+
+    value: Any
+    """The cached value."""
+
+    created: float
+    """The monotonic time the value was loaded at."""
+
+    loader: Callable[[], Any]
+    """A callable that loads a fresh value."""
+
+
+class StaleWhileRevalidateCache:
+    """A thread-safe cache that serves stale values while refreshing them in the
+    background.
+
+    A value younger than ``soft_ttl`` is served as is. A value older than ``soft_ttl``
+    but younger than ``hard_ttl`` is served immediately while a background worker
+    refreshes it. A value older than ``hard_ttl`` is never served: the caller blocks
+    until a fresh value is loaded.
+
+    Concurrent requests for a key being loaded wait for the same load rather than
+    calling their loaders again.
+
+    Keys requested at least ``hot_threshold`` times within ``hot_window`` seconds are
+    considered hot. Hot values are refreshed ahead of time, once they reach
+    ``refresh_ahead`` times the soft TTL, so that they are rarely served stale. If
+    ``refresh_interval`` is given, hot values are also refreshed by a background
+    thread which runs while the cache is used as a context manager (or from
+    :meth:`.start` until :meth:`.close`).
+
+    Keys that are invalidated while a value is loaded for them are not stored again
+    once the load completes.
+
+    Arguments:
+        soft_ttl (float, optional):
+            The age in seconds after which a value is refreshed. Defaults to 300.
+
+        hard_ttl (float, optional):
+            The age in seconds after which a value is no longer served. Defaults to
+            3600.
+
+        max_workers (int, optional):
+            The maximum amount of concurrent background refreshes. Defaults to 4.
+
+        hot_threshold (int, optional):
+            The amount of requests within ``hot_window`` for a key to be considered
+            hot. Defaults to 5.
+
+        hot_window (float, optional):
+            The time window in seconds used to track hot keys. Defaults to 60.
+
+        refresh_ahead (float, optional):
+            The fraction of the soft TTL after which a hot value is refreshed.
+            Defaults to 0.8.
+
+        maxsize (int, optional):
+            The maximum amount of entries. The least recently loaded entries are
+            evicted first. If none specified, the cache is unbounded.
+
+        refresh_interval (float, optional):
+            The time in seconds between background refreshes of hot values (see
+            :meth:`.refresh_hot`). If none specified, hot values are only refreshed
+            when requested or when :meth:`.refresh_hot` is called.
+    """
+
+    def __init__(
+        self,
+        soft_ttl: float = 300.0,
+        hard_ttl: float = 3600.0,
+        *,
+        max_workers: int = 4,
+        hot_threshold: int = 5,
+        hot_window: float = 60.0,
+        refresh_ahead: float = 0.8,
+        maxsize: int | None = None,
+        refresh_interval: float | None = None,
+    ) -> None:
+        if hard_ttl < soft_ttl:
+            raise ValueError("The hard TTL must be greater than the soft TTL.")
+
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = hard_ttl
+        self.hot_threshold = hot_threshold
+        self.hot_window = hot_window
+        self.refresh_ahead = refresh_ahead
+        self.maxsize = maxsize
+        self.refresh_interval = refresh_interval
+
+        self.hits = 0
+        """The amount of requests served with a fresh value."""
+
+        self.stale_hits = 0
+        """The amount of requests served with a stale value."""
+
+        self.misses = 0
+        """The amount of requests that had to wait for a value to load."""
+
+        self.refreshes = 0
+        """The amount of background refreshes completed."""
+
+        self.failures = 0
+        """The amount of background refreshes that failed."""
+
+        self.last_error: BaseException | None = None
+        """The error raised by the most recent failed background refresh, if any."""
+
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        # the moments of the last hot_threshold requests of each cached key
+        self._requests: dict[Hashable, deque[float]] = {}
+        # the loads in progress, which are only stored if still current
+        self._pending: dict[Hashable, Future[Any]] = {}
+        self._lock = threading.Lock()
+
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __enter__(self):
+        if self.refresh_interval is not None:
+            self.start()
+        return self
+
+    def __exit__(self, *exc_args) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Starts refreshing hot values every :attr:`refresh_interval` seconds in a
+        background thread, until :meth:`.close` is called.
+
+        Raises:
+            ValueError: No refresh interval was given.
+        """
+
+        if self.refresh_interval is None:
+            raise ValueError("A refresh interval is required to refresh in background.")
+
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="pypiwrap-cache-refresh", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.refresh_interval):
+            self.refresh_hot()
+
+    def close(self) -> None:
+        """Stops the background thread and workers, waiting for pending refreshes."""
+
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        future: Future[Any],
+        background: bool = False,
+    ) -> None:
+        # loads the value for key into future, storing it if the load is still current
+        try:
+            value = loader()
+        except BaseException as exc:  # noqa: BLE001 - raised by future.result()
+            with self._lock:
+                if self._pending.get(key) is future:
+                    del self._pending[key]
+                if key not in self._entries:
+                    self._requests.pop(key, None)
+
+                if background:
+                    # the stale value is still served until the hard TTL is reached
+                    self.failures += 1
+                    self.last_error = exc
+
+            future.set_exception(exc)
+            return
+
+        with self._lock:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+                self._store(key, value, loader)
+                if background:
+                    self.refreshes += 1
+
+        future.set_result(value)
+
+    def _store(self, key: Hashable, value: Any, loader: Callable[[], Any]) -> None:
+        # must be called with the lock held
+        self._entries[key] = CacheEntry(value, time.monotonic(), loader)
+        self._entries.move_to_end(key)
+
+        if self.maxsize is not None:
+            while len(self._entries) > self.maxsize:
+                evicted, _ = self._entries.popitem(last=False)
+                self._requests.pop(evicted, None)
+
+    def _track(self, key: Hashable, now: float) -> bool:
+        # records a request for key and returns whether key is hot
+        requests = self._requests.get(key)
+        if requests is None:
+            # only the most recent requests are needed to tell whether key is hot
+            requests = self._requests[key] = deque(maxlen=max(self.hot_threshold, 1))
+
+        requests.append(now)
+
+        while requests and requests[0] < now - self.hot_window:
+            requests.popleft()
+
+        return len(requests) >= self.hot_threshold
+
+    def _schedule(self, key: Hashable, loader: Callable[[], Any]) -> None:
+        # must be called with the lock held
+        if key in self._pending:
+            return
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="pypiwrap-cache"
+            )
+
+        future = self._pending[key] = Future()
+        future.set_running_or_notify_cancel()
+        self._executor.submit(self._load, key, loader, future, background=True)
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Gets the value for ``key``, loading it with ``loader`` if needed.
+
+        Arguments:
+            key (Hashable):
+                The cache key.
+
+            loader (Callable[[], Any]):
+                A callable returning a fresh value for ``key``. It is also stored to
+                refresh the value in the background.
+        """
+
+        now = time.monotonic()
+
+        with self._lock:
+            hot = self._track(key, now)
+            entry = self._entries.get(key)
+
+            if entry is not None and now - entry.created < self.hard_ttl:
+                age = now - entry.created
+
+                if age >= self.soft_ttl:
+                    self.stale_hits += 1
+                    self._schedule(key, loader)
+                else:
+                    self.hits += 1
+                    if hot and age >= self.soft_ttl * self.refresh_ahead:
+                        self._schedule(key, loader)
+
+                return entry.value
+
+            self.misses += 1
+
+            future = self._pending.get(key)
+            if future is None:
+                future = self._pending[key] = Future()
+                future.set_running_or_notify_cancel()
+                loading = True
+            else:
+                # wait for the value already being loaded
+                loading = False
+
+        if loading:
+            self._load(key, loader, future)
+
+        return future.result()
+
+    def refresh(self, key: Hashable) -> bool:
+        """Schedules a background refresh of ``key``. Returns False if ``key`` is not
+        cached."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False
+
+            self._schedule(key, entry.loader)
+            return True
+
+    def refresh_hot(self) -> list[Hashable]:
+        """Schedules a background refresh of every hot key close to its soft TTL and
+        returns the keys scheduled.
+
+        This may be called periodically so that hot values are refreshed even if they
+        are not requested again before they become stale.
+        """
+
+        now = time.monotonic()
+        scheduled = []
+
+        with self._lock:
+            for key in self.hot_keys():
+                entry = self._entries.get(key)
+                if entry is not None and (
+                    now - entry.created >= self.soft_ttl * self.refresh_ahead
+                ):
+                    self._schedule(key, entry.loader)
+                    scheduled.append(key)
+
+        return scheduled
+
+    def hot_keys(self) -> list[Hashable]:
+        """Returns the keys currently considered hot."""
+
+        threshold = time.monotonic() - self.hot_window
+        return [
+            key
+            for key, requests in list(self._requests.items())
+            if sum(1 for moment in requests if moment >= threshold)
+            >= self.hot_threshold
+        ]
+
+    def keys(self) -> list[Hashable]:
+        """Returns the keys currently cached."""
+        return list(self._entries)
+
+    def _remove(self, key: Hashable) -> bool:
+        # must be called with the lock held; a load in progress is no longer stored
+        self._requests.pop(key, None)
+        self._pending.pop(key, None)
+        return self._entries.pop(key, None) is not None
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Removes ``key`` from the cache. Returns whether the key was cached.
+
+        A value being loaded or refreshed for ``key`` is not stored once loaded.
+        """
+
+        with self._lock:
+            return self._remove(key)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> list[Hashable]:
+        """Removes every key for which ``predicate`` returns True and returns the
+        keys that were cached.
+
+        Values being loaded or refreshed for these keys are not stored once loaded.
+        """
+
+        with self._lock:
+            loading = [key for key in self._pending if key not in self._entries]
+            removed = [key for key in self._entries if predicate(key)]
+
+            for key in removed:
+                self._remove(key)
+            for key in filter(predicate, loading):
+                self._remove(key)
+
+        return removed
+
+    def clear(self) -> None:
+        """Removes every entry from the cache."""
+
+        with self._lock:
+            self._entries.clear()
+            self._requests.clear()
+            self._pending.clear()
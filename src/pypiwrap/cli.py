@@ -0,0 +1,320 @@
+"""The ``pypiwrap`` command line interface.
+
+Project names (or ``name==version`` pins) are read from the arguments, a file, or
+standard input, one per line, and fetched concurrently. Each result is written to
+standard output as a line of JSON as soon as it is available, and a summary of the
+throughput and latency is written to standard error at the end. For example::
+
+    $ cat requirements.txt | pypiwrap project --fields name,version,license
+    {"input": "requests==2.32.3", "ok": true, "elapsed": 0.101, "result": {...}}
+    ...
+
+.. versionadded:: 2.1.0
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import os
+import re
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import ExitStack
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, TextIO
+
+from .consts import PYPI_HOST, __version__
+from .utils import Size
+
+# a project name, optionally with extras and an exact version, as in a requirements
+# file. Anything else (such as markers or other specifiers) is ignored.
+INPUT_PATTERN = re.compile(
+    r"^\s*(?P<name>[^\s\[\]=<>!~;,]+)\s*(?:\[[^\]]*\])?"
+    r"\s*(?:===?\s*(?P<version>[^\s;,]+))?"
+)
+
+
+def jsonable(value: Any) -> Any:
+    """Converts a model object (and any value within it) into JSON-compatible values.
+
+    Sizes are converted into their amount of bytes and datetimes into ISO 8601 strings.
+    """
+
+    if isinstance(value, Size):
+        return value.bytes
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            field.name: jsonable(getattr(value, field.name))
+            for field in dataclasses.fields(value)
+        }
+    elif isinstance(value, datetime):
+        return value.isoformat()
+    elif isinstance(value, Enum):
+        return value.value
+    elif isinstance(value, dict):
+        return {key: jsonable(item) for key, item in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return [jsonable(item) for item in value]
+
+    return value
+
+
+def _read_inputs(lines: Iterable[str]) -> Iterator[str]:
+    """Yields the non-empty lines of ``lines``, ignoring comments."""
+
+    for line in lines:
+        line = line.split("#", 1)[0].strip()
+        if line:
+            yield line
+
+
+def _parse_input(item: str) -> tuple[str, str | None]:
+    """Returns the project name and pinned version (if any) of an input such as
+    ``requests[socks]==2.32.3``."""
+
+    match = INPUT_PATTERN.match(item)
+    if match is None:
+        return item.strip(), None
+
+    return match["name"], match["version"]
+
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+class _Result:
+    __slots__ = ("elapsed", "item", "ok", "value")
+
+    def __init__(self, item: str, ok: bool, elapsed: float, value: Any) -> None:
+        self.item = item
+        self.ok = ok
+        self.elapsed = elapsed
+        self.value = value
+
+    def to_json(self) -> str:
+        data: dict[str, Any] = {
+            "input": self.item,
+            "ok": self.ok,
+            "elapsed": round(self.elapsed, 6),
+        }
+        if self.ok:
+            data["result"] = jsonable(self.value)
+        else:
+            data["error"] = self.value
+
+        return json.dumps(data, ensure_ascii=False)
+
+
+def _timed(fetch: Callable[[str], Any], item: str) -> _Result:
+    start = time.perf_counter()
+    try:
+        value = fetch(item)
+    except Exception as exc:  # noqa: BLE001 - errors are reported per input
+        return _Result(
+            item, False, time.perf_counter() - start, f"{type(exc).__name__}: {exc}"
+        )
+
+    return _Result(item, True, time.perf_counter() - start, value)
+
+
+def _run(
+    fetch: Callable[[str], Any],
+    items: Iterable[str],
+    output: TextIO,
+    *,
+    concurrency: int = 16,
+) -> list[_Result]:
+    """Calls ``fetch`` on each of ``items`` concurrently, writing each result to
+    ``output`` as a line of JSON in order of completion.
+
+    At most twice ``concurrency`` items are read ahead of the results written, so that
+    memory stays bounded regardless of the amount of items. Returns the results with
+    their values discarded, for reporting.
+    """
+
+    finished: list[_Result] = []
+    pending: set[Future[_Result]] = set()
+    limit = 2 * concurrency
+
+    def drain() -> None:
+        nonlocal pending
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            result = future.result()
+            # flushed per line, so that readers of a pipe see results as they arrive
+            output.write(result.to_json() + "\n")
+            output.flush()
+            result.value = None
+            finished.append(result)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        try:
+            for item in items:
+                if len(pending) >= limit:
+                    drain()
+                pending.add(executor.submit(_timed, fetch, item))
+
+            while pending:
+                drain()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    return finished
+
+
+def _summarize(results: list[_Result], elapsed: float) -> str:
+    """Returns a summary of the throughput and latency of ``results``."""
+
+    latencies = sorted(result.elapsed for result in results)
+    errors = sum(1 for result in results if not result.ok)
+    throughput = len(results) / elapsed if elapsed > 0 else 0.0
+
+    return (
+        f"{len(results)} fetched ({errors} failed) in {elapsed:.2f}s, "
+        f"{throughput:.1f}/s; latency "
+        f"p50={_percentile(latencies, 50) * 1000:.0f}ms "
+        f"p95={_percentile(latencies, 95) * 1000:.0f}ms "
+        f"p99={_percentile(latencies, 99) * 1000:.0f}ms "
+        f"max={(latencies[-1] if latencies else 0.0) * 1000:.0f}ms"
+    )
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="pypiwrap",
+        description="Fetch PyPI projects concurrently and write them as JSON lines.",
+    )
+    parser.add_argument("--version", action="version", version=__version__)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "names",
+        nargs="*",
+        help="project names or name==version pins (read from --input if none)",
+    )
+    common.add_argument(
+        "-i",
+        "--input",
+        default="-",
+        help="a file with one name or pin per line ('-' for stdin, the default)",
+    )
+    common.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=16,
+        help="the maximum amount of concurrent requests (default: 16)",
+    )
+    common.add_argument(
+        "--host", default=PYPI_HOST, help=f"the base URL of the host ({PYPI_HOST})"
+    )
+    common.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="the timeout of each request in seconds",
+    )
+    common.add_argument(
+        "-q", "--quiet", action="store_true", help="do not print a summary"
+    )
+
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    project = commands.add_parser(
+        "project", parents=[common], help="fetch projects from the PyPI JSON API"
+    )
+    project.add_argument(
+        "--fields",
+        help="comma separated project fields to include (default: all)",
+    )
+
+    commands.add_parser(
+        "page",
+        parents=[common],
+        help="fetch project pages from the Simple Repository API",
+    )
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Runs the command line interface and returns its exit code: 0 if every input
+    was fetched, 1 if any failed."""
+
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    from .client import PyPIClient, SimpleRepoClient
+    from .consts import DEFAULT_TIMEOUT
+    from .objects.pypi import Project
+    from .transport import RequestsTransport
+
+    fields = None
+    if getattr(args, "fields", None):
+        fields = [name.strip() for name in args.fields.split(",")]
+        unknown = set(fields).difference(
+            field.name
+            for field in dataclasses.fields(Project)
+            if field.name != "projection"
+        )
+        if unknown:
+            parser.error(f"unknown project fields: {', '.join(sorted(unknown))}")
+
+    transport = RequestsTransport(pool_maxsize=args.concurrency, max_retries=1)
+    timeout = args.timeout if args.timeout is not None else DEFAULT_TIMEOUT
+
+    fetch: Callable[[str], Any]
+    if args.command == "project":
+        client: PyPIClient | SimpleRepoClient = PyPIClient(
+            args.host, transport, timeout=timeout
+        )
+
+        def fetch(item: str) -> Any:
+            name, version = _parse_input(item)
+            project = client.get_project(name, version, fields)
+            if fields is None:
+                return project
+
+            # only the requested fields are written
+            return {name: getattr(project, name) for name in fields}
+
+    else:
+        client = SimpleRepoClient(args.host, transport, timeout=timeout)
+
+        def fetch(item: str) -> Any:
+            return client.get_project_page(_parse_input(item)[0])
+
+    start = time.perf_counter()
+    try:
+        with ExitStack() as stack:
+            lines: Iterable[str]
+            if args.names:
+                lines = args.names
+            elif args.input == "-":
+                lines = sys.stdin
+            else:
+                lines = stack.enter_context(open(args.input, encoding="utf-8"))
+
+            stack.enter_context(client)
+            results = _run(
+                fetch, _read_inputs(lines), sys.stdout, concurrency=args.concurrency
+            )
+    except BrokenPipeError:
+        # the reader went away (for example, `pypiwrap ... | head`)
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+
+    if not args.quiet:
+        print(_summarize(results, time.perf_counter() - start), file=sys.stderr)
+
+    return 0 if all(result.ok for result in results) else 1
@@ -1,21 +1,185 @@
 from __future__ import annotations
 
-import warnings
-from xml.etree import ElementTree
-
-import requests
-
-from .consts import PYPI_HOST, SIMPLE_CONTENT_TYPE, SUPPORTED_SIMPLE_VERSION, USER_AGENT
+import json
+import threading
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Callable, TypeVar, Union
+
+from .consts import (
+    DEFAULT_TIMEOUT,
+    INTEGRITY_CONTENT_TYPE,
+    PYPI_HOST,
+    SIMPLE_ACCEPT,
+    USER_AGENT,
+)
+from .deadlines import bind_deadline, current_deadline, gather
 from .exceptions import (
+    ClientError,
+    DeadlineExceeded,
     ParseError,
-    UnexpectedVersionWarning,
-    UnsupportedVersionError,
     raise_for_status,
+    verify_api_version,
 )
-from .objects import IndexPage, Project, ProjectPage, PyPIFeed, Stats
+from .hosts import HostPool
+from .transport import RequestsTransport, Response, Transport
+from .utils import normalize_name
+
+# Models and parsers are imported when first needed so that importing a client
+# remains cheap for short-lived processes.
+if TYPE_CHECKING:
+    from .audit import AuditReport
+    from .cache import StaleWhileRevalidateCache
+    from .objects import (
+        DistributionFile,
+        IndexPage,
+        Project,
+        ProjectPage,
+        Provenance,
+        PyPIFeed,
+        Stats,
+    )
+
+Timeout = Union[float, tuple[float, float], None]
+PageT = TypeVar("PageT", "IndexPage", "ProjectPage")
+
+# the size of the chunks streamed responses are read in
+PAGE_CHUNK_SIZE = 64 * 1024
+
+
+def _check_deadline(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    # Read timeouts only bound each read from the socket, so a body received slowly
+    # could outlast the deadline. It is checked as every chunk arrives instead.
+    current = current_deadline()
+    for chunk in chunks:
+        if current is not None:
+            current.check()
+        yield chunk
+
+
+def _read_content(response: Response) -> bytes:
+    # Streamed responses are read in chunks under a deadline, so that it is checked
+    # while the body arrives rather than only before the request.
+    iter_content = getattr(response, "iter_content", None)
+    if iter_content is None or current_deadline() is None:
+        return response.content
+
+    return b"".join(_check_deadline(iter_content(PAGE_CHUNK_SIZE)))
+
+
+def _read_json(response: Response) -> Any:
+    iter_content = getattr(response, "iter_content", None)
+    if iter_content is None or current_deadline() is None:
+        return response.json()
+
+    return json.loads(b"".join(_check_deadline(iter_content(PAGE_CHUNK_SIZE))))
+
+
+def _close_response(response: Response) -> None:
+    close = getattr(response, "close", None)
+    if close is not None:
+        close()
+
+
+def _close_future(future: Future[Response]) -> None:
+    if not future.cancelled() and future.exception() is None:
+        _close_response(future.result())
+
 
+class _BaseClient:
+    """Base class for clients holding the host, the transport and instrumentation."""
+
+    def __init__(
+        self, host: str, transport: Transport | None, timeout: Timeout = DEFAULT_TIMEOUT
+    ) -> None:
+        self.host = host
+
+        self.transport = transport if transport is not None else RequestsTransport()
+        """The transport performing the requests of this client.
+
+        .. versionadded:: 2.1.0
+        """
+        self.transport.headers["User-Agent"] = USER_AGENT
+
+        self.rest = (
+            self.transport.session
+            if isinstance(self.transport, RequestsTransport)
+            else None
+        )
+        """The :class:`requests.Session` of the transport if it is a
+        :class:`~.transport.RequestsTransport` (the default), otherwise None."""
+
+        self.timeout = timeout
+        """The default timeout of requests made through this client, in seconds,
+        either as a single value or as a (connect, read) tuple.
+
+        .. versionadded:: 2.1.0
+        """
+
+        self.redirects = 0
+        """The amount of redirects followed by requests made through this client.
+
+        Project names are normalized before requests are made, so a growing value
+        usually indicates a misconfigured host.
+
+        .. versionadded:: 2.1.0
+        """
+
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
 
-class PyPIFeedClient:
+    def __exit__(self, *exc_args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the transport of this client.
+
+        .. versionadded:: 2.1.0
+        """
+        self.transport.close()
+
+    def _get_timeout(self) -> Timeout:
+        # the timeouts are capped by the time remaining until the deadline, if any
+        current = current_deadline()
+        if current is None:
+            return self.timeout
+
+        current.check()
+        remaining = current.remaining()
+
+        if self.timeout is None:
+            return remaining
+        elif isinstance(self.timeout, tuple):
+            connect, read = self.timeout
+            return (min(connect, remaining), min(read, remaining))
+
+        return min(self.timeout, remaining)
+
+    def _request(self, url: str, **kwargs) -> Response:
+        try:
+            response = self.transport.get(url, timeout=self._get_timeout(), **kwargs)
+        except DeadlineExceeded:
+            raise
+        except Exception as exc:
+            current = current_deadline()
+            if current is not None and current.expired:
+                raise DeadlineExceeded(
+                    f"Deadline of {current.timeout} seconds exceeded."
+                ) from exc
+            raise
+
+        history = getattr(response, "history", None)
+        if history:
+            with self._lock:
+                self.redirects += len(history)
+
+        return response
+
+
+class PyPIFeedClient(_BaseClient):
     """Client for the PyPI RSS feeds.
 
     .. versionadded:: 2.0.0
@@ -24,24 +188,47 @@ class PyPIFeedClient:
     Arguments:
         host (str, optional):
             The base URL of the PyPI feeds host. Defaults to https://pypi.org.
-    """
 
-    def __init__(self, host=PYPI_HOST) -> None:
-        self.host = host
-        self.rest = requests.Session()
-        self.rest.headers["User-Agent"] = USER_AGENT
+        transport (Transport, optional):
+            The transport used to perform requests. If none specified, a
+            :class:`~.transport.RequestsTransport` with default settings is used.
 
-    def __enter__(self):
-        return self
+            .. versionadded:: 2.1.0
 
-    def __exit__(self, *exc_args) -> None:
-        self.rest.close()
+        timeout (float | tuple[float, float] | None, optional):
+            The timeout of each request in seconds, either as a single value or as a
+            (connect, read) tuple. Defaults to 10 seconds to connect and 60 seconds to
+            read. Requests made within a :func:`~.deadlines.deadline` block are also
+            limited by the time remaining.
+
+            .. versionadded:: 2.1.0
+    """
+
+    def __init__(
+        self,
+        host=PYPI_HOST,
+        transport: Transport | None = None,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+    ) -> None:
+        super().__init__(host, transport, timeout)
 
     def _get_feed(self, url: str) -> PyPIFeed:
-        response = self.rest.get(url)
-        raise_for_status(response)
+        response = self._request(url, stream=True)
+        try:
+            raise_for_status(response)
+            content = _read_content(response)
+        finally:
+            _close_response(response)
+
+        from xml.etree import ElementTree
+
+        from .objects.rss import PyPIFeed
 
-        rss = ElementTree.fromstring(response.text)
+        try:
+            # the encoding is taken from the XML declaration, if any
+            rss = ElementTree.fromstring(content)
+        except ElementTree.ParseError as exc:
+            raise ParseError("Could not parse RSS feed.") from exc
 
         channel = rss.find("channel")
 
@@ -60,10 +247,12 @@ class PyPIFeedClient:
 
     def get_latest_releases_for_project(self, name: str) -> PyPIFeed:
         """Gets the latest releases for a project ``name``."""
-        return self._get_feed(f"{self.host}/rss/project/{name}/releases.xml")
+        return self._get_feed(
+            f"{self.host}/rss/project/{normalize_name(name)}/releases.xml"
+        )
 
 
-class PyPIClient:
+class PyPIClient(_BaseClient):
     """Client for the PyPI JSON and Stats API.
 
     .. warning:: This client is only designed for hosts under the pypi.org domain.
@@ -71,20 +260,45 @@ class PyPIClient:
     Arguments:
         host (str, optional):
             The base URL of the PyPI API host. Defaults to https://pypi.org.
-    """
 
-    def __init__(self, host=PYPI_HOST) -> None:
-        self.host = host
-        self.rest = requests.Session()
-        self.rest.headers["User-Agent"] = USER_AGENT
+        transport (Transport, optional):
+            The transport used to perform requests. If none specified, a
+            :class:`~.transport.RequestsTransport` with default settings is used.
 
-    def __enter__(self):
-        return self
+            .. versionadded:: 2.1.0
 
-    def __exit__(self, *exc_args) -> None:
-        self.rest.close()
+        cache (StaleWhileRevalidateCache, optional):
+            A cache for the objects returned by this client. If specified, cached
+            objects may be returned while they are refreshed in the background. See
+            :class:`~.cache.StaleWhileRevalidateCache` for details.
+
+            .. versionadded:: 2.1.0
 
-    def get_project(self, name: str, version: str | None = None) -> Project:
+        timeout (float | tuple[float, float] | None, optional):
+            The timeout of each request in seconds, either as a single value or as a
+            (connect, read) tuple. Defaults to 10 seconds to connect and 60 seconds to
+            read. Requests made within a :func:`~.deadlines.deadline` block are also
+            limited by the time remaining.
+
+            .. versionadded:: 2.1.0
+    """
+
+    def __init__(
+        self,
+        host=PYPI_HOST,
+        transport: Transport | None = None,
+        cache: StaleWhileRevalidateCache | None = None,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+    ) -> None:
+        super().__init__(host, transport, timeout)
+        self.cache = cache
+
+    def get_project(
+        self,
+        name: str,
+        version: str | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> Project:
         """Gets information about a project or any of its releases.
 
         Arguments:
@@ -94,31 +308,90 @@ class PyPIClient:
             version (str):
                 A version of the project to fetch. If none specified,
                 the latest will be fetched.
+
+            fields (Iterable[str], optional):
+                If specified, only these fields of the project are parsed and every
+                other field is set to None. See :meth:`.Project.from_json`.
+
+                .. versionadded:: 2.1.0
         """
 
+        projection = frozenset(fields) if fields is not None else None
+
+        if self.cache is None:
+            return self._fetch_project(name, version, projection)
+
+        return self.cache.get(
+            ("project", self.host, normalize_name(name), version, projection),
+            lambda: self._fetch_project(name, version, projection),
+        )
+
+    def _fetch_project(
+        self, name: str, version: str | None, fields: frozenset[str] | None
+    ) -> Project:
+        project = normalize_name(name)
+
         if version:
-            response = self.rest.get(f"{self.host}/pypi/{name}/{version}/json")
+            url = f"{self.host}/pypi/{project}/{version}/json"
         else:
-            response = self.rest.get(f"{self.host}/pypi/{name}/json")
+            url = f"{self.host}/pypi/{project}/json"
 
-        raise_for_status(
-            response, {404: f"Could not find project or release for '{name}'"}
-        )
+        response = self._request(url, stream=True)
+        try:
+            raise_for_status(
+                response, {404: f"Could not find project or release for '{name}'"}
+            )
+            data = _read_json(response)
+        finally:
+            _close_response(response)
+
+        from .objects.pypi import Project
+
+        return Project.from_json(data, fields)
+
+    def audit(
+        self, requirements: Iterable[str | tuple[str, str]], max_workers: int = 10
+    ) -> AuditReport:
+        """Audits a set of pinned requirements for known vulnerabilities.
 
-        return Project.from_json(response.json())
+        Each unique pin is fetched concurrently through :meth:`.get_project` and its
+        vulnerabilities are matched. See :func:`pypiwrap.audit.parse_pins` for the
+        formats accepted.
+
+        .. versionadded:: 2.1.0
+        .. note:: This method requires the ``packaging`` library.
+
+        Arguments:
+            requirements (Iterable[str | tuple[str, str]]):
+                The pinned requirements, such as the lines of a requirements file
+                (``name==version``) or name and version pairs from a lock file.
+
+            max_workers (int, optional):
+                The maximum amount of concurrent requests. Defaults to 10.
+        """
+
+        from .audit import audit
+
+        return audit(self, requirements, max_workers)
 
     def get_stats(self) -> Stats:
         """Gets statistics about PyPI."""
 
-        response = self.rest.get(
-            f"{self.host}/stats", headers={"Accept": "application/json"}
+        response = self._request(
+            f"{self.host}/stats", headers={"Accept": "application/json"}, stream=True
         )
-        raise_for_status(response)
+        try:
+            raise_for_status(response)
+            data = _read_json(response)
+        finally:
+            _close_response(response)
+
+        from .objects.pypi import Stats
 
-        return Stats.from_json(response.json())
+        return Stats.from_json(data)
 
 
-class SimpleRepoClient:
+class SimpleRepoClient(_BaseClient):
     """Client for the PyPI Simple Repository API (version 1).
 
     The methods included will emit a :class:`~.exceptions.UnexpectedVersionWarning`
@@ -130,60 +403,381 @@ class SimpleRepoClient:
     Arguments:
         host (str, optional):
             The base URL of the Simple Repository API host. Defaults to https://pypi.org.
-    """
 
-    def __init__(self, host: str = PYPI_HOST) -> None:
-        self.host = host
-        self.rest = requests.Session()
-        self.rest.headers["Accept"] = SIMPLE_CONTENT_TYPE
-        self.rest.headers["User-Agent"] = USER_AGENT
+        transport (Transport, optional):
+            The transport used to perform requests. If none specified, a
+            :class:`~.transport.RequestsTransport` with default settings is used.
 
-    def __enter__(self):
-        return self
+            .. versionadded:: 2.1.0
 
-    def __exit__(self, *exc_args) -> None:
-        self.rest.close()
+        cache (StaleWhileRevalidateCache, optional):
+            A cache for the objects returned by this client. If specified, cached
+            objects may be returned while they are refreshed in the background. See
+            :class:`~.cache.StaleWhileRevalidateCache` for details.
 
-    def _verify_api_version(self, version: str) -> None:
-        declared_major, declared_minor = [int(comp) for comp in version.split(".")]
-        expected_major, expected_minor = SUPPORTED_SIMPLE_VERSION
+            .. versionadded:: 2.1.0
 
-        if declared_major > expected_major:
-            raise UnsupportedVersionError(
-                f"API response returned version {declared_major}.{declared_minor}, "
-                f"expected major version {expected_major} or lower."
-            )
-        elif declared_major == expected_major and declared_minor > expected_minor:
-            warnings.warn(
-                f"API response returned version {declared_major}.{declared_minor}, "
-                f"this version is not strictly supported (latest supported: "
-                f"{expected_major}.{expected_minor}).",
-                UnexpectedVersionWarning,
+        timeout (float | tuple[float, float] | None, optional):
+            The timeout of each request in seconds, either as a single value or as a
+            (connect, read) tuple. Defaults to 10 seconds to connect and 60 seconds to
+            read. Requests made within a :func:`~.deadlines.deadline` block are also
+            limited by the time remaining.
+
+            .. versionadded:: 2.1.0
+    """
+
+    def __init__(
+        self,
+        host: str = PYPI_HOST,
+        transport: Transport | None = None,
+        cache: StaleWhileRevalidateCache | None = None,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+    ) -> None:
+        super().__init__(host, transport, timeout)
+        self.transport.headers["Accept"] = SIMPLE_ACCEPT
+        self.cache = cache
+
+        self._provenances: dict[str, Provenance] = {}
+
+    def _verify_api_version(self, version: str) -> None:
+        verify_api_version(version)
+
+    def _get(self, path: str, **kwargs) -> Response:
+        return self._request(f"{self.host}{path}", **kwargs)
+
+    def _get_page(
+        self,
+        path: str,
+        from_json: Callable[[dict[str, Any]], PageT],
+        from_html: Callable[[Iterable[bytes], str, str | None], PageT],
+    ) -> PageT:
+        # Pages are requested in either form (see SIMPLE_ACCEPT). JSON responses
+        # are read whole, while HTML responses are parsed as their chunks arrive.
+        from .simple_html import charset_from_content_type, is_html_content_type
+
+        response = self._get(path, stream=True)
+
+        try:
+            raise_for_status(response)
+
+            iter_content = getattr(response, "iter_content", None)
+
+            # responses without a Content-Type are assumed to be JSON
+            content_type = getattr(response, "headers", {}).get("Content-Type")
+            if not is_html_content_type(content_type):
+                data = _read_json(response)
+                self._verify_api_version(data["meta"]["api-version"])
+                return from_json(data)
+
+            chunks = (
+                _check_deadline(iter_content(PAGE_CHUNK_SIZE))
+                if iter_content is not None
+                else [response.content]
             )
+            url = getattr(response, "url", None) or f"{self.host}{path}"
+
+            page = from_html(chunks, url, charset_from_content_type(content_type))
+            self._verify_api_version(page.meta.api_version)
+            return page
+        finally:
+            _close_response(response)
 
     def get_index_page(self) -> IndexPage:
         """Gets the index page for this repository.
 
+        Hosts serving only the HTML form of the API (PEP 503) are also supported.
+        See :mod:`~pypiwrap.simple_html` for details.
+
         .. warning::
             If you're using the PyPI host, the response returned by PyPI could
             take several seconds to parse. Please use this method sparingly.
         """
 
-        response = self.rest.get(f"{self.host}/simple")
-        raise_for_status(response)
-
-        page = response.json()
+        from .objects.simple_repo import IndexPage
+        from .simple_html import parse_index_page
 
-        self._verify_api_version(page["meta"]["api-version"])
-        return IndexPage.from_json(page)
+        return self._get_page("/simple/", IndexPage.from_json, parse_index_page)
 
     def get_project_page(self, project: str) -> ProjectPage:
-        """Gets the project page for a given ``project``."""
+        """Gets the project page for a given ``project``.
+
+        Hosts serving only the HTML form of the API (PEP 503) are also supported.
+        See :mod:`~pypiwrap.simple_html` for details.
+        """
+
+        name = normalize_name(project)
+
+        if self.cache is None:
+            return self._fetch_project_page(name)
 
-        response = self.rest.get(f"{self.host}/simple/{project}")
-        raise_for_status(response)
+        return self.cache.get(
+            ("project_page", self.host, name, None, None),
+            lambda: self._fetch_project_page(name),
+        )
+
+    def _fetch_project_page(self, name: str) -> ProjectPage:
+        from .objects.simple_repo import ProjectPage
+        from .simple_html import parse_project_page
+
+        return self._get_page(
+            f"/simple/{name}/",
+            ProjectPage.from_json,
+            lambda chunks, url, encoding: parse_project_page(
+                chunks, name, url, encoding
+            ),
+        )
+
+    @staticmethod
+    def _file_digest(pkg_file: DistributionFile) -> str | None:
+        for name in ("sha256", *sorted(pkg_file.hashes)):
+            if name in pkg_file.hashes:
+                return f"{name}:{pkg_file.hashes[name]}"
 
-        page = response.json()
+        return None
 
-        self._verify_api_version(page["meta"]["api-version"])
-        return ProjectPage.from_json(page)
+    def get_provenance(self, pkg_file: DistributionFile) -> Provenance | None:
+        """Gets the provenance of a distribution file from the Integrity API.
+
+        Provenance objects are cached by the file's digest as they never change for
+        a given file. Returns None if the file has no associated provenance.
+
+        .. versionadded:: 2.1.0
+
+        Arguments:
+            pkg_file (DistributionFile):
+                The distribution file (see :attr:`.ProjectPage.files`).
+        """
+
+        if pkg_file.provenance_url is None:
+            return None
+
+        digest = self._file_digest(pkg_file)
+        if digest is not None and digest in self._provenances:
+            return self._provenances[digest]
+
+        response = self._request(
+            pkg_file.provenance_url,
+            headers={"Accept": INTEGRITY_CONTENT_TYPE},
+            stream=True,
+        )
+        try:
+            raise_for_status(
+                response, {404: f"Could not find provenance for '{pkg_file.filename}'"}
+            )
+            data = _read_json(response)
+        finally:
+            _close_response(response)
+
+        from .objects.integrity import Provenance
+
+        provenance = Provenance.from_json(data)
+        if digest is not None:
+            self._provenances[digest] = provenance
+
+        return provenance
+
+    def get_provenances(
+        self,
+        files: Iterable[DistributionFile],
+        max_workers: int = 8,
+        *,
+        errors: dict[str, Exception] | None = None,
+    ) -> dict[str, Provenance | None]:
+        """Gets the provenance of many distribution files concurrently.
+
+        Files sharing a digest are only fetched once and cached provenance objects do
+        not require any requests. See :meth:`.get_provenance` for details.
+
+        A file whose provenance could not be fetched (an error response, a connection
+        error, a timeout or an invalid body) does not abort the others. It is left
+        out of the mapping returned and its error is stored in ``errors``. Only an
+        expired :func:`~.deadlines.deadline` is raised.
+
+        .. versionadded:: 2.1.0
+
+        Arguments:
+            files (Iterable[DistributionFile]):
+                The distribution files.
+
+            max_workers (int, optional):
+                The maximum amount of concurrent requests. Defaults to 8.
+
+            errors (dict[str, Exception], optional):
+                A mapping in which the errors of the files that failed are stored by
+                filename.
+
+        Returns:
+            A mapping of filenames to their provenance or None if unavailable.
+        """
+
+        files = list(files)
+        pending: dict[str, DistributionFile] = {}
+
+        for pkg_file in files:
+            digest = self._file_digest(pkg_file) or pkg_file.filename
+            if pkg_file.provenance_url and digest not in self._provenances:
+                pending.setdefault(digest, pkg_file)
+
+        recorded = (ClientError, TimeoutError, ValueError, *self.transport.errors)
+
+        def fetch(pkg_file: DistributionFile) -> Provenance | None | Exception:
+            try:
+                return self.get_provenance(pkg_file)
+            except DeadlineExceeded:
+                raise
+            except recorded as exc:
+                return exc
+
+        fetched: dict[str, Provenance | None | Exception] = {}
+        if pending:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = gather(executor, fetch, pending.values())
+                fetched = dict(zip(pending, results))
+
+        provenances = {}
+        for pkg_file in files:
+            digest = self._file_digest(pkg_file) or pkg_file.filename
+            result = (
+                fetched[digest] if digest in fetched else self.get_provenance(pkg_file)
+            )
+
+            if isinstance(result, Exception):
+                if errors is not None:
+                    errors[pkg_file.filename] = result
+            else:
+                provenances[pkg_file.filename] = result
+
+        return provenances
+
+
+class MultiHostSimpleRepoClient(SimpleRepoClient):
+    """Client for several equivalent Simple Repository API hosts (such as mirrors).
+
+    Requests are sent to the fastest healthy host according to a running latency
+    estimate. If a response takes longer than a percentile of the host's recent
+    latencies, a hedged request is sent to the next host and whichever answers first
+    is used. Hosts that fail repeatedly are taken out of rotation for a while. See
+    :class:`~.hosts.HostPool` for details.
+
+    .. versionadded:: 2.1.0
+
+    Arguments:
+        hosts (Sequence[str]):
+            The base URLs of the hosts, in order of preference.
+
+        transport (Transport, optional):
+            The transport used to perform requests. It must be safe to use from
+            multiple threads.
+
+        cache (StaleWhileRevalidateCache, optional):
+            A cache for the objects returned by this client.
+
+        timeout (float | tuple[float, float] | None, optional):
+            The timeout of each request in seconds. See :class:`SimpleRepoClient`.
+
+        **pool_options:
+            Additional arguments passed to :class:`~.hosts.HostPool`.
+    """
+
+    def __init__(
+        self,
+        hosts: Sequence[str],
+        transport: Transport | None = None,
+        cache: StaleWhileRevalidateCache | None = None,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        **pool_options,
+    ) -> None:
+        super().__init__(hosts[0], transport, cache, timeout)
+
+        self.pool = HostPool(hosts, **pool_options)
+
+    def _start(self, host: str, path: str, **kwargs) -> Future[Response]:
+        # Each attempt gets its own thread, started right away. With a shared pool,
+        # attempts from concurrent callers would wait in its queue, and the hedge
+        # delay would measure the queueing rather than the latency of the host.
+        future: Future[Response] = Future()
+        timed_get = bind_deadline(self._timed_get)
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+
+            try:
+                future.set_result(timed_get(host, path, **kwargs))
+            except BaseException as exc:  # noqa: BLE001 - raised by the caller
+                future.set_exception(exc)
+
+        threading.Thread(target=run, name="pypiwrap-multihost", daemon=True).start()
+        return future
+
+    def _timed_get(self, host: str, path: str, **kwargs) -> Response:
+        start = time.monotonic()
+
+        try:
+            response = self._request(f"{host}{path}", **kwargs)
+        except Exception:
+            self.pool.record_failure(host)
+            raise
+
+        if response.status_code >= 500:
+            self.pool.record_failure(host)
+        else:
+            self.pool.record_success(host, time.monotonic() - start)
+
+        return response
+
+    def _get(self, path: str, **kwargs) -> Response:
+        remaining = self.pool.ranked()
+        pending: set[Future[Response]] = set()
+        last: Future[Response] | None = None
+
+        current = current_deadline()
+
+        while remaining or pending:
+            if not pending:
+                host = remaining.pop(0)
+                pending.add(self._start(host, path, **kwargs))
+                timeout = self.pool.hedge_delay(host) if remaining else None
+            else:
+                # a hedged request (or the only one left) is in flight
+                timeout = None
+
+            if current is not None:
+                left = current.remaining()
+                timeout = left if timeout is None else min(timeout, left)
+
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            if not done and current is not None and current.expired:
+                for future in pending:
+                    if not future.cancel():
+                        future.add_done_callback(_close_future)
+                if last is not None:
+                    _close_future(last)
+                current.check()
+
+            if not done and remaining:
+                host = remaining.pop(0)
+                pending.add(self._start(host, path, **kwargs))
+                continue
+
+            for future in done:
+                if future.exception() is None and future.result().status_code < 500:
+                    # release the connections of the requests that lost the race
+                    for other in pending:
+                        other.add_done_callback(_close_future)
+                    for other in done - {future}:
+                        _close_future(other)
+                    if last is not None:
+                        _close_future(last)
+
+                    return future.result()
+
+            # only the latest failure is kept, to be returned if every host fails
+            for future in done:
+                if last is not None:
+                    _close_future(last)
+                last = future
+
+        assert last is not None
+        return last.result()
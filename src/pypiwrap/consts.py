@@ -8,7 +8,16 @@ __version__ = "2.0.0"
 PYPI_HOST = "https://pypi.org"
 USER_AGENT = f"aescarias/pypiwrap {__version__}"
 
+# (connect, read) timeouts in seconds
+DEFAULT_TIMEOUT = (10.0, 60.0)
+
 SUPPORTED_SIMPLE_VERSION = (1, 4)
 SIMPLE_CONTENT_TYPE = "application/vnd.pypi.simple.v1+json"
+SIMPLE_HTML_CONTENT_TYPE = "application/vnd.pypi.simple.v1+html"
+
+# prefers the JSON form, accepting the HTML form from hosts only serving it (PEP 691)
+SIMPLE_ACCEPT = (
+    f"{SIMPLE_CONTENT_TYPE}, {SIMPLE_HTML_CONTENT_TYPE};q=0.2, text/html;q=0.01"
+)
 
 INTEGRITY_CONTENT_TYPE = "application/vnd.pypi.integrity.v1+json"
@@ -0,0 +1,143 @@
+"""Overall deadlines for client calls.
+
+A deadline bounds the total time spent by every request made within a block,
+including requests made concurrently by bulk operations such as
+:meth:`~pypiwrap.client.PyPIClient.audit`. Each request is given at most the time
+remaining as its timeout and, once the deadline expires, pending work is cancelled and
+:class:`~pypiwrap.exceptions.DeadlineExceeded` is raised.
+
+Example::
+
+    with PyPIClient() as client, deadline(5.0):
+        report = client.audit(requirements)
+
+Deadlines are stored in a :class:`~contextvars.ContextVar`, so they apply to the
+current thread or, within :mod:`asyncio`, to the current task only. Nested deadlines
+never extend an outer deadline.
+
+.. versionadded:: 2.1.0
+"""
+
+from __future__ import annotations
+
+import functools
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, wait
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, TypeVar
+
+from .exceptions import DeadlineExceeded
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_current: ContextVar[Deadline | None] = ContextVar("pypiwrap_deadline", default=None)
+
+
+class Deadline:
+    """A point in time after which work should be abandoned.
+
+    Arguments:
+        timeout (float):
+            The time in seconds from now until the deadline expires.
+    """
+
+    def __init__(self, timeout: float) -> None:
+        self.timeout = timeout
+        """The time in seconds the deadline was set for."""
+
+        self.expires = time.monotonic() + timeout
+        """The monotonic time the deadline expires at."""
+
+    def __repr__(self) -> str:
+        return f"<Deadline timeout={self.timeout} remaining={self.remaining():.3f}>"
+
+    def remaining(self) -> float:
+        """Returns the time in seconds until the deadline expires, or 0 if it has
+        expired."""
+        return max(0.0, self.expires - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has expired."""
+        return time.monotonic() >= self.expires
+
+    def check(self) -> None:
+        """Raises :class:`~pypiwrap.exceptions.DeadlineExceeded` if the deadline has
+        expired."""
+
+        if self.expired:
+            raise DeadlineExceeded(f"Deadline of {self.timeout} seconds exceeded.")
+
+
+def current_deadline() -> Deadline | None:
+    """Returns the deadline of the current context or None if there is none."""
+    return _current.get()
+
+
+@contextmanager
+def deadline(timeout: float) -> Iterator[Deadline]:
+    """Sets a deadline of ``timeout`` seconds for every client call within the block.
+
+    If a deadline expiring earlier is already set, it is kept.
+    """
+
+    new = Deadline(timeout)
+    outer = _current.get()
+    if outer is not None and outer.expires < new.expires:
+        new = outer
+
+    token = _current.set(new)
+    try:
+        yield new
+    finally:
+        _current.reset(token)
+
+
+def bind_deadline(func: Callable[..., R]) -> Callable[..., R]:
+    """Wraps ``func`` so that it runs under the deadline of the current context.
+
+    Worker threads do not inherit the context of the thread submitting work to them,
+    so functions submitted to an executor should be wrapped with this.
+    """
+
+    bound = _current.get()
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> R:
+        token = _current.set(bound)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _current.reset(token)
+
+    return wrapper
+
+
+def gather(executor: Executor, func: Callable[[T], R], items: Iterable[T]) -> list[R]:
+    """Runs ``func`` on each of ``items`` in ``executor`` and returns the results in
+    order, like :meth:`Executor.map <concurrent.futures.Executor.map>`.
+
+    ``func`` runs under the deadline of the current context. If the deadline expires
+    before every result is available, the calls not yet started are cancelled and
+    :class:`~pypiwrap.exceptions.DeadlineExceeded` is raised.
+    """
+
+    current = _current.get()
+    bound = bind_deadline(func)
+    futures = [executor.submit(bound, item) for item in items]
+
+    if current is None:
+        return [future.result() for future in futures]
+
+    _, pending = wait(futures, timeout=current.remaining())
+
+    if pending:
+        for future in pending:
+            future.cancel()
+
+        raise DeadlineExceeded(f"Deadline of {current.timeout} seconds exceeded.")
+
+    return [future.result() for future in futures]
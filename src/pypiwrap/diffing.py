@@ -0,0 +1,204 @@
+"""Utilities for detecting changes between two versions of a project page.
+
+Pages can be compared as :class:`~pypiwrap.objects.simple_repo.ProjectPage` objects,
+as raw JSON responses from the Simple Repository API, or as snapshots created with
+:func:`.snapshot`, which are compact and can be stored between fetches.
+
+.. versionadded:: 2.1.0
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple, Union
+
+from .objects.simple_repo import DistributionFile, ProjectPage
+
+Hashes = tuple[tuple[str, str], ...]
+
+
+def _freeze(value: Any) -> Any:
+    # dictionaries of hashes are converted to sorted tuples so they can be compared
+    if isinstance(value, dict):
+        return tuple(sorted(value.items()))
+    return value
+
+
+def _canonical(yanked: Any, metadata: Any) -> tuple[bool | str, bool | Hashes]:
+    # Absent, None and False values are all stored as False, as the same page may
+    # omit a key (HTML pages, projected models) or set it to null or false.
+    return yanked or False, _freeze(metadata) if metadata else False
+
+
+class FileSnapshot(NamedTuple):
+    """The state of a distribution file relevant for change detection."""
+
+    filename: str
+    """The filename of the distribution."""
+
+    hashes: Hashes
+    """The hashes of the file as sorted (name, digest) pairs."""
+
+    yanked: bool | str
+    """Whether the file was yanked or, if a string, why it was yanked."""
+
+    core_metadata: bool | Hashes
+    """Whether the file has a metadata file or, if a tuple, its hashes."""
+
+    @classmethod
+    def from_file(cls, pkg_file: DistributionFile) -> FileSnapshot:
+        """Creates a snapshot from a distribution file."""
+
+        return cls(
+            pkg_file.filename,
+            _freeze(pkg_file.hashes),
+            *_canonical(
+                pkg_file.yanked, pkg_file.core_metadata or pkg_file.dist_info_metadata
+            ),
+        )
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> FileSnapshot:
+        """Creates a snapshot from a file entry of a raw project page response."""
+
+        return cls(
+            data["filename"],
+            _freeze(data.get("hashes", {})),
+            *_canonical(
+                data.get("yanked"),
+                data.get("core-metadata") or data.get("data-dist-info-metadata"),
+            ),
+        )
+
+
+Snapshot = dict[str, FileSnapshot]
+"""A mapping of filenames to file snapshots."""
+
+PageLike = Union[ProjectPage, Mapping[str, Any], Snapshot]
+
+
+def snapshot(page: ProjectPage | Mapping[str, Any]) -> Snapshot:
+    """Creates a snapshot of ``page``, either a project page or the raw JSON response
+    for a project page."""
+
+    if isinstance(page, ProjectPage):
+        files = map(FileSnapshot.from_file, page.files)
+    else:
+        files = map(FileSnapshot.from_json, page["files"])
+
+    return {item.filename: item for item in files}
+
+
+def _as_snapshot(page: PageLike) -> Snapshot:
+    if isinstance(page, ProjectPage) or "files" in page:
+        return snapshot(page)  # type: ignore[arg-type]
+
+    result = {}
+    for filename, item in page.items():
+        if not isinstance(item, FileSnapshot):
+            # snapshots loaded from JSON have their tuples converted to lists
+            _, hashes, yanked, metadata = item
+            item = FileSnapshot(
+                filename,
+                tuple(map(tuple, hashes)),
+                *_canonical(
+                    yanked,
+                    dict(metadata) if isinstance(metadata, list) else metadata,
+                ),
+            )
+        result[filename] = item
+
+    return result
+
+
+class FileChange(NamedTuple):
+    """A file present in both pages whose state changed."""
+
+    old: FileSnapshot
+    """The previous state of the file."""
+
+    new: FileSnapshot
+    """The current state of the file."""
+
+    fields: tuple[str, ...]
+    """The names of the fields that changed (``hashes``, ``yanked`` and/or
+    ``core_metadata``)."""
+
+    @property
+    def filename(self) -> str:
+        """The filename of the distribution."""
+        return self.new.filename
+
+    @property
+    def newly_yanked(self) -> bool:
+        """Whether the file was yanked since the previous state."""
+        return bool(self.new.yanked) and not self.old.yanked
+
+    @property
+    def unyanked(self) -> bool:
+        """Whether the file is no longer yanked."""
+        return bool(self.old.yanked) and not self.new.yanked
+
+
+@dataclass
+class PageDiff:
+    """The differences between two versions of a project page."""
+
+    added: list[FileSnapshot] = field(default_factory=list)
+    """The files only present in the new page."""
+
+    removed: list[FileSnapshot] = field(default_factory=list)
+    """The files only present in the old page."""
+
+    changed: list[FileChange] = field(default_factory=list)
+    """The files present in both pages whose state changed."""
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    @property
+    def newly_yanked(self) -> list[FileChange]:
+        """The changed files that were yanked since the old page."""
+        return [change for change in self.changed if change.newly_yanked]
+
+
+def diff_pages(old: PageLike, new: PageLike) -> PageDiff:
+    """Compares two versions of a project page in linear time.
+
+    Each page may be a :class:`~pypiwrap.objects.simple_repo.ProjectPage`, the raw JSON
+    response for a project page, or a snapshot created with :func:`.snapshot`. Files
+    are matched by filename.
+
+    Arguments:
+        old (ProjectPage | Mapping[str, Any] | Snapshot):
+            The previous version of the page.
+
+        new (ProjectPage | Mapping[str, Any] | Snapshot):
+            The current version of the page.
+    """
+
+    old_files = _as_snapshot(old)
+    new_files = _as_snapshot(new)
+
+    diff = PageDiff()
+
+    for filename, current in new_files.items():
+        previous = old_files.get(filename)
+        if previous is None:
+            diff.added.append(current)
+        elif previous != current:
+            fields = tuple(
+                name
+                for name in ("hashes", "yanked", "core_metadata")
+                if getattr(previous, name) != getattr(current, name)
+            )
+            diff.changed.append(FileChange(previous, current, fields))
+
+    diff.removed = [
+        previous
+        for filename, previous in old_files.items()
+        if filename not in new_files
+    ]
+
+    return diff
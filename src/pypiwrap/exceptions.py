@@ -1,17 +1,23 @@
 from __future__ import annotations
 
-import requests
+import warnings
+from typing import TYPE_CHECKING
+
+from .consts import SUPPORTED_SIMPLE_VERSION
+
+if TYPE_CHECKING:
+    from .transport import Response
 
 
 def raise_for_status(
-    response: requests.Response, messages: dict[int, str] | None = None
+    response: Response, messages: dict[int, str] | None = None
 ) -> None:
     """Raises an exception based on the response's status code. If the status code is
     deemed OK, this will do nothing.
 
     Arguments:
-        response (requests.Response):
-            The response itself.
+        response (Response):
+            The response itself (see :class:`~.transport.Response`).
 
         messages (dict[int, str], optional):
             A mapping of status codes to messages.
@@ -29,6 +35,37 @@ def raise_for_status(
     raise exc(response.status_code, messages.get(response.status_code, response.reason))
 
 
+def verify_api_version(version: str) -> None:
+    """Checks the API version declared by a Simple Repository API response.
+
+    Raises :class:`UnsupportedVersionError` if its major version is newer than the
+    one supported, or emits an :class:`UnexpectedVersionWarning` if only its minor
+    version is newer.
+
+    Arguments:
+        version (str):
+            The declared version, such as ``1.1``.
+
+    .. versionadded:: 2.1.0
+    """
+
+    declared_major, declared_minor = [int(comp) for comp in version.split(".")]
+    expected_major, expected_minor = SUPPORTED_SIMPLE_VERSION
+
+    if declared_major > expected_major:
+        raise UnsupportedVersionError(
+            f"API response returned version {declared_major}.{declared_minor}, "
+            f"expected major version {expected_major} or lower."
+        )
+    elif declared_major == expected_major and declared_minor > expected_minor:
+        warnings.warn(
+            f"API response returned version {declared_major}.{declared_minor}, "
+            f"this version is not strictly supported (latest supported: "
+            f"{expected_major}.{expected_minor}).",
+            UnexpectedVersionWarning,
+        )
+
+
 class ClientError(Exception):
     """Raised when an error occurs while performing a request."""
 
@@ -70,3 +107,23 @@ class ParseError(Exception):
     """
 
     pass
+
+
+class UnsafeMergeError(Exception):
+    """Raised when project pages from several repositories cannot be merged safely
+    according to PEP 708.
+
+    .. versionadded:: 2.1.0
+    """
+
+    pass
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a deadline set with :func:`~pypiwrap.deadlines.deadline` expires
+    before a call completes.
+
+    .. versionadded:: 2.1.0
+    """
+
+    pass
@@ -0,0 +1,159 @@
+"""Latency and health tracking for clients that use several equivalent hosts.
+
+.. versionadded:: 2.1.0
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Sequence
+
+
+class HostState:
+    """The latency estimate and health of a single host."""
+
+    def __init__(self, host: str, window: int) -> None:
+        self.host = host
+        """The base URL of the host."""
+
+        self.latency: float | None = None
+        """An exponentially weighted moving average of the latency in seconds or None
+        if no request has completed yet."""
+
+        self.samples: deque[float] = deque(maxlen=window)
+        """The most recent latencies in seconds."""
+
+        self.failures = 0
+        """The amount of consecutive failures."""
+
+        self.down_until = 0.0
+        """The monotonic time until which this host is out of rotation."""
+
+    def __repr__(self) -> str:
+        return (
+            f"<HostState {self.host!r} latency={self.latency} failures={self.failures}>"
+        )
+
+
+class HostPool:
+    """Keeps track of the latency and health of several equivalent hosts.
+
+    Hosts are ranked by their latency estimate so that requests go to the fastest
+    healthy host first. A host failing ``failure_threshold`` times in a row is taken out
+    of rotation for ``cooldown`` seconds, after which it is tried again.
+
+    Arguments:
+        hosts (Sequence[str]):
+            The base URLs of the hosts, in order of preference.
+
+        window (int, optional):
+            The amount of latency samples kept per host. Defaults to 50.
+
+        alpha (float, optional):
+            The smoothing factor of the latency estimate. Defaults to 0.2.
+
+        hedge_percentile (float, optional):
+            The percentile (between 0 and 100) of a host's latency samples after which
+            a hedged request should be sent. Defaults to 95.
+
+        default_hedge_delay (float, optional):
+            The delay in seconds used until enough samples are available. Defaults to 1.
+
+        min_samples (int, optional):
+            The amount of samples required before using the percentile. Defaults to 5.
+
+        failure_threshold (int, optional):
+            The amount of consecutive failures before a host is taken out of rotation.
+            Defaults to 3.
+
+        cooldown (float, optional):
+            The time in seconds an unhealthy host is out of rotation. Defaults to 30.
+    """
+
+    def __init__(
+        self,
+        hosts: Sequence[str],
+        *,
+        window: int = 50,
+        alpha: float = 0.2,
+        hedge_percentile: float = 95,
+        default_hedge_delay: float = 1.0,
+        min_samples: int = 5,
+        failure_threshold: int = 3,
+        cooldown: float = 30.0,
+    ) -> None:
+        if not hosts:
+            raise ValueError("At least one host must be specified.")
+
+        self.states = {host: HostState(host, window) for host in hosts}
+        self.alpha = alpha
+        self.hedge_percentile = hedge_percentile
+        self.default_hedge_delay = default_hedge_delay
+        self.min_samples = min_samples
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+
+        self._lock = threading.Lock()
+
+    def ranked(self) -> list[str]:
+        """Returns the hosts in the order they should be tried.
+
+        Healthy hosts come first, sorted by latency estimate. Hosts without an estimate
+        follow in order of preference and get one once used as a fallback or hedge.
+        Hosts out of rotation come last, the one closest to coming back first, so that
+        a request can still be attempted if every host is unhealthy.
+        """
+
+        now = time.monotonic()
+        with self._lock:
+            # the states are updated concurrently, so they are ranked under the lock
+            states = list(self.states.values())
+
+            healthy = [state for state in states if state.down_until <= now]
+            unhealthy = [state for state in states if state.down_until > now]
+
+            healthy.sort(
+                key=lambda state: (state.latency is None, state.latency or 0.0)
+            )
+            unhealthy.sort(key=lambda state: state.down_until)
+
+        return [state.host for state in healthy + unhealthy]
+
+    def hedge_delay(self, host: str) -> float:
+        """Returns the time in seconds to wait for ``host`` before hedging."""
+
+        with self._lock:
+            samples = sorted(self.states[host].samples)
+
+        if len(samples) < self.min_samples:
+            return self.default_hedge_delay
+
+        idx = min(len(samples) - 1, int(len(samples) * self.hedge_percentile / 100))
+        return samples[idx]
+
+    def record_success(self, host: str, elapsed: float) -> None:
+        """Records a request to ``host`` that completed in ``elapsed`` seconds."""
+
+        with self._lock:
+            state = self.states[host]
+            state.samples.append(elapsed)
+            state.failures = 0
+            state.down_until = 0.0
+
+            if state.latency is None:
+                state.latency = elapsed
+            else:
+                state.latency += self.alpha * (elapsed - state.latency)
+
+    def record_failure(self, host: str) -> None:
+        """Records a failed request to ``host``, taking it out of rotation if it has
+        failed too many times in a row."""
+
+        with self._lock:
+            state = self.states[host]
+            state.failures += 1
+
+            if state.failures >= self.failure_threshold:
+                state.down_until = time.monotonic() + self.cooldown
@@ -0,0 +1,138 @@
+"""String interning for models loaded in bulk.
+
+Many values repeat across projects and files: classifiers, package types, Python
+version tags, ``Requires-Python`` specifiers, hash names, and so on. Within an
+:func:`interning` block, the ``from_json`` constructors of the models replace these
+values by a single shared instance from an :class:`InternPool`, which reduces the
+memory used by large in-memory catalogs.
+
+Example::
+
+    with interning() as pool:
+        projects = [Project.from_json(data) for data in payloads]
+
+    print(pool.stats())
+
+.. versionadded:: 2.1.0
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, NamedTuple
+
+_current: ContextVar[InternPool | None] = ContextVar("pypiwrap_intern", default=None)
+
+
+class InternStats(NamedTuple):
+    """Statistics about an :class:`InternPool`."""
+
+    strings: int
+    """The amount of unique strings in the pool."""
+
+    lookups: int
+    """The amount of strings interned."""
+
+    hits: int
+    """The amount of strings replaced by an instance already in the pool."""
+
+    saved_bytes: int
+    """An estimate of the memory saved in bytes, assuming the replaced strings are not
+    referenced elsewhere."""
+
+    @property
+    def hit_ratio(self) -> float:
+        """The fraction of strings replaced by an instance already in the pool."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+class InternPool:
+    """A pool of unique strings.
+
+    Unlike :func:`sys.intern`, a pool keeps statistics and its strings are released
+    once the pool is no longer referenced. Statistics are approximate when the pool
+    is used from several threads at once.
+    """
+
+    def __init__(self) -> None:
+        self._strings: dict[str, str] = {}
+        self._lookups = 0
+        self._hits = 0
+        self._saved_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __repr__(self) -> str:
+        return f"<InternPool strings={len(self)}>"
+
+    def intern(self, value: str) -> str:
+        """Returns the instance of ``value`` in the pool, adding it if missing."""
+
+        existing = self._strings.setdefault(value, value)
+        self._lookups += 1
+
+        if existing is not value:
+            self._hits += 1
+            self._saved_bytes += sys.getsizeof(value)
+
+        return existing
+
+    def intern_value(self, value: Any) -> Any:
+        """Interns ``value`` if it is a string, each of its items if it is a list,
+        or its keys if it is a dictionary. Other values are returned as is."""
+
+        if isinstance(value, str):
+            return self.intern(value)
+        elif isinstance(value, list):
+            return [
+                self.intern(item) if isinstance(item, str) else item for item in value
+            ]
+        elif isinstance(value, dict):
+            return {self.intern(key): item for key, item in value.items()}
+
+        return value
+
+    def intern_fields(self, values: dict[str, Any], fields: tuple[str, ...]) -> None:
+        """Interns the values of ``fields`` in the mapping ``values`` in place. See
+        :meth:`.intern_value`."""
+
+        for name in fields:
+            if name in values:
+                values[name] = self.intern_value(values[name])
+
+    def stats(self) -> InternStats:
+        """Returns statistics about this pool."""
+        return InternStats(len(self), self._lookups, self._hits, self._saved_bytes)
+
+    def clear(self) -> None:
+        """Removes every string from the pool and resets its statistics."""
+
+        self._strings.clear()
+        self._lookups = self._hits = self._saved_bytes = 0
+
+
+def current_pool() -> InternPool | None:
+    """Returns the pool of the current :func:`interning` block or None."""
+    return _current.get()
+
+
+@contextmanager
+def interning(pool: InternPool | None = None) -> Iterator[InternPool]:
+    """Interns repeated values of the models created within the block.
+
+    Arguments:
+        pool (InternPool, optional):
+            The pool to use, for example, to share one pool across several blocks. If
+            none specified, a new pool is created.
+    """
+
+    pool = pool if pool is not None else InternPool()
+    token = _current.set(pool)
+    try:
+        yield pool
+    finally:
+        _current.reset(token)
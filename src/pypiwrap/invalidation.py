@@ -0,0 +1,249 @@
+"""Cache invalidation driven by the PyPI RSS feeds.
+
+Rather than relying on short TTLs, :class:`FeedInvalidator` watches the feed of latest
+updates (and the release feeds of pinned projects) and only evicts or refreshes the
+cache entries of releases that changed. This allows using long TTLs with
+:class:`~pypiwrap.cache.StaleWhileRevalidateCache`.
+
+Example::
+
+    cache = StaleWhileRevalidateCache(soft_ttl=3600, hard_ttl=86400)
+
+    with PyPIFeedClient() as feeds, FeedInvalidator(feeds, cache) as invalidator:
+        invalidator.start()
+        ...
+
+.. versionadded:: 2.1.0
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Hashable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from .deadlines import gather
+from .exceptions import ClientError, ParseError
+from .utils import normalize_name, release_from_link
+
+if TYPE_CHECKING:
+    from .cache import StaleWhileRevalidateCache
+    from .client import PyPIFeedClient
+    from .objects.rss import PyPIFeed
+
+
+class FeedInvalidator:
+    """Evicts or refreshes the cache entries of projects updated on PyPI.
+
+    Cache entries are matched by the normalized project name and version in their key
+    (see :mod:`pypiwrap.cache`). For each updated release, the entries of that version
+    and the entries not bound to a version (such as project pages, which list every
+    release) are affected on every host. Entries of other releases are kept.
+
+    Arguments:
+        feeds (PyPIFeedClient):
+            The client used to fetch the feeds.
+
+        cache (StaleWhileRevalidateCache):
+            The cache to invalidate.
+
+        pinned (Iterable[str], optional):
+            Projects whose release feed is also polled. The feed of latest updates
+            only includes the most recent updates across PyPI, so updates to these
+            projects are not missed between polls.
+
+        refresh (bool, optional):
+            Whether to refresh affected entries in the background rather than
+            evicting them. Defaults to False.
+
+        interval (float, optional):
+            The time in seconds between polls when running in the background.
+            Defaults to 60.
+
+        max_workers (int, optional):
+            The maximum amount of concurrent requests for release feeds. Defaults to 4.
+
+        max_seen (int, optional):
+            The amount of feed items remembered to detect new items. Defaults to 10000.
+    """
+
+    def __init__(
+        self,
+        feeds: PyPIFeedClient,
+        cache: StaleWhileRevalidateCache,
+        *,
+        pinned: Iterable[str] = (),
+        refresh: bool = False,
+        interval: float = 60.0,
+        max_workers: int = 4,
+        max_seen: int = 10_000,
+    ) -> None:
+        self.feeds = feeds
+        self.cache = cache
+        self.pinned = {normalize_name(name) for name in pinned}
+        self.refresh = refresh
+        self.interval = interval
+        self.max_workers = max_workers
+
+        self.polls = 0
+        """The amount of polls completed."""
+
+        self.invalidated = 0
+        """The amount of cache entries evicted or refreshed."""
+
+        self.failures = 0
+        """The amount of background polls that failed."""
+
+        self.last_error: BaseException | None = None
+        """The error raised by the most recent background poll, if it failed."""
+
+        self._seen: set[str] = set()
+        self._seen_order: deque[str] = deque()
+        self._max_seen = max_seen
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_args) -> None:
+        self.stop()
+
+    def _fetch(self) -> list[PyPIFeed]:
+        feeds = [self.feeds.get_latest_updates()]
+
+        if self.pinned:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                feeds += gather(
+                    executor,
+                    self.feeds.get_latest_releases_for_project,
+                    sorted(self.pinned),
+                )
+
+        return feeds
+
+    def _remember(self, guid: str) -> bool:
+        # returns whether guid is new
+        if guid in self._seen:
+            return False
+
+        self._seen.add(guid)
+        self._seen_order.append(guid)
+        if len(self._seen_order) > self._max_seen:
+            self._seen.discard(self._seen_order.popleft())
+
+        return True
+
+    def updated_projects(self) -> dict[str, set[str]]:
+        """Fetches the feeds and returns the normalized names of the projects with
+        items not seen in a previous call, mapped to the versions of the releases
+        these items link to. Items linking to a project itself add no version."""
+
+        projects: dict[str, set[str]] = {}
+        for feed in self._fetch():
+            for item in feed.items:
+                release = release_from_link(item.link)
+                if release is None or not self._remember(item.guid or item.link):
+                    continue
+
+                name, version = release
+                versions = projects.setdefault(normalize_name(name), set())
+                if version is not None:
+                    versions.add(version)
+
+        return projects
+
+    def invalidate(
+        self, projects: Mapping[str, Iterable[str]] | Iterable[str]
+    ) -> list[Hashable]:
+        """Evicts or refreshes the cache entries of ``projects`` and returns the keys
+        affected.
+
+        Arguments:
+            projects (Mapping[str, Iterable[str]] | Iterable[str]):
+                Project names mapped to the versions that changed, as returned by
+                :meth:`.updated_projects`. The entries of these versions and the
+                entries not bound to a version are affected. If only names are
+                given, every entry of these projects is affected.
+        """
+
+        changed: dict[str, set[str] | None]
+        if isinstance(projects, Mapping):
+            changed = {
+                normalize_name(name): set(versions)
+                for name, versions in projects.items()
+            }
+        else:
+            changed = {normalize_name(name): None for name in projects}
+
+        def matches(key: Hashable) -> bool:
+            if not isinstance(key, tuple) or len(key) < 4 or key[2] not in changed:
+                return False
+
+            versions = changed[key[2]]
+            return versions is None or key[3] is None or key[3] in versions
+
+        if self.refresh:
+            keys = [key for key in self.cache.keys() if matches(key)]
+            keys = [key for key in keys if self.cache.refresh(key)]
+        else:
+            keys = self.cache.invalidate_where(matches)
+
+        self.invalidated += len(keys)
+        return keys
+
+    def poll(self) -> list[Hashable]:
+        """Fetches the feeds once and invalidates the cache entries of updated
+        projects. Returns the keys affected."""
+
+        keys = self.invalidate(self.updated_projects())
+        self.polls += 1
+        return keys
+
+    def run(self) -> None:
+        """Polls the feeds every :attr:`interval` seconds until :meth:`.stop` is
+        called.
+
+        Polls failing to fetch or parse a feed are counted in :attr:`failures` and
+        retried on the next interval, with the error stored in :attr:`last_error`.
+        Any other error is stored and raised, which stops polling.
+        """
+
+        errors = (OSError, ClientError, ParseError, *self.feeds.transport.errors)
+
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except errors as exc:
+                self.failures += 1
+                self.last_error = exc
+            except BaseException as exc:
+                self.last_error = exc
+                raise
+            else:
+                self.last_error = None
+
+            self._stop.wait(self.interval)
+
+    def start(self) -> None:
+        """Starts polling the feeds in a background thread."""
+
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self.run, name="pypiwrap-invalidator", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops polling in the background, waiting for the current poll to end."""
+
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,199 @@
+"""Utilities for merging a project from several repositories according to PEP 708.
+
+PEP 708 defines two ways for repositories to declare that a project may be safely
+merged across them: a repository may declare that its project "tracks" the project
+of another repository (:attr:`.Meta.tracks`), and the projects of several
+repositories may name each other as alternate locations
+(:attr:`.ProjectPage.alternate_locations`). If neither applies, merging the files of
+the repositories is unsafe as it could enable a dependency confusion attack.
+
+See https://peps.python.org/pep-0708/ for details.
+
+.. versionadded:: 2.1.0
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from .deadlines import gather
+from .exceptions import NotFound, UnsafeMergeError
+from .objects.simple_repo import DistributionFile, Meta, ProjectPage
+from .utils import normalize_name
+
+if TYPE_CHECKING:
+    from .client import SimpleRepoClient
+
+
+@dataclass
+class MergedProjectPage(ProjectPage):
+    """A project page combining the pages of several repositories."""
+
+    repositories: list[str] = field(default_factory=list)
+    """The URLs of the project in each repository merged into this page."""
+
+
+def project_url(host: str, name: str) -> str:
+    """Returns the URL of the project ``name`` in the repository at ``host``."""
+    return f"{host.rstrip('/')}/simple/{normalize_name(name)}/"
+
+
+def _same_url(left: str, right: str) -> bool:
+    return left.rstrip("/") == right.rstrip("/")
+
+
+def _trusts(url: str, page: ProjectPage, other_url: str, other: ProjectPage) -> bool:
+    tracks = any(_same_url(item, other_url) for item in page.meta.tracks) or any(
+        _same_url(item, url) for item in other.meta.tracks
+    )
+    alternates = any(
+        _same_url(item, other_url) for item in page.alternate_locations
+    ) and any(_same_url(item, url) for item in other.alternate_locations)
+
+    return tracks or alternates
+
+
+def can_merge(pages: Mapping[str, ProjectPage]) -> bool:
+    """Checks whether the project ``pages`` may be merged according to PEP 708.
+
+    Two repositories may be merged if either tracks the other or if both name each
+    other as alternate locations. All repositories may be merged if every repository
+    is connected to the others through these relationships.
+
+    Arguments:
+        pages (Mapping[str, ProjectPage]):
+            A mapping of project URLs (see :func:`.project_url`) to project pages.
+    """
+
+    urls = list(pages)
+    if len(urls) <= 1:
+        return True
+
+    reached = {urls[0]}
+    queue = [urls[0]]
+
+    while queue:
+        current = queue.pop()
+        for url in urls:
+            if url not in reached and _trusts(current, pages[current], url, pages[url]):
+                reached.add(url)
+                queue.append(url)
+
+    return len(reached) == len(urls)
+
+
+def merge_project_pages(
+    pages: Mapping[str, ProjectPage], *, force: bool = False
+) -> MergedProjectPage:
+    """Merges project ``pages`` from several repositories into one page.
+
+    Files are deduplicated by their hashes (or by filename if a file has no hashes),
+    keeping the first occurrence in order of ``pages``.
+
+    Arguments:
+        pages (Mapping[str, ProjectPage]):
+            A mapping of project URLs (see :func:`.project_url`) to project pages, in
+            order of priority.
+
+        force (bool, optional):
+            Whether to merge pages even if PEP 708 does not allow it. Defaults to False.
+
+    Raises:
+        UnsafeMergeError: If the pages cannot be merged safely and ``force`` is False.
+    """
+
+    if not pages:
+        raise ValueError("At least one project page must be specified.")
+
+    if not force and not can_merge(pages):
+        raise UnsafeMergeError(
+            f"Refusing to merge {list(pages)}: repositories neither track each other "
+            "nor name each other as alternate locations."
+        )
+
+    first = next(iter(pages.values()))
+
+    # dictionaries are used as ordered sets
+    tracks: dict[str, None] = {}
+    alternates: dict[str, None] = {}
+    versions: dict[str, None] = {}
+    files: list[DistributionFile] = []
+    seen_hashes: set[tuple[str, str]] = set()
+    seen_names: set[str] = set()
+
+    for page in pages.values():
+        tracks.update(dict.fromkeys(page.meta.tracks))
+        alternates.update(dict.fromkeys(page.alternate_locations))
+        versions.update(dict.fromkeys(page.versions))
+
+        for pkg_file in page.files:
+            hashes = set(pkg_file.hashes.items())
+            if (hashes & seen_hashes) or (
+                not hashes and pkg_file.filename in seen_names
+            ):
+                continue
+
+            seen_hashes |= hashes
+            seen_names.add(pkg_file.filename)
+            files.append(pkg_file)
+
+    return MergedProjectPage(
+        meta=Meta(
+            api_version=first.meta.api_version,
+            tracks=list(tracks),
+            project_status=first.meta.project_status,
+            project_status_reason=first.meta.project_status_reason,
+        ),
+        name=first.name,
+        alternate_locations=list(alternates),
+        versions=list(versions),
+        files=files,
+        repositories=list(pages),
+    )
+
+
+def get_merged_project_page(
+    clients: Sequence[SimpleRepoClient], project: str, *, force: bool = False
+) -> MergedProjectPage:
+    """Fetches ``project`` from the repositories of ``clients`` concurrently and merges
+    the pages found. See :func:`.merge_project_pages` for details.
+
+    Repositories where the project does not exist are skipped.
+
+    Arguments:
+        clients (Sequence[SimpleRepoClient]):
+            The clients for each repository, in order of priority.
+
+        project (str):
+            The name of the project.
+
+        force (bool, optional):
+            Whether to merge pages even if PEP 708 does not allow it. Defaults to False.
+
+    Raises:
+        NotFound: If the project does not exist in any repository.
+        UnsafeMergeError: If the pages cannot be merged safely and ``force`` is False.
+    """
+
+    def fetch(client: SimpleRepoClient) -> ProjectPage | None:
+        try:
+            return client.get_project_page(project)
+        except NotFound:
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(1, len(clients))) as executor:
+        results = gather(executor, fetch, clients)
+
+    pages = {
+        project_url(client.host, page.name): page
+        for client, page in zip(clients, results)
+        if page is not None
+    }
+
+    if not pages:
+        raise NotFound(404, f"Could not find project '{project}' in any repository")
+
+    return merge_project_pages(pages, force=force)
@@ -1,6 +1,23 @@
-from pypiwrap.objects.pypi import Project, ReleaseFile, Stats, Vulnerability
-from pypiwrap.objects.rss import PyPIFeed, PyPIFeedItem
-from pypiwrap.objects.simple_repo import DistributionFile, IndexPage, Meta, ProjectPage
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pypiwrap.objects.integrity import (
+        Attestation,
+        AttestationBundle,
+        Provenance,
+        Publisher,
+    )
+    from pypiwrap.objects.pypi import Project, ReleaseFile, Stats, Vulnerability
+    from pypiwrap.objects.rss import PyPIFeed, PyPIFeedItem
+    from pypiwrap.objects.simple_repo import (
+        DistributionFile,
+        IndexPage,
+        Meta,
+        ProjectPage,
+    )
 
 __all__ = (
     "Stats",
@@ -13,4 +30,41 @@ __all__ = (
     "ProjectPage",
     "PyPIFeed",
     "PyPIFeedItem",
+    "Provenance",
+    "AttestationBundle",
+    "Attestation",
+    "Publisher",
 )
+
+# Models are imported on first access so that only the modules needed are loaded.
+_LAZY_ATTRIBUTES = {
+    "Stats": "pypi",
+    "Project": "pypi",
+    "ReleaseFile": "pypi",
+    "Vulnerability": "pypi",
+    "IndexPage": "simple_repo",
+    "Meta": "simple_repo",
+    "DistributionFile": "simple_repo",
+    "ProjectPage": "simple_repo",
+    "PyPIFeed": "rss",
+    "PyPIFeedItem": "rss",
+    "Provenance": "integrity",
+    "AttestationBundle": "integrity",
+    "Attestation": "integrity",
+    "Publisher": "integrity",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+    value = getattr(module, name)
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
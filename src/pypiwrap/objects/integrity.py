@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from .base import APIObject
+
+
+@dataclass
+class Publisher(APIObject):
+    """The Trusted Publisher that produced a set of attestations.
+
+    .. versionadded:: 2.1.0
+    """
+
+    kind: str
+    """The kind of Trusted Publisher (for example, ``GitHub`` or ``GitLab``)."""
+
+    claims: dict[str, Any]
+    """Any additional claims made by the publisher, such as ``repository`` or
+    ``workflow``. The claims available depend on the :attr:`.kind` of publisher."""
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> Publisher:
+        claims = data.copy()
+        return cls(kind=claims.pop("kind"), claims=claims)
+
+    def __repr__(self) -> str:
+        return self._build_repr_string(self.kind)
+
+
+@dataclass
+class Attestation(APIObject):
+    """A digital attestation for a distribution file as described in PEP 740.
+
+    See https://peps.python.org/pep-0740/#attestation-objects for details.
+
+    .. versionadded:: 2.1.0
+    """
+
+    version: int
+    """The version of the attestation object."""
+
+    certificate: str
+    """The base64 encoded signing certificate (part of the verification material)."""
+
+    transparency_entries: list[dict[str, Any]]
+    """The transparency log entries for this attestation (part of the verification
+    material)."""
+
+    statement: str
+    """The base64 encoded in-toto statement being attested to (part of the envelope)."""
+
+    signature: str
+    """The base64 encoded signature over the statement (part of the envelope)."""
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> Attestation:
+        material = data["verification_material"]
+        envelope = data["envelope"]
+
+        return cls(
+            version=data["version"],
+            certificate=material["certificate"],
+            transparency_entries=material.get("transparency_entries", []),
+            statement=envelope["statement"],
+            signature=envelope["signature"],
+        )
+
+    def __repr__(self) -> str:
+        return self._build_repr_string(version=self.version)
+
+
+@dataclass
+class AttestationBundle(APIObject):
+    """A group of attestations produced by the same publisher.
+
+    .. versionadded:: 2.1.0
+    """
+
+    publisher: Publisher
+    """The publisher of the attestations."""
+
+    attestations: list[Attestation]
+    """The attestations in this bundle."""
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> AttestationBundle:
+        return cls(
+            publisher=Publisher.from_json(data["publisher"]),
+            attestations=[Attestation.from_json(item) for item in data["attestations"]],
+        )
+
+    def __repr__(self) -> str:
+        return self._build_repr_string(
+            self.publisher.kind, attestations=len(self.attestations)
+        )
+
+
+@dataclass
+class Provenance(APIObject):
+    """The provenance of a distribution file as returned by the Integrity API.
+
+    See https://peps.python.org/pep-0740/#provenance-objects for details.
+
+    .. versionadded:: 2.1.0
+    """
+
+    version: int
+    """The version of the provenance object."""
+
+    attestation_bundles: list[AttestationBundle]
+    """The attestation bundles for this file."""
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> Provenance:
+        return cls(
+            version=data["version"],
+            attestation_bundles=[
+                AttestationBundle.from_json(bundle)
+                for bundle in data["attestation_bundles"]
+            ],
+        )
+
+    def __repr__(self) -> str:
+        return self._build_repr_string(
+            version=self.version, bundles=len(self.attestation_bundles)
+        )
@@ -1,12 +1,36 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import dataclasses
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
+from ..interning import current_pool
 from ..utils import Size, iso_to_datetime, remove_additional
 from .base import APIObject
 
+if TYPE_CHECKING:
+    from packaging.requirements import Requirement
+
+# fields whose values repeat across projects and files, interned within an
+# `interning` block (see pypiwrap.interning). `license` is left out as it often
+# holds the full text of a license, which would only grow the pool.
+PROJECT_INTERNED = (
+    "classifiers",
+    "description_content_type",
+    "dynamic",
+    "license_expression",
+    "platform",
+    "project_urls",
+    "provides_extra",
+    "requires_dist",
+    "requires_python",
+)
+RELEASE_FILE_INTERNED = ("digests", "package_type", "python_version", "requires_python")
+VULNERABILITY_INTERNED = ("source",)
+
 
 @dataclass
 class Project(APIObject):
@@ -14,6 +38,12 @@ class Project(APIObject):
 
     This includes information about the project, this particular release, URLs to
     distribution files, and any reported vulnerabilities.
+
+    .. note::
+        A project created with a ``fields`` projection (see :meth:`.from_json`) has
+        every field outside the projection set to None, even where the annotation
+        does not allow it. Check :attr:`.projection` or call :meth:`.require_fields`
+        before relying on such fields.
     """
 
     author: str | None
@@ -130,24 +160,114 @@ class Project(APIObject):
     last_serial: int
     """The most recent serial ID number for this project."""
 
+    projection: frozenset[str] | None = field(default=None, repr=False, compare=False)
+    """The fields parsed if the project was created with a ``fields`` projection,
+    otherwise None.
+
+    .. versionadded:: 2.1.0
+    """
+
     @classmethod
-    def from_json(cls, data: dict[str, Any]) -> Project:
-        info = remove_additional(cls, data["info"].copy())
+    def from_json(
+        cls, data: dict[str, Any], fields: Iterable[str] | None = None
+    ) -> Project:
+        """Creates a project from a JSON API response ``data``.
+
+        Arguments:
+            data (dict[str, Any]):
+                The JSON API response.
+
+            fields (Iterable[str], optional):
+                If specified, only these fields are parsed (for example, ``name`` and
+                ``requires_dist``) and every other field is set to None, regardless
+                of its annotation. Unrequested fields are discarded before any
+                processing, which reduces the cost of building the project and the
+                memory it retains for large fields such as :attr:`.description`.
+                The JSON ``data`` itself is still decoded in full. The fields parsed
+                are available as :attr:`.projection`.
+
+                .. versionadded:: 2.1.0
+        """
+
+        names = [
+            field.name
+            for field in dataclasses.fields(cls)
+            if field.name != "projection"
+        ]
+
+        if fields is None:
+            wanted = set(names)
+        else:
+            wanted = set(fields)
+            unknown = wanted.difference(names)
+            if unknown:
+                raise ValueError(
+                    f"Unknown fields for {cls.__name__}: {sorted(unknown)}"
+                )
+
+        values: dict[str, Any] = {name: None for name in names if name not in wanted}
+        values.update(
+            (key, value) for key, value in data["info"].items() if key in wanted
+        )
 
-        info["requires_dist"] = info.get("requires_dist") or []
-        info["provides_extra"] = info.get("provides_extra") or []
-        info["dynamic"] = info.get("dynamic") or []
-        info["license_files"] = info.get("license_files") or []
+        for name in ("requires_dist", "provides_extra", "dynamic", "license_files"):
+            if name in wanted:
+                values[name] = values.get(name) or []
 
-        vulns = list(map(Vulnerability.from_json, data["vulnerabilities"]))
-        files = list(map(ReleaseFile.from_json, data["urls"]))
+        if "last_serial" in wanted:
+            values["last_serial"] = data["last_serial"]
+        if "vulnerabilities" in wanted:
+            values["vulnerabilities"] = list(
+                map(Vulnerability.from_json, data["vulnerabilities"])
+            )
+        if "file_urls" in wanted:
+            values["file_urls"] = list(map(ReleaseFile.from_json, data["urls"]))
 
-        return cls(
-            **info,
-            last_serial=data["last_serial"],
-            vulnerabilities=vulns,
-            file_urls=files,
-        )
+        pool = current_pool()
+        if pool is not None:
+            pool.intern_fields(values, PROJECT_INTERNED)
+
+        if fields is not None:
+            values["projection"] = frozenset(wanted)
+
+        return cls(**values)
+
+    def require_fields(self, *names: str) -> None:
+        """Ensures that the fields ``names`` were parsed, as fields left out by a
+        ``fields`` projection are None.
+
+        Raises:
+            ValueError: Any of the fields was left out by the projection.
+
+        .. versionadded:: 2.1.0
+        """
+
+        if self.projection is None:
+            return
+
+        missing = [name for name in names if name not in self.projection]
+        if missing:
+            raise ValueError(
+                f"Project {self.name!r} was parsed without the fields: {missing}"
+            )
+
+    @cached_property
+    def requirements(self) -> list[Requirement]:
+        """The requirements in :attr:`.requires_dist` parsed according to PEP 508.
+        Invalid requirements are skipped.
+
+        Requirements are parsed on first access through a memoized parser shared by
+        every project. See :mod:`pypiwrap.requirements` for evaluating their markers.
+
+        .. versionadded:: 2.1.0
+        .. note:: This property requires the ``packaging`` library.
+        """
+
+        from ..requirements import parse_requirement
+
+        self.require_fields("requires_dist")
+        parsed = map(parse_requirement, self.requires_dist)
+        return [requirement for requirement in parsed if requirement is not None]
 
     def __repr__(self) -> str:
         return self._build_repr_string(
@@ -191,7 +311,13 @@ class Vulnerability(APIObject):
         if data.get("withdrawn") is not None:
             data["withdrawn"] = iso_to_datetime(data["withdrawn"])
 
-        return cls(**remove_additional(cls, data))
+        result = remove_additional(cls, data)
+
+        pool = current_pool()
+        if pool is not None:
+            pool.intern_fields(result, VULNERABILITY_INTERNED)
+
+        return cls(**result)
 
     def __repr__(self) -> str:
         return self._build_repr_string(
@@ -268,6 +394,10 @@ class ReleaseFile(APIObject):
         data["upload_time_tz"] = data.pop("upload_time_iso_8601")
         data["package_type"] = data.pop("packagetype")
 
+        pool = current_pool()
+        if pool is not None:
+            pool.intern_fields(data, RELEASE_FILE_INTERNED)
+
         return cls(**remove_additional(cls, data))
 
     def __repr__(self) -> str:
@@ -3,11 +3,25 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
+from ..interning import current_pool
 from ..utils import Size, iso_to_datetime, remove_additional
 from .base import APIObject
 
+if TYPE_CHECKING:
+    from ..versions import VersionIndex
+
+# fields whose values repeat across projects and files, interned within an
+# `interning` block (see pypiwrap.interning)
+DISTRIBUTION_FILE_INTERNED = (
+    "hashes",
+    "requires_python",
+    "core_metadata",
+    "dist_info_metadata",
+)
+
 
 class ProjectStatus(str, Enum):
     """The project status marker as documented by PEP 792.
@@ -40,8 +54,13 @@ class DistributionFile(APIObject):
     url: str
     """The download URL for this file."""
 
-    size: Size
-    """The size of the distribution."""
+    size: Size | None
+    """The size of the distribution. This is None for files listed by the HTML form
+    of the API, which does not include sizes.
+
+    .. versionchanged:: 2.1.0
+        This may be None.
+    """
 
     hashes: dict[str, str]
     """A mapping of hash names to hex encoded digests for this file."""
@@ -99,7 +118,8 @@ class DistributionFile(APIObject):
         result = {key.replace("-", "_"): val for key, val in data.items()}
 
         result["has_gpg_sig"] = result.get("gpg_sig")
-        result["size"] = Size.from_int(result["size"])
+        size = result.get("size")
+        result["size"] = Size.from_int(size) if size is not None else None
 
         # See https://peps.python.org/pep-0714/ for why this is here.
         result["dist_info_metadata"] = result.pop("data_dist_info_metadata", None)
@@ -109,6 +129,10 @@ class DistributionFile(APIObject):
         if result.get("upload_time") is not None:
             result["upload_time"] = iso_to_datetime(result["upload_time"])
 
+        pool = current_pool()
+        if pool is not None:
+            pool.intern_fields(result, DISTRIBUTION_FILE_INTERNED)
+
         return cls(**remove_additional(cls, result))
 
     @property
@@ -124,7 +148,9 @@ class DistributionFile(APIObject):
             return self.url + ".metadata"
 
     def __repr__(self) -> str:
-        return self._build_repr_string(self.filename, size=self.size.si)
+        return self._build_repr_string(
+            self.filename, size=self.size.si if self.size is not None else None
+        )
 
 
 @dataclass
@@ -238,5 +264,20 @@ class ProjectPage(APIObject):
             files=files,
         )
 
+    @cached_property
+    def version_index(self) -> VersionIndex:
+        """A PEP 440 index of the versions and files of this project.
+
+        The index is built on first access and cached afterwards. See
+        :class:`~pypiwrap.versions.VersionIndex` for the queries available.
+
+        .. versionadded:: 2.1.0
+        .. note:: This property requires the ``packaging`` library.
+        """
+
+        from ..versions import VersionIndex
+
+        return VersionIndex(self)
+
     def __repr__(self) -> str:
         return self._build_repr_string(self.name)
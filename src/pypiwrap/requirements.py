@@ -0,0 +1,150 @@
+"""Utilities for parsing PEP 508 requirements and evaluating their markers.
+
+Requirement strings (such as those in :attr:`.Project.requires_dist`) repeat heavily
+across projects and releases, so parsed requirements and marker evaluation results
+are memoized by the raw requirement string.
+
+Example::
+
+    environments = [marker_environment("3.9"), marker_environment("3.13")]
+    matrix = evaluate_markers(project.requires_dist, environments)
+
+.. versionadded:: 2.1.0
+
+.. note::
+    This module requires the ``packaging`` library which can be installed alongside
+    pypiwrap with ``pip install pypiwrap[packaging]``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from functools import lru_cache
+
+try:
+    from packaging.markers import default_environment
+    from packaging.requirements import InvalidRequirement, Requirement
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "This feature requires the 'packaging' library. "
+        "Install it with 'pip install pypiwrap[packaging]'."
+    ) from exc
+
+EnvironmentKey = tuple[tuple[str, str], ...]
+
+
+@lru_cache(maxsize=65536)
+def parse_requirement(requirement: str) -> Requirement | None:
+    """Parses a PEP 508 ``requirement`` string. Returns None if it is invalid.
+
+    Results are memoized and shared, so the returned requirement must not be modified.
+    """
+
+    try:
+        return Requirement(requirement)
+    except InvalidRequirement:
+        return None
+
+
+def marker_environment(
+    python_version: str | None = None, **overrides: str
+) -> dict[str, str]:
+    """Returns a marker environment, based on the current interpreter, for evaluating
+    requirement markers.
+
+    Arguments:
+        python_version (str, optional):
+            A Python version (such as ``3.9`` or ``3.9.1``) replacing the
+            ``python_version`` and ``python_full_version`` of the current interpreter.
+
+        **overrides (str):
+            Other marker variables to replace, such as ``sys_platform="win32"``.
+    """
+
+    environment = default_environment()
+
+    if python_version is not None:
+        parts = python_version.split(".")
+        environment["python_version"] = ".".join(parts[:2])
+        environment["python_full_version"] = (
+            python_version if len(parts) > 2 else f"{python_version}.0"
+        )
+
+    environment.update(overrides)
+    return environment
+
+
+def _environment_key(environment: Mapping[str, str]) -> EnvironmentKey:
+    return tuple(sorted(environment.items()))
+
+
+@lru_cache(maxsize=65536)
+def _applies(requirement: str, environment: EnvironmentKey, extra: str) -> bool:
+    parsed = parse_requirement(requirement)
+    if parsed is None:
+        return False
+    if parsed.marker is None:
+        return True
+
+    return parsed.marker.evaluate({**dict(environment), "extra": extra})
+
+
+def requirement_applies(
+    requirement: str, environment: Mapping[str, str], extras: Iterable[str] = ()
+) -> bool:
+    """Checks whether ``requirement`` applies in ``environment`` when installing
+    ``extras``. Invalid requirements never apply.
+
+    Results are memoized by the requirement string, environment and extra.
+    """
+
+    key = _environment_key(environment)
+    return any(_applies(requirement, key, extra) for extra in ("", *extras))
+
+
+def evaluate_markers(
+    requirements: Iterable[str],
+    environments: Sequence[Mapping[str, str]],
+    extras: Iterable[str] = (),
+) -> list[list[bool]]:
+    """Evaluates the markers of ``requirements`` against several ``environments``.
+
+    Returns a list with, for each requirement, a list of whether the requirement
+    applies in each environment. See :func:`.requirement_applies` for details.
+
+    Arguments:
+        requirements (Iterable[str]):
+            The requirement strings, such as :attr:`.Project.requires_dist`.
+
+        environments (Sequence[Mapping[str, str]]):
+            The marker environments (see :func:`.marker_environment`).
+
+        extras (Iterable[str], optional):
+            The extras being installed.
+    """
+
+    keys = [_environment_key(environment) for environment in environments]
+    extras = ("", *extras)
+
+    return [
+        [any(_applies(requirement, key, extra) for extra in extras) for key in keys]
+        for requirement in requirements
+    ]
+
+
+def applicable_requirements(
+    requirements: Iterable[str],
+    environment: Mapping[str, str],
+    extras: Iterable[str] = (),
+) -> list[Requirement]:
+    """Returns the parsed ``requirements`` that apply in ``environment`` when
+    installing ``extras``."""
+
+    key = _environment_key(environment)
+    extras = ("", *extras)
+
+    return [
+        parse_requirement(requirement)  # type: ignore[misc]
+        for requirement in requirements
+        if any(_applies(requirement, key, extra) for extra in extras)
+    ]
@@ -0,0 +1,353 @@
+"""A fuzzy search index over project names.
+
+:class:`NameIndex` finds the project names most similar to a query without comparing
+the query against every name. Names are normalized (see
+:func:`~pypiwrap.utils.normalize_name`) and split into trigrams, and only the names
+sharing enough trigrams with the query to be among the results are scored. This is
+useful for "did you mean" suggestions or for detecting names that could be
+typosquatting a project.
+
+Example::
+
+    with SimpleRepoClient() as client:
+        index = NameIndex.from_index_page(client.get_index_page())
+
+    index.search("reqeusts", k=3)
+
+.. versionadded:: 2.1.0
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from itertools import chain
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .utils import NAME_SEPARATORS, name_from_link, normalize_name
+
+if TYPE_CHECKING:
+    from .objects.rss import PyPIFeed
+    from .objects.simple_repo import IndexPage
+
+
+# roughly how many ids of a posting list can be read in the time taken to look up a
+# single id in it
+_BISECT_COST = 16
+# the multiple of the probe size below which all the posting lists of a query are
+# counted without pruning
+_SCAN_ALL = 8
+
+
+def trigrams(name: str) -> set[str]:
+    """Returns the trigrams of the normalized ``name``.
+
+    The name is padded so that its first and last characters produce trigrams of
+    their own, which gives more weight to prefixes and suffixes.
+    """
+
+    return _trigrams(normalize_name(name))
+
+
+def _trigrams(name: str) -> set[str]:
+    # the trigrams of an already normalized name
+    padded = f"${name}$"
+    return {padded[idx : idx + 3] for idx in range(len(padded) - 2)}
+
+
+class Match(NamedTuple):
+    """A project name found by :meth:`.NameIndex.search`."""
+
+    name: str
+    """The normalized project name."""
+
+    score: float
+    """The similarity to the query, between 0 and 1, computed as the Jaccard index of
+    their trigrams."""
+
+
+class NameIndex:
+    """A trigram index over normalized project names.
+
+    Searches first count the names in the posting lists of the rarest trigrams of the
+    query. The best of these bound the score of every other name, so the lists of
+    common trigrams (such as ``py-``) are usually only probed for the names already
+    found rather than read in full. Results are the same as scoring every name.
+
+    Arguments:
+        names (Iterable[str], optional):
+            The project names to index.
+
+        probe_size (int, optional):
+            The amount of names read from the posting lists of the rarest trigrams of
+            a query before the best matches found are used to skip the rest.
+            Defaults to 5000.
+    """
+
+    def __init__(self, names: Iterable[str] = (), *, probe_size: int = 5000) -> None:
+        self.probe_size = probe_size
+
+        self._names: list[str] = []
+        self._ids: dict[str, int] = {}
+        self._sizes: list[int] = []
+        self._postings: dict[str, list[int]] = {}
+
+        self.update(names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return normalize_name(name) in self._ids
+
+    def __repr__(self) -> str:
+        return f"<NameIndex names={len(self)} trigrams={len(self._postings)}>"
+
+    @property
+    def names(self) -> list[str]:
+        """The normalized names in the index, in insertion order."""
+        return list(self._names)
+
+    def add(self, name: str) -> bool:
+        """Adds ``name`` to the index. Returns False if it was already indexed."""
+        return bool(self.update([name]))
+
+    def update(self, names: Iterable[str]) -> list[str]:
+        """Adds ``names`` to the index and returns the normalized names that were not
+        indexed yet."""
+
+        added = []
+        indexed, ids, sizes, postings = (
+            self._names,
+            self._ids,
+            self._sizes,
+            self._postings,
+        )
+
+        for name in names:
+            # normalized directly, as memoizing every name of a large index is wasted
+            name = NAME_SEPARATORS.sub("-", name).lower()
+            if name in ids:
+                continue
+
+            name_id = ids[name] = len(indexed)
+            indexed.append(name)
+            added.append(name)
+
+            grams = _trigrams(name)
+            sizes.append(len(grams))
+
+            # ids only increase, so every posting list stays sorted
+            for gram in grams:
+                posting = postings.get(gram)
+                if posting is None:
+                    postings[gram] = [name_id]
+                else:
+                    posting.append(name_id)
+
+        return added
+
+    def update_from_feed(self, feed: PyPIFeed) -> list[str]:
+        """Adds the projects of a feed returned by
+        :meth:`~pypiwrap.client.PyPIFeedClient.get_newest_packages` and returns the
+        normalized names that were not indexed yet."""
+
+        names = (name_from_link(item.link) for item in feed.items)
+        return self.update(name for name in names if name is not None)
+
+    def search(self, query: str, k: int = 10, *, min_score: float = 0.0) -> list[Match]:
+        """Returns the ``k`` names most similar to ``query``, most similar first.
+
+        Arguments:
+            query (str):
+                The name to search for.
+
+            k (int, optional):
+                The maximum amount of matches to return. Defaults to 10.
+
+            min_score (float, optional):
+                The minimum similarity of a match, between 0 and 1. Defaults to 0.
+        """
+
+        grams = trigrams(query)
+        size = len(grams)
+        if k <= 0 or not size:
+            return []
+
+        postings: list[list[int]] = sorted(
+            filter(None, map(self._postings.get, grams)), key=len
+        )
+        if not postings:
+            return []
+
+        # (score, -name_id) pairs of the best matches, so that ties favor the names
+        # indexed first
+        best: list[tuple[float, int]] = []
+
+        # The names in the rarest lists are counted and scored first, which finds the
+        # likely best matches without reading the lists of common trigrams. When all
+        # the lists are short, pruning them costs more than it saves.
+        probed = 1
+        total = len(postings[0])
+        if sum(map(len, postings)) <= _SCAN_ALL * self.probe_size:
+            probed = len(postings)
+
+        while (
+            probed < len(postings) and total + len(postings[probed]) <= self.probe_size
+        ):
+            total += len(postings[probed])
+            probed += 1
+
+        counts: Counter[int] = Counter()
+        for posting in postings[:probed]:
+            counts.update(posting)
+        self._score(counts, postings[probed:], size, k, min_score, best)
+
+        # Any other match shares at least `needed` trigrams with the query, as its
+        # score is at most shared / size. By the pigeonhole principle, it then appears
+        # in one of the rarest len(postings) - needed + 1 lists.
+        full = len(best) == k
+        threshold = best[0][0] if full else min_score
+        needed = max(1, math.ceil(threshold * size))
+        if full and needed <= threshold * size:
+            needed += 1
+
+        scanned = len(postings) - needed + 1
+        if scanned > probed:
+            unseen: Counter[int] = Counter()
+            for posting in postings[probed:scanned]:
+                unseen.update(posting)
+            for name_id in counts:
+                unseen.pop(name_id, None)
+
+            # the remaining lists are only used to complete the counts of these names
+            found = set(unseen)
+            for posting in postings[scanned:]:
+                unseen.update(found.intersection(posting))
+
+            candidates = {
+                name_id: count for name_id, count in unseen.items() if count >= needed
+            }
+            self._score(candidates, [], size, k, min_score, best)
+
+        return [
+            Match(self._names[-neg_id], score)
+            for score, neg_id in sorted(best, reverse=True)
+        ]
+
+    def _score(
+        self,
+        counts: Mapping[int, int],
+        remaining: list[list[int]],
+        size: int,
+        k: int,
+        min_score: float,
+        best: list[tuple[float, int]],
+    ) -> None:
+        # Scores the names in counts (how many query trigrams they were found with)
+        # into the best matches, completing their counts from the posting lists that
+        # were not counted. A name is dropped as soon as it cannot beat the best.
+        sizes = self._sizes
+
+        if remaining and len(counts) * len(remaining) * _BISECT_COST > sum(
+            map(len, remaining)
+        ):
+            # cheaper to read the remaining lists in full for these names than to
+            # look each name up in them
+            counts = Counter(counts)
+            found = set(counts)
+            for posting in remaining:
+                counts.update(found.intersection(posting))
+            remaining = []
+
+        if not remaining:
+            # A score is at most count / size, so the names found with fewer
+            # trigrams than the bar requires are skipped without scoring them. The
+            # names found with the most trigrams raise the bar beforehand.
+            bar = best[0][0] if len(best) == k else min_score
+            if len(counts) > k:
+                top = heapq.nlargest(k, counts.items(), key=itemgetter(1))
+                bar = max(
+                    bar,
+                    min(
+                        count / (size + sizes[name_id] - count)
+                        for name_id, count in top
+                    ),
+                )
+
+            least = bar * size
+            scores = (
+                (count / (size + sizes[name_id] - count), -name_id)
+                for name_id, count in counts.items()
+                if count >= least
+            )
+            best[:] = heapq.nlargest(
+                k, chain(best, (item for item in scores if item[0] >= min_score))
+            )
+            heapq.heapify(best)
+            return
+
+        # the names found with the most trigrams first, to raise the bar quickly
+        for name_id, count in sorted(counts.items(), key=itemgetter(1), reverse=True):
+            full = len(best) == k
+            bar = best[0][0] if full else min_score
+            possible = count + len(remaining)
+
+            # a score is at most possible / size, and the names left have been found
+            # with at most as many trigrams as this one
+            bound = min(possible, size) / size
+            if bound < bar or (full and bound <= bar):
+                break
+
+            other = sizes[name_id]
+
+            for posting in remaining:
+                shared = min(possible, other, size)
+                bound = shared / (size + other - shared)
+                if bound < bar or (full and bound <= bar):
+                    break
+
+                idx = bisect_left(posting, name_id)
+                if idx < len(posting) and posting[idx] == name_id:
+                    count += 1
+                else:
+                    possible -= 1
+            else:
+                score = count / (size + other - count)
+                if score < min_score:
+                    continue
+
+                if not full:
+                    heapq.heappush(best, (score, -name_id))
+                elif (score, -name_id) > best[0]:
+                    heapq.heapreplace(best, (score, -name_id))
+
+    def to_json(self) -> dict[str, Any]:
+        """Serializes the index into a JSON-compatible dictionary.
+
+        The posting lists are stored alongside the names so that loading the index
+        with :meth:`.from_json` does not need to compute trigrams again.
+        """
+
+        return {"names": self._names, "sizes": self._sizes, "postings": self._postings}
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> NameIndex:
+        """Loads an index serialized with :meth:`.to_json`."""
+
+        index = cls()
+        index._names = list(data["names"])
+        index._ids = {name: name_id for name_id, name in enumerate(index._names)}
+        index._sizes = list(data["sizes"])
+        index._postings = {gram: list(ids) for gram, ids in data["postings"].items()}
+        return index
+
+    @classmethod
+    def from_index_page(cls, page: IndexPage) -> NameIndex:
+        """Creates an index of the projects in an index page returned by
+        :meth:`~pypiwrap.client.SimpleRepoClient.get_index_page`."""
+        return cls(page.projects)
@@ -0,0 +1,387 @@
+"""An incremental parser for the HTML form of the Simple Repository API.
+
+Some repositories (such as older mirrors and caching proxies) only serve the HTML
+form of the API described by PEP 503. These pages are parsed from an iterable of
+chunks as they are received, producing the same :class:`.IndexPage` and
+:class:`.ProjectPage` objects as the JSON form (PEP 691). The
+:class:`~pypiwrap.client.SimpleRepoClient` falls back to this parser when a host
+responds with HTML.
+
+Example::
+
+    with open("requests.html", "rb") as fp:
+        page = parse_project_page(fp, "requests", "https://example.org/simple/requests/")
+
+The HTML form does not include file sizes or upload times, so these are None in the
+files returned. The versions of a project page are derived from the filenames of its
+files if the ``packaging`` library is installed, otherwise they are left empty.
+
+.. versionadded:: 2.1.0
+"""
+
+from __future__ import annotations
+
+import codecs
+import html
+import re
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Callable
+from urllib.parse import unquote, urljoin
+
+from .interning import current_pool
+from .utils import normalize_name
+
+if TYPE_CHECKING:
+    from .objects.simple_repo import IndexPage, Meta, ProjectPage
+
+# the version assumed when a page does not declare one (see PEP 629)
+DEFAULT_REPOSITORY_VERSION = "1.0"
+
+
+def charset_from_content_type(content_type: str | None) -> str | None:
+    """Returns the ``charset`` parameter of a Content-Type header, if any."""
+
+    if not content_type:
+        return None
+
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "charset":
+            return value.strip().strip("\"'") or None
+
+    return None
+
+
+def is_html_content_type(content_type: str | None) -> bool:
+    """Checks whether a Content-Type header denotes an HTML response, either
+    ``text/html`` or a versioned Simple API type such as
+    ``application/vnd.pypi.simple.v1+html``."""
+
+    if not content_type:
+        return False
+
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type == "text/html" or media_type.endswith("+html")
+
+
+def _decode(chunks: Iterable[bytes], encoding: str | None) -> Iterable[str]:
+    try:
+        decoder = codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    for chunk in chunks:
+        if chunk:
+            yield decoder.decode(chunk)
+
+    yield decoder.decode(b"", final=True)
+
+
+_ATTRIBUTES = r"([^>\"']*(?:(?:\"[^\"]*\"|'[^']*')[^>\"']*)*)"
+
+# The tags used by the Simple Repository API: an anchor along with its text, a meta
+# or base tag, or a comment (possibly unterminated at the end of the buffer). Other
+# tags are skipped over by the search itself. Attribute values may contain '>'.
+_TOKEN = re.compile(
+    r"<!--.*?(?:-->|\Z)"
+    rf"|<a\b{_ATTRIBUTES}>([^<]*(?:<(?!/?a\b)[^<]*)*)</a\s*>"
+    rf"|<(meta|base)\b{_ATTRIBUTES}>",
+    re.DOTALL | re.IGNORECASE,
+)
+_ATTRIBUTE = re.compile(r"([^\s=/>\"']+)(\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s>]+)))?")
+_OPENED = re.compile(r"<(?:a\b|!--)", re.IGNORECASE)
+_MARKUP = re.compile(r"<[^>]*>")
+# the leading "." and ".." segments of a relative URL
+_RELATIVE_PREFIX = re.compile(r"(?:\.\.?/)*")
+
+
+def _parse_attributes(text: str) -> dict[str, str | None]:
+    attributes: dict[str, str | None] = {}
+
+    for name, assignment, double, single, bare in _ATTRIBUTE.findall(text):
+        # attributes without a value (such as a bare data-yanked) are None
+        value = (double or single or bare) if assignment else None
+        if value and "&" in value:
+            value = html.unescape(value)
+
+        attributes.setdefault(name.lower(), value)
+
+    return attributes
+
+
+class _LinkParser:
+    """Scans a page incrementally, collecting its ``pypi:*`` meta tags and passing
+    each of its anchors (with their attributes and text) to ``on_link``.
+
+    Only the few tags used by the Simple Repository API are interpreted, which is
+    considerably faster than a general purpose parser such as
+    :class:`html.parser.HTMLParser` on pages with many links.
+    """
+
+    def __init__(
+        self, url: str, on_link: Callable[[dict[str, str | None], str], None]
+    ) -> None:
+        self.base_url = url
+        self.meta: dict[str, list[str]] = {}
+        self.on_link = on_link
+
+        self._buffer = ""
+        self._prefixes: dict[str, str] = {}
+
+    def feed(self, data: str, final: bool = False) -> None:
+        """Scans ``data``, keeping any incomplete tag at its end for the next call."""
+
+        buffer = self._buffer + data if self._buffer else data
+        pos = 0
+
+        for match in _TOKEN.finditer(buffer):
+            anchor, text, tag, attributes = match.groups()
+
+            if anchor is not None:
+                if "<" in text:
+                    text = _MARKUP.sub("", text)
+                if "&" in text:
+                    text = html.unescape(text)
+                self.on_link(_parse_attributes(anchor), text.strip())
+            elif tag is not None:
+                self._handle_tag(tag.lower(), attributes)
+            elif not match.group().endswith("-->"):
+                # an unterminated comment, which may end in the next chunk
+                break
+
+            pos = match.end()
+
+        if final:
+            self._buffer = ""
+            return
+
+        # keep what may be the start of a token completed by the next chunk: an
+        # anchor or comment still open, or else a tag cut at its last "<"
+        opened = _OPENED.search(buffer, pos)
+        rest = opened.start() if opened is not None else buffer.rfind("<", pos)
+        self._buffer = buffer[rest:] if rest >= 0 else ""
+
+    def _handle_tag(self, tag: str, attributes: str) -> None:
+        values = _parse_attributes(attributes)
+
+        if tag == "meta":
+            name, content = values.get("name"), values.get("content")
+            if name and name.startswith("pypi:") and content is not None:
+                self.meta.setdefault(name, []).append(content)
+        elif tag == "base" and values.get("href"):
+            self.base_url = urljoin(self.base_url, values["href"])  # type: ignore[arg-type]
+            self._prefixes.clear()
+
+    def parse(self, chunks: Iterable[bytes], encoding: str | None) -> None:
+        for text in _decode(chunks, encoding):
+            self.feed(text)
+        self.feed("", final=True)
+
+    def resolve(self, href: str) -> str:
+        """Resolves ``href`` against the URL of the page."""
+
+        if href.startswith(("https://", "http://")):
+            return href
+
+        # Links on a page usually share a few relative prefixes (such as
+        # "../../packages/"), so only these are resolved and their result reused.
+        # Anything unusual is resolved in full.
+        prefix = _RELATIVE_PREFIX.match(href).group()  # type: ignore[union-attr]
+        path = href[len(prefix) :]
+        if (
+            path.startswith(("/", ".", "?", "#"))
+            or ":" in path.split("/", 1)[0]
+            or "/." in path
+        ):
+            return urljoin(self.base_url, href)
+
+        base = self._prefixes.get(prefix)
+        if base is None:
+            base = self._prefixes[prefix] = urljoin(self.base_url, prefix or ".")
+
+        return base + path
+
+    def build_meta(self) -> Meta:
+        from .objects.simple_repo import Meta
+
+        def first(name: str) -> str | None:
+            values = self.meta.get(name)
+            return values[0] if values else None
+
+        data: dict[str, Any] = {
+            "api-version": first("pypi:repository-version")
+            or DEFAULT_REPOSITORY_VERSION,
+            "tracks": self.meta.get("pypi:tracks", []),
+        }
+
+        status = first("pypi:project-status")
+        if status is not None:
+            data["project-status"] = status
+            data["project-status-reason"] = first("pypi:project-status-reason")
+
+        return Meta.from_json(data)
+
+
+def _metadata_value(value: str | None) -> bool | dict[str, str]:
+    # PEP 658 & 714: either "true" or a "<hashname>=<hashvalue>" pair
+    if value is None:
+        return True
+
+    name, sep, digest = value.partition("=")
+    if sep:
+        return {name: digest}
+
+    return value.strip().lower() != "false"
+
+
+def _file_fields(
+    parser: _LinkParser, anchor: dict[str, str | None], text: str
+) -> dict[str, Any]:
+    """Returns the fields of the :class:`.DistributionFile` an anchor refers to."""
+
+    url, _, fragment = parser.resolve(anchor["href"] or "").partition("#")
+    hash_name, sep, digest = fragment.partition("=")
+
+    fields: dict[str, Any] = {
+        "filename": text or unquote(url.rstrip("/").rpartition("/")[2]),
+        "url": url,
+        "size": None,
+        "hashes": {hash_name: digest} if sep else {},
+        "requires_python": anchor.get("data-requires-python") or None,
+        "yanked": False,
+    }
+
+    if "data-yanked" in anchor:
+        # an empty value means the file was yanked without a reason
+        fields["yanked"] = anchor["data-yanked"] or True
+
+    if "data-core-metadata" in anchor:
+        fields["core_metadata"] = _metadata_value(anchor["data-core-metadata"])
+    if "data-dist-info-metadata" in anchor:
+        fields["dist_info_metadata"] = _metadata_value(
+            anchor["data-dist-info-metadata"]
+        )
+
+    provenance = anchor.get("data-provenance")
+    if provenance:
+        fields["provenance_url"] = parser.resolve(provenance)
+
+    gpg_sig = anchor.get("data-gpg-sig")
+    if gpg_sig is not None:
+        fields["has_gpg_sig"] = gpg_sig.strip().lower() == "true"
+
+    return fields
+
+
+def _versions_from_files(name: str, filenames: Iterable[str]) -> list[str]:
+    try:
+        from .versions import parse_version, version_from_filename
+    except ImportError:
+        return []
+
+    versions: dict[str, None] = {}
+    for filename in filenames:
+        parts = filename.split("-")
+        if filename.endswith(".whl") and len(parts) in (5, 6):
+            # {name}-{version}(-{build})?-{python}-{abi}-{platform}.whl, taken
+            # directly as parsing the tags is by far the slowest part
+            version: str | None = parts[1]
+        else:
+            version = version_from_filename(filename, name)
+
+        if not version:
+            continue
+
+        # filenames may spell a version differently (such as 1.0_RC1 in a wheel),
+        # so valid versions are normalized as in the JSON form of the page
+        parsed = parse_version(version)
+        versions[str(parsed) if parsed is not None else version] = None
+
+    return list(versions)
+
+
+def parse_project_page(
+    chunks: Iterable[bytes], name: str, url: str, encoding: str | None = None
+) -> ProjectPage:
+    """Parses a project page in the HTML form of the Simple Repository API.
+
+    Distribution files are created as their anchors are parsed, so the whole page is
+    never held in memory at once.
+
+    Arguments:
+        chunks (Iterable[bytes]):
+            The body of the page, such as the chunks of a streamed response or a file
+            opened in binary mode.
+
+        name (str):
+            The name of the project. The page itself does not include it.
+
+        url (str):
+            The URL of the page, used to resolve relative links.
+
+        encoding (str, optional):
+            The character encoding of the page. Defaults to UTF-8.
+    """
+
+    from .objects.simple_repo import (
+        DISTRIBUTION_FILE_INTERNED,
+        DistributionFile,
+        ProjectPage,
+    )
+
+    files: list[DistributionFile] = []
+    pool = current_pool()
+
+    def on_link(anchor: dict[str, str | None], text: str) -> None:
+        if not anchor.get("href"):
+            return
+
+        fields = _file_fields(parser, anchor, text)
+        if pool is not None:
+            pool.intern_fields(fields, DISTRIBUTION_FILE_INTERNED)
+
+        files.append(DistributionFile(**fields))
+
+    parser = _LinkParser(url, on_link)
+    parser.parse(chunks, encoding)
+
+    name = normalize_name(name)
+
+    return ProjectPage(
+        meta=parser.build_meta(),
+        name=name,
+        alternate_locations=parser.meta.get("pypi:alternate-locations", []),
+        versions=_versions_from_files(name, (pkg_file.filename for pkg_file in files)),
+        files=files,
+    )
+
+
+def parse_index_page(
+    chunks: Iterable[bytes], url: str, encoding: str | None = None
+) -> IndexPage:
+    """Parses the index page in the HTML form of the Simple Repository API.
+
+    Arguments:
+        chunks (Iterable[bytes]):
+            The body of the page, such as the chunks of a streamed response or a file
+            opened in binary mode.
+
+        url (str):
+            The URL of the page.
+
+        encoding (str, optional):
+            The character encoding of the page. Defaults to UTF-8.
+    """
+
+    from .objects.simple_repo import IndexPage
+
+    projects: list[str] = []
+
+    def on_link(anchor: dict[str, str | None], text: str) -> None:
+        if text:
+            projects.append(text)
+
+    parser = _LinkParser(url, on_link)
+    parser.parse(chunks, encoding)
+
+    return IndexPage(meta=parser.build_meta(), projects=projects)
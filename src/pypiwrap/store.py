@@ -0,0 +1,766 @@
+"""A local SQLite store for project metadata.
+
+:class:`MetadataStore` persists :class:`~pypiwrap.objects.pypi.Project` and
+:class:`~pypiwrap.objects.simple_repo.ProjectPage` objects into indexed tables so that
+crawled metadata can be queried without parsing JSON again. Queries return model
+objects.
+
+Example::
+
+    with MetadataStore("metadata.db") as store:
+        store.add_projects(projects)
+        store.find_projects(classifier="License :: OSI Approved :: MIT License")
+
+.. versionadded:: 2.1.0
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from datetime import datetime
+from itertools import islice
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .objects.pypi import Project, ReleaseFile, Vulnerability
+from .objects.simple_repo import DistributionFile, Meta, ProjectPage, ProjectStatus
+from .utils import Size, normalize_name
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+T = TypeVar("T")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    display_name TEXT NOT NULL,
+    author TEXT,
+    author_email TEXT,
+    description TEXT,
+    description_content_type TEXT,
+    keywords TEXT,
+    license TEXT,
+    license_expression TEXT,
+    maintainer TEXT,
+    maintainer_email TEXT,
+    platform TEXT,
+    project_url TEXT,
+    release_url TEXT,
+    requires_python TEXT,
+    summary TEXT,
+    yanked INTEGER,
+    yanked_reason TEXT,
+    last_serial INTEGER,
+    dynamic TEXT,
+    license_files TEXT,
+    project_urls TEXT,
+    provides_extra TEXT,
+    requires_dist TEXT,
+    updated REAL NOT NULL,
+    PRIMARY KEY (name, version)
+);
+CREATE INDEX IF NOT EXISTS projects_license ON projects (license);
+CREATE INDEX IF NOT EXISTS projects_license_expression ON projects (license_expression);
+CREATE INDEX IF NOT EXISTS projects_requires_python ON projects (requires_python);
+
+CREATE TABLE IF NOT EXISTS classifiers (
+    name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    classifier TEXT NOT NULL,
+    PRIMARY KEY (name, version, classifier)
+);
+CREATE INDEX IF NOT EXISTS classifiers_classifier ON classifiers (classifier);
+
+CREATE TABLE IF NOT EXISTS release_files (
+    name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    digests TEXT,
+    package_type TEXT,
+    python_version TEXT,
+    requires_python TEXT,
+    size INTEGER,
+    upload_time TEXT,
+    upload_time_tz TEXT,
+    url TEXT,
+    yanked INTEGER,
+    yanked_reason TEXT,
+    PRIMARY KEY (name, version, filename)
+);
+
+CREATE TABLE IF NOT EXISTS vulnerabilities (
+    name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    id TEXT NOT NULL,
+    aliases TEXT,
+    details TEXT,
+    fixed_in TEXT,
+    link TEXT,
+    source TEXT,
+    summary TEXT,
+    withdrawn TEXT,
+    PRIMARY KEY (name, version, id)
+);
+CREATE INDEX IF NOT EXISTS vulnerabilities_id ON vulnerabilities (id);
+
+CREATE TABLE IF NOT EXISTS project_pages (
+    name TEXT NOT NULL PRIMARY KEY,
+    display_name TEXT NOT NULL,
+    api_version TEXT,
+    tracks TEXT,
+    project_status TEXT,
+    project_status_reason TEXT,
+    alternate_locations TEXT,
+    versions TEXT,
+    updated REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS distribution_files (
+    name TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    url TEXT,
+    size INTEGER,
+    hashes TEXT,
+    upload_time TEXT,
+    requires_python TEXT,
+    core_metadata TEXT,
+    dist_info_metadata TEXT,
+    provenance_url TEXT,
+    has_gpg_sig INTEGER,
+    yanked TEXT,
+    PRIMARY KEY (name, filename)
+);
+"""
+
+PROJECT_COLUMNS = (
+    "author",
+    "author_email",
+    "description",
+    "description_content_type",
+    "keywords",
+    "license",
+    "license_expression",
+    "maintainer",
+    "maintainer_email",
+    "platform",
+    "project_url",
+    "release_url",
+    "requires_python",
+    "summary",
+    "yanked",
+    "yanked_reason",
+    "last_serial",
+)
+"""The project fields stored as is."""
+
+PROJECT_JSON_COLUMNS = (
+    "dynamic",
+    "license_files",
+    "project_urls",
+    "provides_extra",
+    "requires_dist",
+)
+"""The project fields stored as JSON."""
+
+FILTER_COLUMNS = ("name", "version", *PROJECT_COLUMNS)
+"""The columns that :meth:`.MetadataStore.find_projects` can filter on."""
+
+
+def _upsert(table: str, columns: Sequence[str], key: Sequence[str]) -> str:
+    updates = ", ".join(
+        f"{column} = excluded.{column}" for column in columns if column not in key
+    )
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' * len(columns))}) "
+        f"ON CONFLICT ({', '.join(key)}) DO UPDATE SET {updates}"
+    )
+
+
+def _batched(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _dumps(value: Any) -> str | None:
+    return None if value is None else json.dumps(value)
+
+
+def _loads(value: str | None) -> Any:
+    return None if value is None else json.loads(value)
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    return None if value is None else value.isoformat()
+
+
+def _fromisoformat(value: str | None) -> datetime | None:
+    return None if value is None else datetime.fromisoformat(value)
+
+
+def _latest_version(versions: Sequence[str]) -> str:
+    # The highest of the stored versions, preferring final releases as PyPI does.
+    # Without packaging, or if no version is valid, the last stored is returned.
+    try:
+        from .versions import parse_version
+    except ImportError:
+        return versions[-1]
+
+    parsed = [
+        (not version.is_prerelease, version, idx)
+        for idx, version in enumerate(map(parse_version, versions))
+        if version is not None
+    ]
+
+    return versions[max(parsed)[2]] if parsed else versions[-1]
+
+
+class MetadataStore:
+    """A SQLite database of project metadata.
+
+    Projects are stored per release, keyed by their normalized name and version.
+    Storing a release or project page that was stored before replaces it, including
+    its files and vulnerabilities.
+
+    Arguments:
+        path (str | PathLike[str], optional):
+            The path to the database file. Defaults to an in-memory database.
+
+        batch_size (int, optional):
+            The amount of objects written per transaction. Defaults to 1000.
+    """
+
+    def __init__(
+        self, path: str | PathLike[str] = ":memory:", *, batch_size: int = 1000
+    ) -> None:
+        self.path = path
+        self.batch_size = batch_size
+
+        self.connection = sqlite3.connect(path)
+        """The underlying SQLite connection."""
+
+        self.connection.row_factory = sqlite3.Row
+
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self.connection.close()
+
+    def add_projects(self, projects: Iterable[Project]) -> int:
+        """Stores ``projects`` and returns the amount of releases stored.
+
+        Projects are written in transactions of :attr:`batch_size` releases, so
+        ``projects`` may be a lazy iterable such as the results of
+        :meth:`.BulkParser.parse`. Projects parsed with a ``fields`` projection are
+        stored with the fields left out as None.
+
+        Raises:
+            ValueError: A project has no name or version, for example, because its
+                projection left them out. The batches before it remain stored.
+        """
+
+        project_sql = _upsert(
+            "projects",
+            (
+                "name",
+                "version",
+                "display_name",
+                *PROJECT_COLUMNS,
+                *PROJECT_JSON_COLUMNS,
+                "updated",
+            ),
+            ("name", "version"),
+        )
+        file_sql = _upsert(
+            "release_files",
+            (
+                "name",
+                "version",
+                "filename",
+                "digests",
+                "package_type",
+                "python_version",
+                "requires_python",
+                "size",
+                "upload_time",
+                "upload_time_tz",
+                "url",
+                "yanked",
+                "yanked_reason",
+            ),
+            ("name", "version", "filename"),
+        )
+        vuln_sql = _upsert(
+            "vulnerabilities",
+            (
+                "name",
+                "version",
+                "id",
+                "aliases",
+                "details",
+                "fixed_in",
+                "link",
+                "source",
+                "summary",
+                "withdrawn",
+            ),
+            ("name", "version", "id"),
+        )
+
+        total = 0
+        for batch in _batched(projects, self.batch_size):
+            now = time.time()
+            for project in batch:
+                project.require_fields("name", "version")
+                if project.name is None or project.version is None:
+                    raise ValueError(
+                        f"Project {project.name!r} cannot be stored without a name "
+                        "and version."
+                    )
+
+            keys = [
+                (normalize_name(project.name), project.version) for project in batch
+            ]
+
+            project_rows = []
+            classifier_rows = []
+            file_rows = []
+            vuln_rows = []
+
+            for (name, version), project in zip(keys, batch):
+                project_rows.append(
+                    (
+                        name,
+                        version,
+                        project.name,
+                        *(getattr(project, column) for column in PROJECT_COLUMNS),
+                        *(
+                            _dumps(getattr(project, column))
+                            for column in PROJECT_JSON_COLUMNS
+                        ),
+                        now,
+                    )
+                )
+                classifier_rows.extend(
+                    (name, version, classifier)
+                    for classifier in project.classifiers or []
+                )
+                file_rows.extend(
+                    (
+                        name,
+                        version,
+                        item.filename,
+                        _dumps(item.digests),
+                        item.package_type,
+                        item.python_version,
+                        item.requires_python,
+                        item.size.bytes,
+                        _isoformat(item.upload_time),
+                        _isoformat(item.upload_time_tz),
+                        item.url,
+                        item.yanked,
+                        item.yanked_reason,
+                    )
+                    for item in project.file_urls or []
+                )
+                vuln_rows.extend(
+                    (
+                        name,
+                        version,
+                        vuln.id,
+                        _dumps(vuln.aliases),
+                        vuln.details,
+                        _dumps(vuln.fixed_in),
+                        vuln.link,
+                        vuln.source,
+                        vuln.summary,
+                        _isoformat(vuln.withdrawn),
+                    )
+                    for vuln in project.vulnerabilities or []
+                )
+
+            with self.connection as conn:
+                conn.executemany(project_sql, project_rows)
+                for table in ("classifiers", "release_files", "vulnerabilities"):
+                    conn.executemany(
+                        f"DELETE FROM {table} WHERE name = ? AND version = ?", keys
+                    )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO classifiers VALUES (?, ?, ?)",
+                    classifier_rows,
+                )
+                conn.executemany(file_sql, file_rows)
+                conn.executemany(vuln_sql, vuln_rows)
+
+            total += len(batch)
+
+        return total
+
+    def add_project_pages(self, pages: Iterable[ProjectPage]) -> int:
+        """Stores project ``pages`` and returns the amount of pages stored.
+
+        Pages are written in transactions of :attr:`batch_size` pages.
+        """
+
+        page_sql = _upsert(
+            "project_pages",
+            (
+                "name",
+                "display_name",
+                "api_version",
+                "tracks",
+                "project_status",
+                "project_status_reason",
+                "alternate_locations",
+                "versions",
+                "updated",
+            ),
+            ("name",),
+        )
+        file_sql = _upsert(
+            "distribution_files",
+            (
+                "name",
+                "filename",
+                "url",
+                "size",
+                "hashes",
+                "upload_time",
+                "requires_python",
+                "core_metadata",
+                "dist_info_metadata",
+                "provenance_url",
+                "has_gpg_sig",
+                "yanked",
+            ),
+            ("name", "filename"),
+        )
+
+        total = 0
+        for batch in _batched(pages, self.batch_size):
+            now = time.time()
+            names = [normalize_name(page.name) for page in batch]
+
+            page_rows = []
+            file_rows = []
+
+            for name, page in zip(names, batch):
+                page_rows.append(
+                    (
+                        name,
+                        page.name,
+                        page.meta.api_version,
+                        _dumps(page.meta.tracks),
+                        page.meta.project_status.value,
+                        page.meta.project_status_reason,
+                        _dumps(page.alternate_locations),
+                        _dumps(page.versions),
+                        now,
+                    )
+                )
+                file_rows.extend(
+                    (
+                        name,
+                        item.filename,
+                        item.url,
+                        item.size.bytes if item.size is not None else None,
+                        _dumps(item.hashes),
+                        _isoformat(item.upload_time),
+                        item.requires_python,
+                        _dumps(item.core_metadata),
+                        _dumps(item.dist_info_metadata),
+                        item.provenance_url,
+                        item.has_gpg_sig,
+                        _dumps(item.yanked),
+                    )
+                    for item in page.files
+                )
+
+            with self.connection as conn:
+                conn.executemany(page_sql, page_rows)
+                conn.executemany(
+                    "DELETE FROM distribution_files WHERE name = ?",
+                    [(name,) for name in names],
+                )
+                conn.executemany(file_sql, file_rows)
+
+            total += len(batch)
+
+        return total
+
+    def _load_projects(self, where: str, params: Sequence[Any]) -> list[Project]:
+        # Children are loaded with one query per table for every matching release.
+        # The conditions in `where` are only built by this class, with every value
+        # passed in `params`.
+        selection = f"SELECT name, version FROM projects WHERE {where}"
+        conn = self.connection
+
+        rows = conn.execute(
+            f"SELECT * FROM projects WHERE {where} ORDER BY name, updated", params
+        ).fetchall()
+
+        classifiers: dict[tuple[str, str], list[str]] = {}
+        for row in conn.execute(
+            f"SELECT * FROM classifiers WHERE (name, version) IN ({selection})",
+            params,
+        ):
+            classifiers.setdefault((row["name"], row["version"]), []).append(
+                row["classifier"]
+            )
+
+        files: dict[tuple[str, str], list[ReleaseFile]] = {}
+        for row in conn.execute(
+            f"SELECT * FROM release_files WHERE (name, version) IN ({selection}) "
+            "ORDER BY rowid",
+            params,
+        ):
+            files.setdefault((row["name"], row["version"]), []).append(
+                ReleaseFile(
+                    digests=json.loads(row["digests"]),
+                    filename=row["filename"],
+                    package_type=row["package_type"],
+                    python_version=row["python_version"],
+                    requires_python=row["requires_python"],
+                    size=Size.from_int(row["size"]),
+                    upload_time=_fromisoformat(row["upload_time"]),
+                    upload_time_tz=_fromisoformat(row["upload_time_tz"]),
+                    url=row["url"],
+                    yanked=bool(row["yanked"]),
+                    yanked_reason=row["yanked_reason"],
+                )
+            )
+
+        vulns: dict[tuple[str, str], list[Vulnerability]] = {}
+        for row in conn.execute(
+            f"SELECT * FROM vulnerabilities WHERE (name, version) IN ({selection}) "
+            "ORDER BY rowid",
+            params,
+        ):
+            vulns.setdefault((row["name"], row["version"]), []).append(
+                Vulnerability(
+                    aliases=json.loads(row["aliases"]),
+                    details=row["details"],
+                    fixed_in=json.loads(row["fixed_in"]),
+                    id=row["id"],
+                    link=row["link"],
+                    source=row["source"],
+                    summary=row["summary"],
+                    withdrawn=_fromisoformat(row["withdrawn"]),
+                )
+            )
+
+        projects = []
+        for row in rows:
+            key = (row["name"], row["version"])
+            values = {column: row[column] for column in PROJECT_COLUMNS}
+            values.update(
+                (column, _loads(row[column])) for column in PROJECT_JSON_COLUMNS
+            )
+            values["yanked"] = (
+                bool(values["yanked"]) if values["yanked"] is not None else None
+            )
+
+            projects.append(
+                Project(
+                    **values,
+                    name=row["display_name"],
+                    version=row["version"],
+                    classifiers=classifiers.get(key, []),
+                    file_urls=files.get(key, []),
+                    vulnerabilities=vulns.get(key, []),
+                )
+            )
+
+        return projects
+
+    def get_project(self, name: str, version: str | None = None) -> Project | None:
+        """Returns the release ``version`` of project ``name`` or None if it is not
+        stored.
+
+        If no version is specified, the release with the highest version is returned,
+        preferring final releases over pre-releases. Versions are compared according
+        to PEP 440 if the ``packaging`` library is installed, otherwise the most
+        recently stored release is returned.
+        """
+
+        name = normalize_name(name)
+
+        if version is None:
+            versions = [
+                row["version"]
+                for row in self.connection.execute(
+                    "SELECT version FROM projects WHERE name = ? ORDER BY updated",
+                    (name,),
+                )
+            ]
+            if not versions:
+                return None
+
+            version = _latest_version(versions)
+
+        found = self._load_projects("name = ? AND version = ?", (name, version))
+        return found[0] if found else None
+
+    def find_projects(
+        self,
+        *,
+        license: str | None = None,
+        classifier: str | None = None,
+        vulnerability: str | None = None,
+        python_version: str | None = None,
+        columns: Mapping[str, Any] | None = None,
+    ) -> list[Project]:
+        """Returns the stored releases matching every filter specified.
+
+        Arguments:
+            license (str, optional):
+                A license name or SPDX license expression the release declares.
+
+            classifier (str, optional):
+                A classifier the release declares. If it ends with ``::``, releases
+                with any classifier starting with it match.
+
+            vulnerability (str, optional):
+                The identifier of a vulnerability affecting the release.
+
+            python_version (str, optional):
+                A Python version (such as ``3.8``) the release must support according
+                to its ``Requires-Python``. This requires the ``packaging`` library.
+
+            columns (Mapping[str, Any], optional):
+                Values that columns of the release must be equal to, for example,
+                ``{"requires_python": None}``. None matches a missing value. The
+                columns allowed are listed in :data:`FILTER_COLUMNS`.
+
+        Raises:
+            ValueError: A column is not in :data:`FILTER_COLUMNS`.
+        """
+
+        conditions = []
+        values: list[Any] = []
+
+        if license is not None:
+            conditions.append("(license = ? OR license_expression = ?)")
+            values += [license, license]
+
+        if classifier is not None:
+            operator = "GLOB" if classifier.endswith("::") else "="
+            conditions.append(
+                "EXISTS (SELECT 1 FROM classifiers AS c WHERE c.name = projects.name "
+                f"AND c.version = projects.version AND c.classifier {operator} ?)"
+            )
+            values.append(f"{classifier}*" if operator == "GLOB" else classifier)
+
+        if vulnerability is not None:
+            conditions.append(
+                "EXISTS (SELECT 1 FROM vulnerabilities AS v "
+                "WHERE v.name = projects.name AND v.version = projects.version "
+                "AND v.id = ?)"
+            )
+            values.append(vulnerability)
+
+        if python_version is not None:
+            from .versions import python_matches
+
+            # Releases share few distinct specifiers, which are read from their
+            # index and checked once each. Only the matching releases are loaded.
+            specifiers = [
+                row[0]
+                for row in self.connection.execute(
+                    "SELECT DISTINCT requires_python FROM projects "
+                    "WHERE requires_python IS NOT NULL"
+                )
+                if python_matches(row[0], python_version)
+            ]
+            conditions.append(
+                "(requires_python IS NULL "
+                "OR requires_python IN (SELECT value FROM json_each(?)))"
+            )
+            values.append(json.dumps(specifiers))
+
+        for column, value in (columns or {}).items():
+            if column not in FILTER_COLUMNS:
+                raise ValueError(
+                    f"Cannot filter on column {column!r}, expected one of: "
+                    f"{', '.join(FILTER_COLUMNS)}"
+                )
+
+            if value is None:
+                conditions.append(f"{column} IS NULL")
+            else:
+                conditions.append(f"{column} = ?")
+                values.append(normalize_name(value) if column == "name" else value)
+
+        return self._load_projects(" AND ".join(conditions) or "1", values)
+
+    def get_project_page(self, name: str) -> ProjectPage | None:
+        """Returns the project page of ``name`` or None if it is not stored."""
+
+        name = normalize_name(name)
+        row = self.connection.execute(
+            "SELECT * FROM project_pages WHERE name = ?", (name,)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        files = [
+            DistributionFile(
+                filename=item["filename"],
+                url=item["url"],
+                size=(
+                    Size.from_int(item["size"]) if item["size"] is not None else None
+                ),
+                hashes=json.loads(item["hashes"]),
+                upload_time=_fromisoformat(item["upload_time"]),
+                requires_python=item["requires_python"],
+                core_metadata=_loads(item["core_metadata"]),
+                dist_info_metadata=_loads(item["dist_info_metadata"]),
+                provenance_url=item["provenance_url"],
+                has_gpg_sig=(
+                    bool(item["has_gpg_sig"])
+                    if item["has_gpg_sig"] is not None
+                    else None
+                ),
+                yanked=_loads(item["yanked"]),
+            )
+            for item in self.connection.execute(
+                "SELECT * FROM distribution_files WHERE name = ? ORDER BY rowid",
+                (name,),
+            )
+        ]
+
+        return ProjectPage(
+            meta=Meta(
+                api_version=row["api_version"],
+                tracks=json.loads(row["tracks"]),
+                project_status=ProjectStatus(row["project_status"]),
+                project_status_reason=row["project_status_reason"],
+            ),
+            name=row["display_name"],
+            alternate_locations=json.loads(row["alternate_locations"]),
+            versions=json.loads(row["versions"]),
+            files=files,
+        )
+
+    def project_names(self) -> list[str]:
+        """Returns the normalized names of every project with a stored release or
+        project page."""
+
+        rows = self.connection.execute(
+            "SELECT name FROM projects UNION SELECT name FROM project_pages ORDER BY name"
+        )
+        return [row["name"] for row in rows]
@@ -0,0 +1,234 @@
+"""Utilities for selecting distribution files based on PEP 425 compatibility tags.
+
+.. versionadded:: 2.1.0
+
+.. note::
+    This module requires the ``packaging`` library which can be installed alongside
+    pypiwrap with ``pip install pypiwrap[packaging]``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, NamedTuple
+
+try:
+    from packaging.tags import Tag, parse_tag, sys_tags
+    from packaging.utils import InvalidWheelFilename, parse_wheel_filename
+    from packaging.version import InvalidVersion, Version
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "This feature requires the 'packaging' library. "
+        "Install it with 'pip install pypiwrap[packaging]'."
+    ) from exc
+
+from .versions import parse_version, version_from_filename
+
+if TYPE_CHECKING:
+    from .objects.simple_repo import DistributionFile, ProjectPage
+
+
+class TargetEnvironment:
+    """An environment that distribution files are selected for.
+
+    Arguments:
+        name (str):
+            A name identifying this environment (for example, "linux-x86_64-cp311").
+
+        tags (Iterable[Tag | str]):
+            The tags supported by this environment in order of preference, the most
+            preferred first. Strings are parsed as tags and may be compressed tag
+            sets (such as "py2.py3-none-any"), in which case all tags in the set
+            share the same preference.
+    """
+
+    def __init__(self, name: str, tags: Iterable[Tag | str]) -> None:
+        self.name = name
+        self.ranks: dict[Tag, int] = {}
+        """A mapping of supported tags to their preference (lower is better)."""
+
+        for rank, tag in enumerate(tags):
+            expanded = parse_tag(tag) if isinstance(tag, str) else (tag,)
+            for item in expanded:
+                self.ranks.setdefault(item, rank)
+
+        # ranks follow the positions in ``tags``, which may repeat or skip values
+        self._sdist_rank = max(self.ranks.values(), default=-1) + 1
+        self._rank_cache: dict[frozenset[Tag], int | None] = {}
+
+    def rank(self, tags: frozenset[Tag]) -> int | None:
+        """Returns the preference of the best tag in ``tags`` for this environment or
+        None if no tag is supported. An empty tag set (a source distribution) is ranked
+        after every supported tag."""
+
+        if not tags:
+            return self._sdist_rank
+
+        if tags not in self._rank_cache:
+            ranks = [self.ranks[tag] for tag in tags if tag in self.ranks]
+            self._rank_cache[tags] = min(ranks) if ranks else None
+
+        return self._rank_cache[tags]
+
+    @classmethod
+    def current(cls, name: str = "current") -> TargetEnvironment:
+        """Creates a target environment for the running interpreter."""
+        return cls(name, sys_tags())
+
+    def __repr__(self) -> str:
+        return f"<TargetEnvironment {self.name!r} tags={len(self.ranks)}>"
+
+
+class Candidate(NamedTuple):
+    """A distribution file compatible with a target environment."""
+
+    file: DistributionFile
+    """The distribution file."""
+
+    version: Version
+    """The version of the project this file belongs to."""
+
+    rank: int
+    """The preference of the best tag in this file for the target (lower is better).
+
+    Source distributions are ranked after every wheel.
+    """
+
+
+class TagIndex:
+    """An index of the compatibility tags of distribution files.
+
+    Filenames are parsed only once per index and the resulting tags are interned so
+    that files sharing the same tag set (e.g. ``py3-none-any``) share a single
+    object, which each :class:`.TargetEnvironment` ranks only once. An index can be
+    reused across many calls to :meth:`.select`.
+    """
+
+    def __init__(self) -> None:
+        self._tags: dict[Tag, Tag] = {}
+        self._tag_sets: dict[frozenset[Tag], frozenset[Tag]] = {}
+        self._parsed: dict[tuple[str, str], tuple[Version, frozenset[Tag]] | None] = {}
+
+    def __len__(self) -> int:
+        return len(self._parsed)
+
+    def _intern(self, tags: frozenset[Tag]) -> frozenset[Tag]:
+        interned = frozenset(self._tags.setdefault(tag, tag) for tag in tags)
+        return self._tag_sets.setdefault(interned, interned)
+
+    def parse(
+        self, filename: str, project: str
+    ) -> tuple[Version, frozenset[Tag]] | None:
+        """Parses the version and tags of ``filename`` belonging to ``project``.
+
+        Source distributions have an empty tag set. Returns None if the filename
+        cannot be parsed.
+        """
+
+        key = (project, filename)
+        if key in self._parsed:
+            return self._parsed[key]
+
+        result = None
+        if filename.endswith(".whl"):
+            try:
+                _, version, _, tags = parse_wheel_filename(filename)
+                result = (version, self._intern(tags))
+            except (InvalidWheelFilename, InvalidVersion):
+                pass
+        elif filename.endswith((".tar.gz", ".zip")):
+            raw_version = version_from_filename(filename, project)
+            version = parse_version(raw_version) if raw_version else None
+            if version is not None:
+                result = (version, self._intern(frozenset()))
+
+        self._parsed[key] = result
+        return result
+
+    def select(
+        self,
+        pages: Iterable[ProjectPage],
+        targets: Sequence[TargetEnvironment],
+        *,
+        prereleases: bool = False,
+        yanked: bool = False,
+        sdists: bool = False,
+    ) -> dict[str, dict[str, list[Candidate]]]:
+        """Selects the compatible files of each page for each target in a single pass.
+
+        Arguments:
+            pages (Iterable[ProjectPage]):
+                The project pages to select files from.
+
+            targets (Sequence[TargetEnvironment]):
+                The target environments. Target names should be unique.
+
+            prereleases (bool, optional):
+                Whether to include files for pre-releases. Defaults to False.
+
+            yanked (bool, optional):
+                Whether to include yanked files. Defaults to False.
+
+            sdists (bool, optional):
+                Whether to include source distributions as a fallback. Defaults
+                to False.
+
+        Returns:
+            A mapping of project names to a mapping of target names to candidates.
+            Candidates are ranked from best to worst: newest version first and, within
+            a version, the most preferred tag first.
+        """
+
+        result: dict[str, dict[str, list[Candidate]]] = {}
+
+        for page in pages:
+            by_target: dict[str, list[Candidate]] = {
+                target.name: [] for target in targets
+            }
+
+            for pkg_file in page.files:
+                if pkg_file.yanked and not yanked:
+                    continue
+
+                parsed = self.parse(pkg_file.filename, page.name)
+                if parsed is None:
+                    continue
+
+                version, tags = parsed
+                if (version.is_prerelease and not prereleases) or (
+                    not tags and not sdists
+                ):
+                    continue
+
+                for target in targets:
+                    rank = target.rank(tags)
+                    if rank is not None:
+                        by_target[target.name].append(
+                            Candidate(pkg_file, version, rank)
+                        )
+
+            for candidates in by_target.values():
+                candidates.sort(
+                    key=lambda item: (item.version, -item.rank), reverse=True
+                )
+
+            result[page.name] = by_target
+
+        return result
+
+    def best(
+        self,
+        pages: Iterable[ProjectPage],
+        targets: Sequence[TargetEnvironment],
+        **kwargs,
+    ) -> dict[str, dict[str, DistributionFile | None]]:
+        """Returns the best file of each page for each target or None if no file is
+        compatible. Accepts the same arguments as :meth:`.select`."""
+
+        return {
+            name: {
+                target: candidates[0].file if candidates else None
+                for target, candidates in by_target.items()
+            }
+            for name, by_target in self.select(pages, targets, **kwargs).items()
+        }
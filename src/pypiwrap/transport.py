@@ -0,0 +1,292 @@
+"""Transports used by the clients to perform HTTP requests.
+
+By default, clients use a :class:`RequestsTransport`. Custom transports can be passed
+to any client through its ``transport`` argument, for example, to tune connection
+pooling or to use an HTTP/2-capable backend such as :class:`HTTPXTransport`.
+
+.. versionadded:: 2.1.0
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, MutableMapping
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    import requests
+
+
+class Response(Protocol):
+    """The interface of a response returned by a transport.
+
+    This is a subset of the interface provided by :class:`requests.Response`.
+    """
+
+    @property
+    def ok(self) -> bool: ...
+
+    @property
+    def status_code(self) -> int: ...
+
+    @property
+    def reason(self) -> str: ...
+
+    @property
+    def headers(self) -> MutableMapping[str, str]: ...
+
+    @property
+    def content(self) -> bytes: ...
+
+    @property
+    def text(self) -> str: ...
+
+    def json(self) -> Any: ...
+
+
+class Transport(ABC):
+    """Base class for transports.
+
+    A transport is responsible for performing GET requests and keeping any underlying
+    connections alive. Subclasses must implement :meth:`.get` and should implement
+    :meth:`.close`.
+    """
+
+    headers: MutableMapping[str, str]
+    """The default headers sent with every request."""
+
+    errors: tuple[type[BaseException], ...] = (OSError,)
+    """The exceptions raised by :meth:`.get` when a request fails, such as connection
+    errors and timeouts. Bulk operations record these per item rather than aborting."""
+
+    @abstractmethod
+    def get(
+        self, url: str, *, headers: dict[str, str] | None = None, **kwargs: Any
+    ) -> Response:
+        """Performs a GET request to ``url`` and returns the response.
+
+        Arguments:
+            url (str):
+                The URL to request.
+
+            headers (dict[str, str], optional):
+                Headers to send in addition to (or replacing) :attr:`.headers`.
+
+            timeout (float | tuple[float, float], optional):
+                Clients pass the timeout of the request in seconds, either as a single
+                value or as a (connect, read) tuple, as a keyword argument.
+
+            stream (bool, optional):
+                Clients pass ``stream=True`` for responses that may be read in chunks.
+                Responses should then provide an ``iter_content(chunk_size)`` method
+                and a ``close()`` method releasing the connection. Transports may
+                ignore this argument, in which case the whole body is read at once.
+        """
+
+    def close(self) -> None:
+        """Closes any connections held by this transport."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_args) -> None:
+        self.close()
+
+
+class RequestsTransport(Transport):
+    """A transport backed by a :class:`requests.Session`.
+
+    Arguments:
+        pool_connections (int, optional):
+            The amount of hosts to keep a connection pool for. Defaults to 10.
+
+        pool_maxsize (int, optional):
+            The maximum amount of connections kept alive per host. This should be at
+            least the amount of concurrent requests made to a host, otherwise
+            connections are discarded rather than reused. Defaults to 10.
+
+        pool_block (bool, optional):
+            Whether to block when no connection is available for a host rather than
+            opening a new one, effectively limiting the concurrent connections per
+            host to ``pool_maxsize``. Defaults to False.
+
+        keep_alive (bool, optional):
+            Whether connections should be kept alive between requests. Defaults
+            to True.
+
+        max_retries (int, optional):
+            The maximum amount of retries for failed connections. Defaults to 0.
+
+        session (requests.Session, optional):
+            An existing session to use. If none specified, a new session is created.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        max_retries: int = 0,
+        session: requests.Session | None = None,
+    ) -> None:
+        # requests is imported here as it accounts for most of the import time
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.session = session if session is not None else requests.Session()
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=max_retries,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+        self.headers = self.session.headers
+        self.errors = (requests.RequestException,)
+
+    def get(
+        self, url: str, *, headers: dict[str, str] | None = None, **kwargs: Any
+    ) -> requests.Response:
+        return self.session.get(url, headers=headers, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class _HTTPXResponse:
+    """Adapts an :class:`httpx.Response` to the :class:`Response` interface."""
+
+    def __init__(self, response: Any) -> None:
+        self.raw = response
+
+    @property
+    def ok(self) -> bool:
+        return self.raw.is_success
+
+    @property
+    def status_code(self) -> int:
+        return self.raw.status_code
+
+    @property
+    def reason(self) -> str:
+        return self.raw.reason_phrase
+
+    @property
+    def headers(self) -> MutableMapping[str, str]:
+        return self.raw.headers
+
+    @property
+    def content(self) -> bytes:
+        # streamed responses are read when their content is first needed
+        return self.raw.read()
+
+    @property
+    def text(self) -> str:
+        self.raw.read()
+        return self.raw.text
+
+    @property
+    def url(self) -> str:
+        return str(self.raw.url)
+
+    @property
+    def history(self) -> list[Any]:
+        return self.raw.history
+
+    def json(self) -> Any:
+        self.raw.read()
+        return self.raw.json()
+
+    def iter_content(self, chunk_size: int | None = None) -> Iterator[bytes]:
+        return self.raw.iter_bytes(chunk_size)
+
+    def close(self) -> None:
+        self.raw.close()
+
+
+class HTTPXTransport(Transport):
+    """A transport backed by an :class:`httpx.Client` with optional HTTP/2 support.
+
+    With HTTP/2, many concurrent requests to the same host are multiplexed over a
+    single connection. Note that, unlike :class:`RequestsTransport`, connection limits
+    apply to all hosts combined.
+
+    .. note::
+        This transport requires the ``httpx`` library. Install it alongside pypiwrap
+        with ``pip install pypiwrap[http2]``.
+
+    Arguments:
+        http2 (bool, optional):
+            Whether to enable HTTP/2. Defaults to True.
+
+        max_connections (int, optional):
+            The maximum amount of concurrent connections. Defaults to 100.
+
+        max_keepalive_connections (int, optional):
+            The maximum amount of idle connections kept alive. Defaults to 20.
+
+        keepalive_expiry (float, optional):
+            The time in seconds an idle connection is kept alive. Defaults to 5.
+
+        client (httpx.Client, optional):
+            An existing client to use. If specified, the other arguments are ignored.
+    """
+
+    def __init__(
+        self,
+        *,
+        http2: bool = True,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        client: Any = None,
+    ) -> None:
+        try:
+            import httpx
+        except ImportError as exc:
+            raise ImportError(
+                "HTTPXTransport requires the 'httpx' library. "
+                "Install it with 'pip install pypiwrap[http2]'."
+            ) from exc
+
+        if client is None:
+            client = httpx.Client(
+                http2=http2,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=keepalive_expiry,
+                ),
+            )
+
+        self.client = client
+        self.headers = self.client.headers
+        self.errors = (httpx.HTTPError, httpx.StreamError)
+
+    def get(
+        self, url: str, *, headers: dict[str, str] | None = None, **kwargs: Any
+    ) -> Response:
+        timeout = kwargs.get("timeout")
+        if isinstance(timeout, tuple):
+            import httpx
+
+            connect, read = timeout
+            kwargs["timeout"] = httpx.Timeout(read, connect=connect)
+
+        if kwargs.pop("stream", False):
+            request = self.client.build_request("GET", url, headers=headers, **kwargs)
+            return _HTTPXResponse(self.client.send(request, stream=True))
+
+        return _HTTPXResponse(self.client.get(url, headers=headers, **kwargs))
+
+    def close(self) -> None:
+        self.client.close()
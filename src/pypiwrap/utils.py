@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import dataclasses
+import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Literal, NamedTuple
 
 SI_SUFFIXES = ["B", "KB", "MB", "GB", "TB"]
 IEC_SUFFIXES = ["B", "KiB", "MiB", "GiB", "TiB"]
 
+NAME_SEPARATORS = re.compile(r"[-_.]+")
+PROJECT_LINK = re.compile(r"/project/([^/]+)(?:/([^/]+))?/?$")
+
 
 class Size(NamedTuple):
     """A tuple that includes human-readable representations of a file size."""
@@ -81,3 +86,39 @@ def remove_additional(cls: type[Any], data: dict[str, Any]) -> dict[str, Any]:
             result.pop(key)
 
     return result
+
+
+@lru_cache(maxsize=16384)
+def normalize_name(name: str) -> str:
+    """Normalizes a project ``name`` as specified by PEP 503 (for example,
+    ``Flask_SQLAlchemy`` becomes ``flask-sqlalchemy``).
+
+    Results are memoized as the same names tend to be normalized repeatedly.
+
+    .. versionadded:: 2.1.0
+    """
+
+    return NAME_SEPARATORS.sub("-", name).lower()
+
+
+def name_from_link(link: str) -> str | None:
+    """Returns the project name in a link to a PyPI project or release (such as
+    ``https://pypi.org/project/pypiwrap/`` or ``https://pypi.org/project/pypiwrap/2.0.0/``)
+    or None if it is not such a link. These links are found in the RSS feeds.
+
+    .. versionadded:: 2.1.0
+    """
+
+    match = PROJECT_LINK.search(link)
+    return match.group(1) if match else None
+
+
+def release_from_link(link: str) -> tuple[str, str | None] | None:
+    """Returns the project name and version in a link to a PyPI project or release,
+    or None if it is not such a link. The version is None for links to a project.
+
+    .. versionadded:: 2.1.0
+    """
+
+    match = PROJECT_LINK.search(link)
+    return (match.group(1), match.group(2)) if match else None
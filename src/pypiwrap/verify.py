@@ -0,0 +1,220 @@
+"""Verification of local distribution files against their published hashes.
+
+Local files are matched to the files published in a repository by filename, either
+:class:`~pypiwrap.objects.simple_repo.DistributionFile` objects from a project page
+or :class:`~pypiwrap.objects.pypi.ReleaseFile` objects from a project. Files are
+memory-mapped and hashed in a thread pool. As :mod:`hashlib` releases the GIL while
+hashing large buffers, verification is bound by I/O rather than by a single core.
+
+Example::
+
+    with SimpleRepoClient() as client:
+        page = client.get_project_page("requests")
+
+    report = verify_directory("wheelhouse/", page.files)
+
+.. versionadded:: 2.1.0
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple, Union
+
+if TYPE_CHECKING:
+    from .objects.pypi import ReleaseFile
+    from .objects.simple_repo import DistributionFile
+
+    PublishedFile = Union[DistributionFile, ReleaseFile]
+
+ALGORITHMS = (
+    "sha512",
+    "sha3_512",
+    "blake2b",
+    "sha384",
+    "sha3_384",
+    "sha3_256",
+    "blake2b_256",
+    "sha256",
+    "sha224",
+    "sha1",
+    "md5",
+)
+"""The hash algorithms supported for verification, from strongest to weakest.
+
+``blake2b_256`` refers to BLAKE2b with a digest size of 32 bytes, as published by
+PyPI.
+"""
+
+DISTRIBUTION_SUFFIXES = (".whl", ".tar.gz", ".zip", ".tar.bz2", ".tgz", ".egg")
+"""The suffixes of the files considered by :func:`.verify_directory`."""
+
+
+def new_hash(algorithm: str) -> Any:
+    """Returns a new hash object for ``algorithm``, one of :data:`.ALGORITHMS`."""
+
+    if algorithm == "blake2b_256":
+        return hashlib.blake2b(digest_size=32)
+    return hashlib.new(algorithm)
+
+
+def strongest_algorithm(hashes: Mapping[str, str]) -> str | None:
+    """Returns the strongest algorithm in ``hashes`` (a mapping of hash names to
+    digests) or None if no algorithm is supported."""
+
+    return next((name for name in ALGORITHMS if hashes.get(name)), None)
+
+
+def hash_file(path: str | os.PathLike[str], algorithm: str) -> str:
+    """Returns the hex encoded ``algorithm`` digest of the file at ``path``.
+
+    The file is memory-mapped rather than read into memory.
+    """
+
+    hasher = new_hash(algorithm)
+
+    with open(path, "rb") as fp:
+        # empty files cannot be memory-mapped
+        if os.fstat(fp.fileno()).st_size > 0:
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hasher.update(mapped)
+
+    return hasher.hexdigest()
+
+
+def _published_hashes(pkg_file: PublishedFile) -> Mapping[str, str]:
+    hashes = getattr(pkg_file, "hashes", None)
+    return hashes if hashes is not None else pkg_file.digests  # type: ignore[union-attr]
+
+
+class Mismatch(NamedTuple):
+    """A local file whose digest differs from the published digest."""
+
+    path: Path
+    """The path to the local file."""
+
+    algorithm: str
+    """The hash algorithm used."""
+
+    expected: str
+    """The published digest."""
+
+    actual: str
+    """The digest of the local file."""
+
+
+@dataclass
+class VerificationReport:
+    """The result of verifying a set of local files."""
+
+    verified: list[Path] = field(default_factory=list)
+    """The files matching their published digest."""
+
+    mismatched: list[Mismatch] = field(default_factory=list)
+    """The files whose digest differs from the published digest."""
+
+    missing_upstream: list[Path] = field(default_factory=list)
+    """The files whose filename is not among the published files."""
+
+    unverifiable: list[Path] = field(default_factory=list)
+    """The files published without a digest in a supported algorithm."""
+
+    errors: dict[Path, OSError] = field(default_factory=dict)
+    """A mapping of files to the errors that occurred while reading them."""
+
+    @property
+    def ok(self) -> bool:
+        """Whether every file was verified."""
+        return not (
+            self.mismatched or self.missing_upstream or self.unverifiable or self.errors
+        )
+
+
+def verify_files(
+    paths: Iterable[str | os.PathLike[str]],
+    published: Iterable[PublishedFile],
+    *,
+    max_workers: int | None = None,
+) -> VerificationReport:
+    """Verifies local files against the digests of their published counterparts.
+
+    Each local file is matched to a published file by filename and hashed with the
+    strongest algorithm the published file has a digest for.
+
+    Arguments:
+        paths (Iterable[str | PathLike[str]]):
+            The paths to the local files.
+
+        published (Iterable[DistributionFile | ReleaseFile]):
+            The published files, for example, :attr:`.ProjectPage.files` or
+            :attr:`.Project.file_urls`. Files from several projects may be combined.
+
+        max_workers (int, optional):
+            The amount of threads hashing files. If none specified, the default of
+            :class:`~concurrent.futures.ThreadPoolExecutor` is used.
+    """
+
+    expected = {
+        pkg_file.filename: _published_hashes(pkg_file) for pkg_file in published
+    }
+    report = VerificationReport()
+    jobs: list[tuple[Path, str, str]] = []
+
+    for path in map(Path, paths):
+        hashes = expected.get(path.name)
+        if hashes is None:
+            report.missing_upstream.append(path)
+            continue
+
+        algorithm = strongest_algorithm(hashes)
+        if algorithm is None:
+            report.unverifiable.append(path)
+            continue
+
+        jobs.append((path, algorithm, hashes[algorithm].lower()))
+
+    def check(job: tuple[Path, str, str]) -> Mismatch | OSError | None:
+        path, algorithm, digest = job
+        try:
+            actual = hash_file(path, algorithm)
+        except OSError as exc:
+            return exc
+
+        return None if actual == digest else Mismatch(path, algorithm, digest, actual)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for (path, _, _), result in zip(jobs, executor.map(check, jobs)):
+            if result is None:
+                report.verified.append(path)
+            elif isinstance(result, Mismatch):
+                report.mismatched.append(result)
+            else:
+                report.errors[path] = result
+
+    return report
+
+
+def verify_directory(
+    directory: str | os.PathLike[str],
+    published: Iterable[PublishedFile],
+    *,
+    max_workers: int | None = None,
+) -> VerificationReport:
+    """Verifies the distribution files in ``directory`` (such as a wheelhouse)
+    against their published counterparts. See :func:`.verify_files` for details.
+
+    Only files ending in one of :data:`.DISTRIBUTION_SUFFIXES` are verified.
+    """
+
+    paths = sorted(
+        path
+        for path in Path(directory).iterdir()
+        if path.is_file() and path.name.endswith(DISTRIBUTION_SUFFIXES)
+    )
+    return verify_files(paths, published, max_workers=max_workers)
@@ -0,0 +1,351 @@
+"""Utilities for querying the versions of a project using PEP 440 semantics.
+
+.. versionadded:: 2.1.0
+
+.. note::
+    This module requires the ``packaging`` library which can be installed alongside
+    pypiwrap with ``pip install pypiwrap[packaging]``.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from .utils import normalize_name
+
+try:
+    from packaging.specifiers import InvalidSpecifier, SpecifierSet
+    from packaging.utils import InvalidWheelFilename, parse_wheel_filename
+    from packaging.version import InvalidVersion, Version
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "This feature requires the 'packaging' library. "
+        "Install it with 'pip install pypiwrap[packaging]'."
+    ) from exc
+
+if TYPE_CHECKING:
+    from .objects.simple_repo import DistributionFile, ProjectPage
+
+
+@lru_cache(maxsize=4096)
+def parse_version(version: str) -> Version | None:
+    """Parses a PEP 440 ``version`` string. Returns None if the version is invalid."""
+
+    try:
+        return Version(version)
+    except InvalidVersion:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def python_matches(requires_python: str | None, python_version: str) -> bool:
+    """Checks whether ``python_version`` satisfies the ``requires_python`` specifier.
+
+    Results are memoized as the same specifiers are shared by most files of a project
+    and across projects. Empty or invalid specifiers are treated as compatible.
+    """
+
+    if not requires_python:
+        return True
+
+    try:
+        return SpecifierSet(requires_python).contains(python_version, prereleases=True)
+    except InvalidSpecifier:
+        return True
+
+
+def version_from_filename(filename: str, project: str) -> str | None:
+    """Extracts the version component from a distribution ``filename`` of ``project``.
+
+    Wheels are parsed according to the binary distribution format. Other distributions
+    (sdists, eggs, and legacy formats) are assumed to follow the ``{name}-{version}``
+    naming convention. Returns None if no version could be found.
+    """
+
+    if filename.endswith(".whl"):
+        try:
+            return str(parse_wheel_filename(filename)[1])
+        except (InvalidWheelFilename, InvalidVersion):
+            return None
+
+    name = normalize_name(project)
+    parts = filename.split("-")
+
+    for idx in range(1, len(parts)):
+        if normalize_name("-".join(parts[:idx])) == name:
+            version = parts[idx]
+            # sdists put the extension right after the version (name-1.0.tar.gz)
+            for ext in (".tar.gz", ".tar.bz2", ".tar.xz", ".tgz", ".tar", ".zip"):
+                if version.endswith(ext):
+                    return version[: -len(ext)]
+            return version
+
+    return None
+
+
+def _bound(version: str | Version) -> Version:
+    if isinstance(version, Version):
+        return version
+
+    parsed = parse_version(version)
+    if parsed is None:
+        raise ValueError(
+            f"Invalid version bound {version!r}, expected a PEP 440 version."
+        )
+
+    return parsed
+
+
+class _Runs:
+    """Sorted versions split into runs of consecutive versions sharing the same set
+    of Requires-Python specifiers."""
+
+    def __init__(self) -> None:
+        self.versions: list[Version] = []
+        self.starts: list[int] = []
+        self.specifiers: list[frozenset[str | None]] = []
+
+    def append(self, version: Version, specifiers: frozenset[str | None]) -> None:
+        if not self.specifiers or self.specifiers[-1] != specifiers:
+            self.starts.append(len(self.versions))
+            self.specifiers.append(specifiers)
+
+        self.versions.append(version)
+
+    def matching(
+        self, python_version: str, reverse: bool = False
+    ) -> Iterator[tuple[int, int]]:
+        """Yields the (start, end) indices of the runs compatible with
+        ``python_version``."""
+
+        ends = [*self.starts[1:], len(self.versions)]
+        indices = range(len(self.starts))
+
+        for idx in reversed(indices) if reverse else indices:
+            if any(
+                python_matches(spec, python_version) for spec in self.specifiers[idx]
+            ):
+                yield self.starts[idx], ends[idx]
+
+
+class VersionIndex:
+    """A sorted index of the PEP 440 versions of a project page.
+
+    The index is built once from a :class:`~pypiwrap.objects.simple_repo.ProjectPage`
+    and should be accessed through :attr:`.ProjectPage.version_index`. Versions are
+    parsed and sorted, and distribution files are grouped by version.
+
+    For each combination of the pre-release and yanked filters, the sorted versions
+    are also split into runs of consecutive versions sharing the same Requires-Python
+    specifiers. As these rarely change between releases, a query only checks one set
+    of specifiers per run rather than every version, and :meth:`.latest` stops at the
+    newest matching run. Range queries use binary search.
+
+    Arguments:
+        page (ProjectPage):
+            The project page to index.
+    """
+
+    def __init__(self, page: ProjectPage) -> None:
+        self.name = page.name
+
+        self._files: dict[Version, list[DistributionFile]] = {}
+        self.invalid: list[str] = []
+        """Version strings that could not be parsed according to PEP 440."""
+
+        for pkg_file in page.files:
+            raw_version = version_from_filename(pkg_file.filename, page.name)
+            version = parse_version(raw_version) if raw_version else None
+
+            if version is None:
+                continue
+
+            self._files.setdefault(version, []).append(pkg_file)
+
+        # Projects may list versions with no files attached. Older API versions
+        # may also not include the versions key at all.
+        parsed = set(self._files)
+        for raw_version in page.versions:
+            version = parse_version(raw_version)
+            if version is None:
+                self.invalid.append(raw_version)
+            else:
+                parsed.add(version)
+
+        self.versions: list[Version] = sorted(parsed)
+        """A list of all valid versions for this project in ascending order."""
+
+        self._compatible: dict[tuple[str | None, bool, bool], list[Version]] = {}
+        self._runs: dict[tuple[bool, bool], _Runs] = {}
+
+        flags = [
+            (
+                version.is_prerelease,
+                self.is_yanked(version),
+                self._specifiers(version, include_yanked=True),
+                self._specifiers(version, include_yanked=False),
+            )
+            for version in self.versions
+        ]
+
+        for prereleases in (False, True):
+            for yanked in (False, True):
+                runs = _Runs()
+                for version, (is_pre, is_yanked, all_specs, unyanked_specs) in zip(
+                    self.versions, flags
+                ):
+                    if (is_pre and not prereleases) or (is_yanked and not yanked):
+                        continue
+                    runs.append(version, all_specs if yanked else unyanked_specs)
+
+                self._runs[prereleases, yanked] = runs
+
+    def __len__(self) -> int:
+        return len(self.versions)
+
+    def __contains__(self, version: object) -> bool:
+        if isinstance(version, str):
+            version = parse_version(version)
+        if not isinstance(version, Version):
+            return False
+
+        idx = bisect_left(self.versions, version)
+        return idx < len(self.versions) and self.versions[idx] == version
+
+    def __repr__(self) -> str:
+        return f"<VersionIndex {self.name!r} versions={len(self.versions)}>"
+
+    def files(self, version: str | Version) -> list[DistributionFile]:
+        """Returns the distribution files for ``version`` or an empty list if none."""
+
+        parsed = parse_version(version) if isinstance(version, str) else version
+        return list(self._files.get(parsed, [])) if parsed is not None else []
+
+    def is_yanked(self, version: str | Version) -> bool:
+        """Whether ``version`` is yanked.
+
+        As specified by PEP 592, a version is considered yanked if all of its files
+        have been yanked.
+        """
+
+        parsed = parse_version(version) if isinstance(version, str) else version
+        files = self._files.get(parsed, ()) if parsed is not None else ()
+        return bool(files) and all(pkg_file.yanked for pkg_file in files)
+
+    def _specifiers(
+        self, version: Version, include_yanked: bool
+    ) -> frozenset[str | None]:
+        # the Requires-Python specifiers of the files of a version; versions without
+        # files have none and so are never compatible with a given Python version
+        return frozenset(
+            pkg_file.requires_python
+            for pkg_file in self._files.get(version, ())
+            if include_yanked or not pkg_file.yanked
+        )
+
+    def compatible(
+        self,
+        python_version: str | None = None,
+        *,
+        prereleases: bool = False,
+        yanked: bool = False,
+    ) -> list[Version]:
+        """Returns the versions in ascending order that can be installed on the Python
+        version ``python_version``.
+
+        The result of each query is cached, so subsequent lookups with the same
+        arguments only copy it. The list returned may be modified freely.
+
+        Arguments:
+            python_version (str, optional):
+                A Python version such as "3.11". If none specified, Python version
+                constraints are not checked.
+
+            prereleases (bool, optional):
+                Whether to include pre-releases. Defaults to False.
+
+            yanked (bool, optional):
+                Whether to include yanked versions. Defaults to False.
+        """
+
+        runs = self._runs[prereleases, yanked]
+        if python_version is None:
+            return list(runs.versions)
+
+        key = (python_version, prereleases, yanked)
+        if key in self._compatible:
+            return list(self._compatible[key])
+
+        result = []
+        for start, end in runs.matching(python_version):
+            result += runs.versions[start:end]
+
+        self._compatible[key] = result
+        return list(result)
+
+    def latest(
+        self,
+        python_version: str | None = None,
+        *,
+        prereleases: bool = False,
+        yanked: bool = False,
+    ) -> Version | None:
+        """Returns the latest version matching the criteria or None if no version
+        matches. See :meth:`.compatible` for details on the arguments."""
+
+        runs = self._runs[prereleases, yanked]
+        if python_version is None:
+            return runs.versions[-1] if runs.versions else None
+
+        for _, end in runs.matching(python_version, reverse=True):
+            return runs.versions[end - 1]
+
+        return None
+
+    def range(
+        self,
+        lower: str | Version | None = None,
+        upper: str | Version | None = None,
+        *,
+        include_upper: bool = False,
+    ) -> list[Version]:
+        """Returns the versions in ascending order within the bounds specified.
+
+        Arguments:
+            lower (str | Version, optional):
+                The inclusive lower bound. If none specified, the range is unbounded.
+
+            upper (str | Version, optional):
+                The exclusive upper bound. If none specified, the range is unbounded.
+
+            include_upper (bool, optional):
+                Whether to include the upper bound in the range. Defaults to False.
+
+        Raises:
+            ValueError: If a bound is not a valid PEP 440 version.
+        """
+
+        start = 0 if lower is None else bisect_left(self.versions, _bound(lower))
+
+        if upper is None:
+            end = len(self.versions)
+        elif include_upper:
+            end = bisect_right(self.versions, _bound(upper))
+        else:
+            end = bisect_left(self.versions, _bound(upper))
+
+        return self.versions[start:end]
+
+    def matching(
+        self, specifier: str | SpecifierSet, *, prereleases: bool | None = None
+    ) -> list[Version]:
+        """Returns the versions in ascending order that satisfy ``specifier``
+        (for example, ``">=1.0,<2"``)."""
+
+        if isinstance(specifier, str):
+            specifier = SpecifierSet(specifier)
+
+        return list(specifier.filter(self.versions, prereleases=prereleases))
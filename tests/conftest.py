@@ -0,0 +1,64 @@
+import json
+import time
+
+import pytest
+
+from pypiwrap.transport import Transport
+
+
+class FakeResponse:
+    ok = True
+    status_code = 200
+    reason = "OK"
+
+    def __init__(self, data, headers=None, history=()) -> None:
+        self.data = data
+        self.headers = headers or {}
+        self.history = list(history)
+
+    def iter_content(self, chunk_size=None):
+        data = self.data
+        if not isinstance(data, bytes):
+            data = json.dumps(data).encode()
+
+        # an awkward chunk size, so that tags and characters are split
+        return (data[idx : idx + 7] for idx in range(0, len(data), 7))
+
+    def json(self):
+        return self.data
+
+
+class FakeTransport(Transport):
+    """Serves ``data`` for every URL or, if ``routes`` is given, the data routed to
+    each URL. Byte strings are served as HTML pages."""
+
+    def __init__(self, routes=None, *, data=None, redirects=0, delay=0.0) -> None:
+        self.headers = {}
+        self.routes = routes
+        self.data = data
+        self.redirects = redirects
+        self.delay = delay
+        self.requested = []
+        self.timeouts = []
+
+    def get(self, url, *, headers=None, **kwargs):
+        self.requested.append(url)
+        self.timeouts.append(kwargs.get("timeout"))
+        time.sleep(self.delay)
+
+        data = self.data if self.routes is None else self.routes[url]
+        history = [None] * self.redirects
+
+        if isinstance(data, bytes):
+            headers = {"Content-Type": "text/html; charset=utf-8"}
+            return FakeResponse(data, headers, history)
+
+        return FakeResponse(data, history=history)
+
+
+@pytest.fixture
+def fake_transport() -> type[FakeTransport]:
+    """The class of a transport serving canned responses, so tests may also subclass
+    it."""
+
+    return FakeTransport
@@ -0,0 +1,238 @@
+import time
+
+import pytest
+
+from pypiwrap.cache import StaleWhileRevalidateCache
+
+
+class Loader:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self) -> int:
+        self.calls += 1
+        return self.calls
+
+
+def test_stale_while_revalidate() -> None:
+    loader = Loader()
+
+    with StaleWhileRevalidateCache(soft_ttl=0.05, hard_ttl=10) as cache:
+        assert cache.get("key", loader) == 1
+        assert cache.get("key", loader) == 1
+        assert cache.hits == 1 and cache.misses == 1
+
+        time.sleep(0.06)
+
+        # the stale value is served right away and refreshed in the background
+        assert cache.get("key", loader) == 1
+        cache.close()
+
+        assert cache.stale_hits == 1
+        assert cache.refreshes == 1
+        assert cache.get("key", loader) == 2
+
+
+def test_hard_ttl_blocks() -> None:
+    loader = Loader()
+    cache = StaleWhileRevalidateCache(soft_ttl=0.01, hard_ttl=0.02)
+
+    assert cache.get("key", loader) == 1
+    time.sleep(0.03)
+    assert cache.get("key", loader) == 2
+    assert cache.misses == 2
+
+
+def test_hot_keys_refresh_ahead() -> None:
+    loader = Loader()
+
+    with StaleWhileRevalidateCache(
+        soft_ttl=0.1, hard_ttl=10, hot_threshold=3, refresh_ahead=0.5
+    ) as cache:
+        for _ in range(3):
+            cache.get("key", loader)
+
+        assert cache.hot_keys() == ["key"]
+
+        time.sleep(0.06)
+        assert cache.refresh_hot() == ["key"]
+        cache.close()
+
+        assert cache.stale_hits == 0
+        assert cache.get("key", loader) == 2
+
+
+def test_invalidate() -> None:
+    cache = StaleWhileRevalidateCache()
+    cache.get(("project", "https://pypi.org", "flask", None), Loader())
+    cache.get(("project", "https://pypi.org", "django", None), Loader())
+
+    removed = cache.invalidate_where(lambda key: key[2] == "flask")
+
+    assert removed == [("project", "https://pypi.org", "flask", None)]
+    assert len(cache) == 1
+
+
+def test_concurrent_misses_load_once() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    calls = []
+
+    def loader() -> int:
+        calls.append(None)
+        time.sleep(0.05)
+        return len(calls)
+
+    cache = StaleWhileRevalidateCache()
+
+    with ThreadPoolExecutor(max_workers=8) as callers:
+        values = list(callers.map(lambda _: cache.get("key", loader), range(8)))
+
+    assert values == [1] * 8 and len(calls) == 1
+    assert cache.misses == 8
+
+
+def test_invalidate_during_refresh() -> None:
+    import threading
+
+    release = threading.Event()
+
+    def loader() -> str:
+        release.wait(1)
+        return "refreshed"
+
+    with StaleWhileRevalidateCache(soft_ttl=0.01, hard_ttl=10) as cache:
+        cache.get("key", lambda: "stale")
+        time.sleep(0.02)
+
+        assert cache.get("key", loader) == "stale"
+        assert cache.invalidate("key")
+        release.set()
+        cache.close()
+
+        assert "key" not in cache
+        assert cache.refreshes == 0 and cache.hot_keys() == []
+
+
+def test_refresh_failures() -> None:
+    def failing() -> int:
+        raise RuntimeError("index unavailable")
+
+    with StaleWhileRevalidateCache(soft_ttl=0.01, hard_ttl=10) as cache:
+        cache.get("key", lambda: 1)
+        time.sleep(0.02)
+
+        assert cache.get("key", failing) == 1
+        cache.close()
+
+        assert cache.failures == 1 and cache.refreshes == 0
+        assert isinstance(cache.last_error, RuntimeError)
+        assert cache.get("key", failing) == 1
+
+
+def test_background_refresh() -> None:
+    loader = Loader()
+
+    with StaleWhileRevalidateCache(
+        soft_ttl=0.05, hard_ttl=10, hot_threshold=2, refresh_interval=0.01
+    ) as cache:
+        cache.get("key", loader)
+        cache.get("key", loader)
+        time.sleep(0.1)
+
+        # refreshed ahead of time without being requested again
+        assert cache.refreshes >= 1 and cache.stale_hits == 0
+
+    assert cache._thread is None
+    assert cache.get("key", loader) == loader.calls
+
+
+class FakeFeeds:
+    def __init__(self) -> None:
+        from pypiwrap.transport import RequestsTransport
+
+        self.transport = RequestsTransport()
+        self.updates = []
+        self.releases = {}
+
+    @staticmethod
+    def _feed(links):
+        from pypiwrap.objects import PyPIFeed, PyPIFeedItem
+
+        items = [PyPIFeedItem("", link, link, "", "", "") for link in links]
+        return PyPIFeed("", "", "", "", items)
+
+    def get_latest_updates(self):
+        return self._feed(self.updates)
+
+    def get_latest_releases_for_project(self, name):
+        return self._feed(self.releases.get(name, []))
+
+
+def test_feed_invalidation() -> None:
+    from pypiwrap.invalidation import FeedInvalidator
+
+    feeds = FakeFeeds()
+    feeds.updates = ["https://pypi.org/project/Flask/3.1.0/"]
+    feeds.releases["pinned-pkg"] = ["https://pypi.org/project/pinned-pkg/1.0/"]
+
+    with StaleWhileRevalidateCache(soft_ttl=100, hard_ttl=1000) as cache:
+        for name in ("flask", "pinned-pkg", "requests"):
+            cache.get(("project", "https://pypi.org", name, None, None), Loader())
+        cache.get(("project_page", "https://pypi.org", "flask", None, None), Loader())
+        for version in ("3.0.0", "3.1.0"):
+            cache.get(("project", "https://pypi.org", "flask", version, None), Loader())
+
+        invalidator = FeedInvalidator(feeds, cache, pinned=["Pinned_Pkg"])
+
+        # releases other than the one updated are kept
+        keys = invalidator.poll()
+        assert len(keys) == 4
+        assert {key[2:4] for key in keys} == {
+            ("flask", None),
+            ("flask", "3.1.0"),
+            ("pinned-pkg", None),
+        }
+        assert [key[2:4] for key in cache.keys()] == [
+            ("requests", None),
+            ("flask", "3.0.0"),
+        ]
+
+        # items already seen do not invalidate entries again
+        cache.get(("project", "https://pypi.org", "flask", None, None), Loader())
+        assert invalidator.poll() == []
+
+        loader = Loader()
+        cache.get(("project", "https://pypi.org", "requests", "2.0", None), loader)
+        feeds.updates.append("https://pypi.org/project/requests/2.0/")
+
+        invalidator.refresh = True
+        assert len(invalidator.poll()) == 2
+
+        cache.close()
+        assert loader.calls == 2
+        assert invalidator.invalidated == 6
+
+
+def test_feed_invalidation_errors() -> None:
+    from pypiwrap.invalidation import FeedInvalidator
+
+    class FailingFeeds(FakeFeeds):
+        def get_latest_updates(self):
+            self.calls += 1
+            if self.calls == 1:
+                raise ConnectionError("connection reset")
+            raise KeyError("bug")
+
+    feeds = FailingFeeds()
+    feeds.calls = 0
+
+    with StaleWhileRevalidateCache(soft_ttl=100, hard_ttl=1000) as cache:
+        invalidator = FeedInvalidator(feeds, cache, interval=0)
+
+        # failed requests are retried, while anything else stops polling
+        with pytest.raises(KeyError):
+            invalidator.run()
+
+        assert invalidator.failures == 1
+        assert isinstance(invalidator.last_error, KeyError)
@@ -0,0 +1,108 @@
+import io
+import json
+
+import pytest
+
+from pypiwrap.cli import _parse_input, _read_inputs, _run, jsonable, main
+from pypiwrap.exceptions import NotFound
+from pypiwrap.objects import Project
+
+
+class FlushCounter(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.flushed = []
+
+    def flush(self) -> None:
+        super().flush()
+        self.flushed.append(self.getvalue().count("\n"))
+
+
+def test_cli_streams_json_lines() -> None:
+    with open("tests/data/pypi_flask.json") as fp:
+        project = Project.from_json(json.load(fp))
+
+    def fetch(item: str):
+        if item == "missing":
+            raise NotFound(404, "Not Found")
+        return project
+
+    output = FlushCounter()
+    lines = ["flask", "", "# comment", "missing", "flask==3.1.0  # pinned"]
+    results = _run(fetch, _read_inputs(lines), output, concurrency=2)
+
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+
+    assert sorted(record["input"] for record in records) == [
+        "flask",
+        "flask==3.1.0",
+        "missing",
+    ]
+    assert len(results) == 3 and sum(result.ok for result in results) == 2
+
+    # every line is flushed as soon as it is written
+    assert output.flushed == [1, 2, 3]
+
+    found = next(record for record in records if record["ok"])
+    assert found["result"] == jsonable(project)
+    assert found["result"]["file_urls"][0]["size"] == 102_979
+
+    missing = next(record for record in records if not record["ok"])
+    assert missing["error"] == "NotFound: 404: Not Found"
+
+
+def test_cli_parse_input() -> None:
+    assert _parse_input("requests") == ("requests", None)
+    assert _parse_input("requests[socks]==2.32.3") == ("requests", "2.32.3")
+    assert _parse_input("Flask[async] == 3.1.0 ; python_version >= '3.9'") == (
+        "Flask",
+        "3.1.0",
+    )
+    assert _parse_input("numpy>=2") == ("numpy", None)
+
+
+def test_cli_main(fake_transport, monkeypatch, capsys) -> None:
+    with open("tests/data/pypi_flask.json") as fp:
+        data = json.load(fp)
+
+    class FailingTransport(fake_transport):
+        def get(self, url, *, headers=None, **kwargs):
+            if "/missing/" in url:
+                raise ConnectionError("connection reset")
+            return super().get(url, headers=headers, **kwargs)
+
+    # the clients keep the transport class imported before it is patched
+    import pypiwrap.client  # noqa: F401
+
+    transport = FailingTransport(data=data)
+    monkeypatch.setattr(
+        "pypiwrap.transport.RequestsTransport", lambda **kwargs: transport
+    )
+
+    with pytest.raises(SystemExit) as exc_info:
+        main(["project", "flask", "--fields", "name,projection,colour"])
+
+    assert exc_info.value.code == 2
+    assert "unknown project fields: colour, projection" in capsys.readouterr().err
+
+    # an input that failed sets the exit code, while the others are still written
+    assert main(["project", "flask==3.1.0", "missing", "--fields", "name"]) == 1
+
+    output, summary = capsys.readouterr()
+    records = sorted(map(json.loads, output.splitlines()), key=lambda r: r["input"])
+
+    assert [record["ok"] for record in records] == [True, False]
+    assert records[0]["result"] == {"name": "Flask"}
+    assert records[1]["error"] == "ConnectionError: connection reset"
+    assert summary.startswith("2 fetched (1 failed)")
+
+    # inputs are read from stdin when no names are given
+    monkeypatch.setattr("sys.stdin", io.StringIO("flask\n# comment\nflask==3.1.0\n"))
+    assert main(["project", "--fields", "name,version", "-q"]) == 0
+
+    output, summary = capsys.readouterr()
+    assert len(output.splitlines()) == 2 and summary == ""
+    assert sorted(transport.requested[-2:]) == [
+        "https://pypi.org/pypi/flask/3.1.0/json",
+        "https://pypi.org/pypi/flask/json",
+    ]
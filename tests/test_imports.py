@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+
+import pypiwrap
+import pypiwrap.objects
+
+
+def run_python(code: str) -> str:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout + result.stderr
+
+
+def test_public_api_is_available() -> None:
+    for name in pypiwrap.__all__:
+        assert getattr(pypiwrap, name) is not None
+
+    for name in pypiwrap.objects.__all__:
+        assert getattr(pypiwrap.objects, name) is not None
+
+
+def test_lazy_submodules() -> None:
+    assert pypiwrap.deadlines is sys.modules["pypiwrap.deadlines"]
+
+    # only public submodules are imported on access, so neither the CLI entry point
+    # nor arbitrary names are run or imported by hasattr()
+    assert not hasattr(pypiwrap, "__main__")
+    assert not hasattr(pypiwrap, "__path_hooks__")
+    assert not hasattr(pypiwrap, "missing")
+    assert "pypiwrap.__main__" not in sys.modules
+
+
+def test_import_is_lazy() -> None:
+    output = run_python(
+        "import sys, pypiwrap; "
+        "print('loaded:', sorted(name for name in sys.modules "
+        "if name.startswith(('pypiwrap.', 'requests', 'xml'))))"
+    )
+
+    assert "loaded: ['pypiwrap.consts']" in output
+
+
+def test_import_time_budget() -> None:
+    output = run_python("import pypiwrap")
+
+    # the second column is the cumulative import time in microseconds
+    line = next(line for line in output.splitlines() if line.endswith("| pypiwrap"))
+    cumulative = int(line.split("|")[1])
+
+    # importing pypiwrap took over 150ms when the clients were imported eagerly
+    assert cumulative < 50_000
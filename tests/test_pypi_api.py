@@ -1,8 +1,14 @@
+import dataclasses
 import datetime
 import json
+import time
 from xml.etree import ElementTree
 
+import pytest
+
+from pypiwrap.client import PyPIClient
 from pypiwrap.objects import Project, PyPIFeed, Stats
+from pypiwrap.utils import normalize_name
 
 
 def test_parse_pypi_project() -> None:
@@ -17,6 +23,36 @@ def test_parse_pypi_project() -> None:
         )
 
 
+def test_parse_pypi_project_fields() -> None:
+    with open("tests/data/pypi_flask.json") as fp:
+        data = json.load(fp)
+
+    project = Project.from_json(data, fields=["name", "requires_dist"])
+
+    assert project.name == "Flask"
+    assert project.requires_dist
+    assert project.description is None
+    assert project.file_urls is None
+    assert project.vulnerabilities is None
+    assert project.projection == {"name", "requires_dist"}
+    assert Project.from_json(data).projection is None
+    assert dataclasses.replace(project, name="flask").projection == project.projection
+    assert dataclasses.asdict(project)["projection"] == project.projection
+
+    with pytest.raises(ValueError):
+        Project.from_json(data, fields=["projection"])
+
+    project.require_fields("name")
+    assert project.requirements
+
+    with pytest.raises(ValueError, match="description"):
+        project.require_fields("name", "description")
+    with pytest.raises(ValueError):
+        _ = Project.from_json(data, fields=["name"]).requirements
+    with pytest.raises(ValueError):
+        Project.from_json(data, fields=["name", "downloads_total"])
+
+
 def test_parse_pypi_stats() -> None:
     with open("tests/data/pypi_stats.json") as fp:
         stats = Stats.from_json(json.load(fp))
@@ -40,3 +76,234 @@ def test_parse_pypi_feeds() -> None:
         assert feed.items[2].guid == feed.items[2].link
         assert feed.items[2].published_raw == "Fri, 17 Jan 2025 21:48:37 GMT"
         assert feed.items[2].published == datetime.datetime(2025, 1, 17, 21, 48, 37)
+
+
+def test_parse_audit_pins() -> None:
+    from pypiwrap.audit import Pin, parse_pins
+
+    pins, skipped = parse_pins(
+        [
+            "# a comment",
+            "-r base.txt",
+            "Flask==3.1.0 \\",
+            "requests[socks] == 2.32.3 ; python_version >= '3.8'",
+            "click>=8",
+            ("Jinja2", "3.1.4"),
+        ]
+    )
+
+    assert pins == [
+        Pin("Flask", "3.1.0"),
+        Pin("requests", "2.32.3"),
+        Pin("Jinja2", "3.1.4"),
+    ]
+    assert skipped == ["click>=8"]
+
+
+def test_normalize_name() -> None:
+    assert normalize_name("Flask_SQLAlchemy") == "flask-sqlalchemy"
+    assert normalize_name("zope.interface") == "zope-interface"
+    assert normalize_name("a-_.-b") == "a-b"
+
+
+def test_client_normalizes_names(fake_transport) -> None:
+    with open("tests/data/pypi_flask.json") as fp:
+        transport = fake_transport(data=json.load(fp), redirects=1)
+
+    with PyPIClient(transport=transport) as client:
+        client.get_project("Flask_SQLAlchemy", "3.1.1")
+
+        assert transport.requested == [
+            "https://pypi.org/pypi/flask-sqlalchemy/3.1.1/json"
+        ]
+        assert client.redirects == 1
+
+
+def test_client_deadlines(fake_transport) -> None:
+    from pypiwrap.deadlines import deadline
+    from pypiwrap.exceptions import DeadlineExceeded
+
+    with open("tests/data/pypi_flask.json") as fp:
+        transport = fake_transport(data=json.load(fp), delay=0.05)
+
+    with PyPIClient(transport=transport, timeout=(3.0, 20.0)) as client:
+        client.get_project("flask")
+        assert transport.timeouts == [(3.0, 20.0)]
+
+        with deadline(1.0):
+            client.get_project("flask")
+            connect, read = transport.timeouts[-1]
+            assert connect <= 1.0 and read <= 1.0
+
+        pins = [f"flask=={version}" for version in range(20)]
+        start = time.monotonic()
+
+        with pytest.raises(DeadlineExceeded), deadline(0.1):
+            client.audit(pins, max_workers=2)
+
+        assert time.monotonic() - start < 0.5
+        assert len(transport.requested) < 2 + len(pins)
+
+
+def test_deadline_while_reading_bodies(fake_transport) -> None:
+    from pypiwrap.client import PyPIFeedClient, SimpleRepoClient
+    from pypiwrap.deadlines import deadline
+    from pypiwrap.exceptions import DeadlineExceeded
+    from pypiwrap.objects import DistributionFile
+
+    with open("tests/data/pypi_flask.json") as fp:
+        project_json = json.load(fp)
+    with open("tests/data/pypi_stats.json") as fp:
+        stats_json = json.load(fp)
+    with open("tests/data/pypi_packages.xml", "rb") as fp:
+        feed_xml = fp.read()
+    with open("tests/data/integrity_provenance.json") as fp:
+        provenance_json = json.load(fp)
+
+    class DrippingTransport(fake_transport):
+        # every chunk arrives well within the read timeout, but the whole body
+        # takes far longer than the deadline
+        def get(self, url, *, headers=None, **kwargs):
+            response = super().get(url, headers=headers, **kwargs)
+            chunks = response.iter_content
+
+            def iter_content(chunk_size=None):
+                for chunk in chunks(chunk_size):
+                    time.sleep(0.01)
+                    yield chunk
+
+            response.iter_content = iter_content
+            return response
+
+    transport = DrippingTransport(
+        {
+            "https://pypi.org/pypi/flask/json": project_json,
+            "https://pypi.org/stats": stats_json,
+            "https://pypi.org/rss/packages.xml": feed_xml,
+            "https://pypi.org/integrity/flask": provenance_json,
+        }
+    )
+    pkg_file = DistributionFile(
+        filename="flask-3.1.0.tar.gz",
+        url="https://files.example/flask-3.1.0.tar.gz",
+        size=None,
+        hashes={"sha256": "flask"},
+        provenance_url="https://pypi.org/integrity/flask",
+    )
+
+    with (
+        PyPIClient(transport=transport) as client,
+        PyPIFeedClient(transport=transport) as feeds,
+        SimpleRepoClient(transport=transport) as simple,
+    ):
+        for fetch, args in [
+            (client.get_project, ("flask",)),
+            (client.get_stats, ()),
+            (feeds.get_newest_packages, ()),
+            (simple.get_provenance, (pkg_file,)),
+        ]:
+            start = time.monotonic()
+            with pytest.raises(DeadlineExceeded), deadline(0.1):
+                fetch(*args)
+
+            assert time.monotonic() - start < 0.5
+
+
+def test_audit_records_errors(fake_transport) -> None:
+    from pypiwrap.audit import Pin
+
+    with open("tests/data/pypi_flask.json") as fp:
+        data = json.load(fp)
+
+    class FailingTransport(fake_transport):
+        def get(self, url, *, headers=None, **kwargs):
+            if "/1.0/" in url:
+                raise ConnectionError("connection reset")
+            if "/2.0/" in url:
+                raise TimeoutError("read timed out")
+            return super().get(url, headers=headers, **kwargs)
+
+    with PyPIClient(transport=FailingTransport(data=data)) as client:
+        report = client.audit(["flask==1.0", "flask==2.0", "flask==3.1.0"])
+
+    assert [pin.version for pin in report.errors] == ["1.0", "2.0"]
+    assert isinstance(report.errors[Pin("flask", "1.0")], ConnectionError)
+    assert isinstance(report.errors[Pin("flask", "2.0")], TimeoutError)
+    assert len(report.audited) == 3
+
+
+def test_audit_deadline_not_recorded(fake_transport) -> None:
+    from pypiwrap.deadlines import deadline
+    from pypiwrap.exceptions import DeadlineExceeded
+
+    class TimingOutTransport(fake_transport):
+        def get(self, url, *, headers=None, **kwargs):
+            timeout = kwargs.get("timeout")
+            time.sleep(timeout if isinstance(timeout, float) else timeout[0])
+            raise TimeoutError("read timed out")
+
+    pins = [f"flask=={version}" for version in range(4)]
+
+    with PyPIClient(transport=TimingOutTransport()) as client:
+        # every request times out with the deadline, which is raised rather than
+        # recorded as the error of each pin
+        for _ in range(5):
+            with pytest.raises(DeadlineExceeded), deadline(0.05):
+                client.audit(pins, max_workers=len(pins))
+
+
+def test_project_requirements() -> None:
+    from pypiwrap.requirements import (
+        applicable_requirements,
+        evaluate_markers,
+        marker_environment,
+        parse_requirement,
+    )
+
+    with open("tests/data/pypi_flask.json") as fp:
+        project = Project.from_json(json.load(fp))
+
+    assert [req.name for req in project.requirements][:2] == ["Werkzeug", "Jinja2"]
+    assert project.requirements[0] is parse_requirement(project.requires_dist[0])
+    assert parse_requirement("not a requirement!") is None
+
+    environments = [marker_environment("3.9"), marker_environment("3.12.1")]
+    matrix = evaluate_markers(project.requires_dist, environments, extras=["async"])
+    assert len(matrix) == len(project.requires_dist)
+    applies = dict(zip(project.requires_dist, matrix))
+
+    assert applies["Werkzeug>=3.1"] == [True, True]
+    assert applies['importlib-metadata>=3.6; python_version < "3.10"'] == [True, False]
+    assert applies['asgiref>=3.2; extra == "async"'] == [True, True]
+    assert applies['python-dotenv; extra == "dotenv"'] == [False, False]
+
+    names = [
+        req.name
+        for req in applicable_requirements(project.requires_dist, environments[1])
+    ]
+    assert "importlib-metadata" not in names and "asgiref" not in names
+
+
+def test_interning() -> None:
+    from pypiwrap.interning import InternPool, interning
+
+    with open("tests/data/pypi_flask.json") as fp:
+        raw = fp.read()
+
+    plain = [Project.from_json(json.loads(raw)) for _ in range(2)]
+    assert plain[0].classifiers[0] is not plain[1].classifiers[0]
+
+    pool = InternPool()
+    with interning(pool):
+        projects = [Project.from_json(json.loads(raw)) for _ in range(2)]
+
+    assert projects == plain
+    assert projects[0].classifiers[0] is projects[1].classifiers[0]
+    assert (
+        projects[0].file_urls[0].python_version
+        is projects[1].file_urls[0].python_version
+    )
+
+    stats = pool.stats()
+    assert stats.strings == len(pool)
+    assert stats.hits > 0 and stats.saved_bytes > 0
@@ -4,7 +4,14 @@ import pytest
 
 from pypiwrap.client import SimpleRepoClient
 from pypiwrap.exceptions import UnexpectedVersionWarning, UnsupportedVersionError
-from pypiwrap.objects import IndexPage, ProjectPage
+from pypiwrap.objects import (
+    DistributionFile,
+    IndexPage,
+    Project,
+    ProjectPage,
+    Provenance,
+)
+from pypiwrap.transport import RequestsTransport, Transport
 
 
 def test_parse_index_page() -> None:
@@ -35,3 +42,643 @@ def test_check_version_mismatch() -> None:
 
         with pytest.raises(UnsupportedVersionError):
             client._verify_api_version("10.0")
+
+
+def test_project_page_version_index() -> None:
+    from pypiwrap.versions import python_matches
+
+    with open("tests/data/simple_repo_colorama_page.json") as fp:
+        page = ProjectPage.from_json(json.load(fp))
+
+    index = page.version_index
+
+    assert index is page.version_index
+    assert len(index) == 9
+    assert str(index.versions[0]) == "0.4.0"
+    assert len(index.files("0.4.6")) == 2
+    assert index.is_yanked("0.4.2")
+    assert "0.4.2" not in [str(ver) for ver in index.compatible()]
+
+    assert str(index.latest()) == "0.4.6"
+    assert str(index.latest(prereleases=True)) == "0.4.6"
+    assert str(index.latest("3.5")) == "0.4.5"
+    assert str(index.latest("3.5", prereleases=True)) == "0.4.5"
+
+    assert [str(ver) for ver in index.range("0.4.4", "0.4.6")] == [
+        "0.4.4",
+        "0.4.5rc1",
+        "0.4.5",
+        "0.4.6rc1",
+    ]
+    assert [str(ver) for ver in index.matching(">=0.4.5")] == ["0.4.5", "0.4.6"]
+
+    with pytest.raises(ValueError, match="Invalid version bound"):
+        index.range("not a version")
+
+    # results are copies, so changing them leaves the index intact
+    index.compatible().clear()
+    index.compatible("3.5").clear()
+    index.files("0.4.6").clear()
+    assert str(index.latest()) == "0.4.6"
+    assert str(index.compatible("3.5")[-1]) == "0.4.5"
+    assert len(index.files("0.4.6")) == 2
+
+    # the runs of versions sharing specifiers give the same result as checking each
+    # version on its own
+    for python_version in ("2.7", "3.4", "3.5", "3.12"):
+        expected = [
+            version
+            for version in index.versions
+            if not version.is_prerelease
+            and not index.is_yanked(version)
+            and any(
+                python_matches(pkg_file.requires_python, python_version)
+                for pkg_file in index.files(version)
+                if not pkg_file.yanked
+            )
+        ]
+        assert index.compatible(python_version) == expected
+        assert index.latest(python_version) == (expected[-1] if expected else None)
+
+
+def test_tag_index_select() -> None:
+    from packaging.tags import parse_tag
+
+    from pypiwrap.tags import TagIndex, TargetEnvironment
+
+    with open("tests/data/simple_repo_colorama_page.json") as fp:
+        page = ProjectPage.from_json(json.load(fp))
+
+    targets = [
+        TargetEnvironment("py3", ["cp311-cp311-manylinux_2_17_x86_64", "py3-none-any"]),
+        TargetEnvironment("cp311", ["cp311-cp311-manylinux_2_17_x86_64"]),
+    ]
+
+    index = TagIndex()
+    selected = index.select([page], targets, sdists=True)
+
+    assert selected["colorama"]["py3"][0].file.filename == (
+        "colorama-0.4.6-py2.py3-none-any.whl"
+    )
+    assert selected["colorama"]["py3"][1].file.filename == "colorama-0.4.6.tar.gz"
+    assert selected["colorama"]["cp311"][0].file.filename == "colorama-0.4.6.tar.gz"
+
+    best = index.best([page], targets)
+    assert best["colorama"]["cp311"] is None
+
+    # repeated tags keep their first rank, and sdists still rank after every tag
+    repeated = TargetEnvironment("repeated", ["py3-none-any"] * 3 + ["py2-none-any"])
+    assert repeated.rank(frozenset(parse_tag("py2-none-any"))) == 3
+    assert repeated.rank(frozenset()) == 4
+
+
+def test_parse_provenance() -> None:
+    with open("tests/data/integrity_provenance.json") as fp:
+        provenance = Provenance.from_json(json.load(fp))
+
+    bundle = provenance.attestation_bundles[0]
+
+    assert provenance.version == 1
+    assert bundle.publisher.kind == "GitHub"
+    assert bundle.publisher.claims["repository"] == "pypa/sampleproject"
+    assert bundle.attestations[0].transparency_entries[0]["logIndex"] == "154287498"
+
+
+def test_provenance_errors_per_file(fake_transport) -> None:
+    with open("tests/data/integrity_provenance.json") as fp:
+        provenance_json = json.load(fp)
+
+    class FailingTransport(fake_transport):
+        def get(self, url, *, headers=None, **kwargs):
+            if url.endswith("/broken"):
+                self.requested.append(url)
+                raise ConnectionError("connection reset")
+            return super().get(url, headers=headers, **kwargs)
+
+    def make_file(name: str, digest: str) -> DistributionFile:
+        return DistributionFile(
+            filename=name,
+            url=f"https://files.example/{name}",
+            size=None,
+            hashes={"sha256": digest},
+            provenance_url=f"https://pypi.org/integrity/{digest}",
+        )
+
+    files = [
+        make_file("sample-1.0.tar.gz", "ok"),
+        make_file("sample-1.0-py3-none-any.whl", "broken"),
+        make_file("sample-1.0.zip", "broken"),
+    ]
+    transport = FailingTransport({"https://pypi.org/integrity/ok": provenance_json})
+    errors = {}
+
+    with SimpleRepoClient(transport=transport) as client:
+        provenances = client.get_provenances(files, errors=errors)
+
+        assert client.get_provenances(files[:1]) == provenances
+
+    assert list(provenances) == ["sample-1.0.tar.gz"]
+    assert provenances["sample-1.0.tar.gz"].version == 1
+    assert list(errors) == ["sample-1.0-py3-none-any.whl", "sample-1.0.zip"]
+    assert all(isinstance(exc, ConnectionError) for exc in errors.values())
+    # the failed digest is not requested again for the second file sharing it
+    assert transport.requested.count("https://pypi.org/integrity/broken") == 1
+
+
+def test_client_transport(fake_transport) -> None:
+    with open("tests/data/simple_repo_colorama_page.json") as fp:
+        project_json = json.load(fp)
+
+    transport = fake_transport({"https://pypi.org/simple/colorama/": project_json})
+
+    with SimpleRepoClient(transport=transport) as client:
+        page = client.get_project_page("Colorama")
+
+    assert page.name == "colorama"
+    assert client.transport is transport and client.rest is None
+    assert transport.requested == ["https://pypi.org/simple/colorama/"]
+    assert transport.headers["Accept"].startswith("application/vnd.pypi.simple.v1+json")
+
+    with RequestsTransport(pool_maxsize=32) as default:
+        assert default.session.get_adapter("https://pypi.org")._pool_maxsize == 32
+
+    # the session of the default transport remains available as before
+    with SimpleRepoClient() as client:
+        assert client.rest is client.transport.session
+        assert (
+            client.rest.headers["User-Agent"] == client.transport.headers["User-Agent"]
+        )
+
+    class IncompleteTransport(Transport):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteTransport()
+
+
+def test_html_fallback(fake_transport) -> None:
+    from pypiwrap.simple_html import parse_project_page
+
+    with open("tests/data/simple_repo_colorama_page.json") as fp:
+        expected = ProjectPage.from_json(json.load(fp))
+
+    with open("tests/data/simple_repo_colorama_page.html", "rb") as fp:
+        transport = fake_transport({"https://pypi.org/simple/colorama/": fp.read()})
+
+    with SimpleRepoClient(transport=transport) as client:
+        page = client.get_project_page("Colorama")
+
+    assert page.name == "colorama"
+    assert page.meta.api_version == "1.3"
+    assert sorted(page.versions) == sorted(expected.versions)
+    assert len(page.files) == len(expected.files)
+
+    for pkg_file, expected_file in zip(page.files, expected.files):
+        assert pkg_file.size is None
+        assert pkg_file.filename == expected_file.filename
+        assert pkg_file.url == expected_file.url
+        assert pkg_file.hashes == expected_file.hashes
+        assert pkg_file.requires_python == expected_file.requires_python
+        assert pkg_file.yanked == expected_file.yanked
+        assert pkg_file.core_metadata == (expected_file.core_metadata or None)
+
+    # versions spelled differently in filenames are normalized
+    html = (
+        b'<a href="pkg-1.0_RC1-py3-none-any.whl">pkg-1.0_RC1-py3-none-any.whl</a>'
+        b'<a href="pkg-1.0rc1.tar.gz">pkg-1.0rc1.tar.gz</a>'
+        b'<a href="pkg-2.0-1-py3-none-any.whl">pkg-2.0-1-py3-none-any.whl</a>'
+    )
+    page_url = "https://example.org/simple/pkg/"
+    assert parse_project_page([html], "pkg", page_url).versions == ["1.0rc1", "2.0"]
+
+
+def test_multi_host_hedging(fake_transport) -> None:
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from pypiwrap.client import MultiHostSimpleRepoClient
+
+    with open("tests/data/simple_repo_colorama_page.json") as fp:
+        project_json = json.load(fp)
+
+    class SlowTransport(fake_transport):
+        def get(self, url, *, headers=None, **kwargs):
+            if url.startswith("https://slow"):
+                time.sleep(0.5)
+            return super().get(url, headers=headers, **kwargs)
+
+    transport = SlowTransport(
+        {
+            "https://slow.example/simple/colorama/": project_json,
+            "https://fast.example/simple/colorama/": project_json,
+        }
+    )
+
+    with MultiHostSimpleRepoClient(
+        ["https://slow.example", "https://fast.example"],
+        transport=transport,
+        default_hedge_delay=0.05,
+    ) as client:
+        start = time.monotonic()
+        page = client.get_project_page("colorama")
+
+        assert page.name == "colorama"
+        assert time.monotonic() - start < 0.4
+        assert client.pool.ranked()[0] == "https://fast.example"
+
+        client.pool.record_failure("https://fast.example")
+        client.pool.record_failure("https://fast.example")
+        client.pool.record_failure("https://fast.example")
+        assert client.pool.ranked()[-1] == "https://fast.example"
+
+    # concurrent callers do not wait for each other, so their hedges still fire
+    # after the hedge delay rather than after the slow requests of other callers
+    with (
+        MultiHostSimpleRepoClient(
+            ["https://slow.example", "https://fast.example"],
+            transport=transport,
+            default_hedge_delay=0.05,
+        ) as client,
+        ThreadPoolExecutor(max_workers=8) as callers,
+    ):
+        start = time.monotonic()
+        pages = list(callers.map(client.get_project_page, ["colorama"] * 8))
+
+        assert all(page.name == "colorama" for page in pages)
+        assert time.monotonic() - start < 0.4
+
+
+def test_multi_host_closes_failed_responses(fake_transport) -> None:
+    from pypiwrap.client import MultiHostSimpleRepoClient
+
+    with open("tests/data/simple_repo_colorama_page.json") as fp:
+        project_json = json.load(fp)
+
+    responses = []
+
+    class ErrorTransport(fake_transport):
+        def get(self, url, *, headers=None, **kwargs):
+            response = super().get(url, headers=headers, **kwargs)
+            if not url.startswith("https://ok"):
+                response.status_code = 503
+                response.ok = False
+
+            response.closed = False
+            response.close = lambda: setattr(response, "closed", True)
+            responses.append(response)
+            return response
+
+    transport = ErrorTransport(data=project_json)
+
+    with MultiHostSimpleRepoClient(
+        ["https://broken.example", "https://down.example", "https://ok.example"],
+        transport=transport,
+    ) as client:
+        client.pool.record_failure("https://ok.example")
+        client.pool.record_failure("https://down.example")
+        client.get_project_page("colorama")
+
+    failed = [response for response in responses if response.status_code == 503]
+    # the failed attempts are closed rather than keeping their connections checked
+    # out until they are garbage collected
+    assert len(failed) == 2
+    assert all(response.closed for response in failed)
+
+
+def test_deadline_while_streaming(fake_transport) -> None:
+    import time
+
+    from pypiwrap.client import MultiHostSimpleRepoClient
+    from pypiwrap.deadlines import deadline
+    from pypiwrap.exceptions import DeadlineExceeded
+
+    with open("tests/data/simple_repo_colorama_page.json") as fp:
+        project_json = json.load(fp)
+    with open("tests/data/simple_repo_colorama_page.html", "rb") as fp:
+        project_html = fp.read()
+
+    class DrippingTransport(fake_transport):
+        # every chunk arrives well within the read timeout, but the whole body
+        # takes far longer than the deadline
+        def get(self, url, *, headers=None, **kwargs):
+            response = super().get(url, headers=headers, **kwargs)
+            if url.startswith("https://slow"):
+                time.sleep(1.0)
+            if not url.startswith("https://pypi.org"):
+                return response
+
+            chunks = response.iter_content
+
+            def iter_content(chunk_size=None):
+                for chunk in chunks(chunk_size):
+                    time.sleep(0.01)
+                    yield chunk
+
+            response.iter_content = iter_content
+            return response
+
+    transport = DrippingTransport(
+        {
+            "https://pypi.org/simple/colorama/": project_html,
+            "https://pypi.org/simple/requests/": project_json,
+            "https://slow.example/simple/colorama/": project_json,
+            "https://fast.example/simple/colorama/": project_json,
+        }
+    )
+
+    with SimpleRepoClient(transport=transport) as client:
+        for name in ("colorama", "requests"):
+            start = time.monotonic()
+            with pytest.raises(DeadlineExceeded), deadline(0.2):
+                client.get_project_page(name)
+
+            assert time.monotonic() - start < 0.5
+
+    # a hedge delay of zero hedges at once rather than waiting for the deadline
+    with MultiHostSimpleRepoClient(
+        ["https://slow.example", "https://fast.example"],
+        transport=transport,
+        default_hedge_delay=0.0,
+    ) as client:
+        start = time.monotonic()
+        with deadline(5.0):
+            assert client.get_project_page("colorama").name == "colorama"
+
+        assert time.monotonic() - start < 0.5
+
+
+def test_merge_project_pages() -> None:
+    from pypiwrap.exceptions import UnsafeMergeError
+    from pypiwrap.merging import can_merge, merge_project_pages
+
+    with open("tests/data/simple_repo_colorama_page.json") as fp:
+        project_json = json.load(fp)
+
+    upstream = ProjectPage.from_json(project_json)
+    internal = ProjectPage.from_json(project_json)
+    internal.files = internal.files[:2] + [
+        DistributionFile.from_json(
+            {
+                "filename": "colorama-0.4.7-py3-none-any.whl",
+                "url": "https://internal.example/colorama-0.4.7-py3-none-any.whl",
+                "hashes": {"sha256": "abc"},
+                "size": 10,
+            }
+        )
+    ]
+    internal.versions = ["0.4.0", "0.4.7"]
+
+    pages = {
+        "https://internal.example/simple/colorama/": internal,
+        "https://pypi.org/simple/colorama/": upstream,
+    }
+
+    assert not can_merge(pages)
+    with pytest.raises(UnsafeMergeError):
+        merge_project_pages(pages)
+
+    internal.meta.tracks = ["https://pypi.org/simple/colorama/"]
+    merged = merge_project_pages(pages)
+
+    assert len(merged.files) == len(upstream.files) + 1
+    assert merged.versions[-1] == "0.4.6"
+    assert merged.versions[1] == "0.4.7"
+    assert merged.repositories == list(pages)
+
+
+def test_diff_project_pages() -> None:
+    from pypiwrap.diffing import diff_pages, snapshot
+
+    with open("tests/data/simple_repo_colorama_page.json") as fp:
+        project_json = json.load(fp)
+
+    old = snapshot(ProjectPage.from_json(project_json))
+    stored = json.loads(json.dumps(old))
+
+    project_json["files"][0]["yanked"] = "Broken"
+    project_json["files"][1]["core-metadata"] = {"sha256": "abc"}
+    removed = project_json["files"].pop(2)
+    project_json["files"].append({**removed, "filename": "colorama-0.4.7.tar.gz"})
+
+    for previous in (old, stored):
+        diff = diff_pages(previous, project_json)
+
+        assert [item.filename for item in diff.added] == ["colorama-0.4.7.tar.gz"]
+        assert [item.filename for item in diff.removed] == [removed["filename"]]
+        assert [change.fields for change in diff.changed] == [
+            ("yanked",),
+            ("core_metadata",),
+        ]
+        assert diff.newly_yanked[0].filename == "colorama-0.4.0-py2.py3-none-any.whl"
+
+    assert not diff_pages(old, old)
+
+
+def test_snapshot_sources_agree() -> None:
+    from pypiwrap.diffing import diff_pages, snapshot
+    from pypiwrap.simple_html import parse_project_page
+
+    with open("tests/data/simple_repo_colorama_page.json") as fp:
+        project_json = json.load(fp)
+
+    with open("tests/data/simple_repo_colorama_page.html", "rb") as fp:
+        html_page = parse_project_page(
+            fp, "colorama", "https://pypi.org/simple/colorama/"
+        )
+
+    expected = snapshot(project_json)
+    stored = json.loads(json.dumps(expected))
+
+    assert snapshot(ProjectPage.from_json(project_json)) == expected
+    assert snapshot(html_page) == expected
+    assert not diff_pages(stored, html_page)
+
+
+def test_bulk_parse_project_pages() -> None:
+    from pypiwrap.bulk import BulkParser
+
+    with open("tests/data/simple_repo_colorama_page.json", "rb") as fp:
+        raw = fp.read()
+
+    payloads = [raw, raw.replace(b'"colorama"', b'"colorama2"', 1)] * 3
+
+    with BulkParser(max_workers=2, max_in_flight=2) as parser:
+        pages = list(parser.parse("project_page", payloads))
+
+        assert [page.name for page in pages] == ["colorama", "colorama2"] * 3
+        assert pages[0] == ProjectPage.from_json(json.loads(raw))
+
+        with pytest.raises(json.JSONDecodeError):
+            list(parser.parse("project_page", [raw, b"{"]))
+
+        # pages are checked for their API version as with the clients
+        newer = raw.replace(b'"api-version": "1.3"', b'"api-version": "1.99"')
+        with pytest.warns(UnexpectedVersionWarning):
+            (page,) = parser.parse("project_page", [newer])
+        assert page.name == "colorama"
+
+        unsupported = raw.replace(b'"api-version": "1.3"', b'"api-version": "2.0"')
+        with pytest.raises(UnsupportedVersionError):
+            list(parser.parse("project_page", [unsupported]))
+
+        with open("tests/data/pypi_flask.json", "rb") as fp:
+            project_raw = fp.read()
+
+        project = Project.from_json(
+            json.loads(project_raw), fields=["name", "file_urls"]
+        )
+        (parsed,) = parser.parse("project", [project_raw], fields=["name", "file_urls"])
+
+        assert parsed == project and parsed.projection == project.projection
+
+
+def test_name_index_search() -> None:
+    from xml.etree import ElementTree
+
+    from pypiwrap.objects import PyPIFeed
+    from pypiwrap.search import NameIndex
+
+    with open("tests/data/simple_repo_index_page.json") as fp:
+        page = IndexPage.from_json(json.load(fp))
+
+    index = NameIndex.from_index_page(page)
+    name = next(name for name in index.names if len(name) >= 10)
+    typo = name[:4] + name[5:]
+
+    assert index.search(name, k=1)[0] == (name, 1.0)
+    assert name in [match.name for match in index.search(typo, k=3)]
+
+    restored = NameIndex.from_json(json.loads(json.dumps(index.to_json())))
+    assert restored.search(typo, k=5) == index.search(typo, k=5)
+
+    feed = PyPIFeed.from_xml(
+        ElementTree.parse("tests/data/pypi_packages.xml").getroot().find("channel")
+    )
+    added = index.update_from_feed(feed)
+
+    assert "david-cointegration-package" in added
+    assert "David_Cointegration.Package" in index
+    assert index.update_from_feed(feed) == []
+
+
+def test_name_index_search_at_scale() -> None:
+    import random
+    from collections import Counter
+    from collections.abc import Iterator
+    from itertools import accumulate
+
+    from pypiwrap.search import NameIndex, trigrams
+
+    rng = random.Random(0)
+    # letters by their frequency in English
+    letters = "etaoinsrhldcumfpgwybvk"
+    frequencies = list(
+        accumulate([13, 9, 8, 8, 7, 7, 6, 6, 6, 4, 4, 3, 3, 2, 2, 2, 2, 2, 2, 2, 1, 1])
+    )
+    affixes = ["py", "python-", "django-", "types-", "-client", "-utils", "-sdk"]
+
+    def word() -> str:
+        size = rng.randint(3, 9)
+        return "".join(rng.choices(letters, cum_weights=frequencies, k=size))
+
+    # words are picked with a Zipf distribution, like the names they derive from
+    words = [word() for _ in range(1_000)]
+    weights = list(accumulate(1 / rank for rank in range(1, len(words) + 1)))
+
+    def names(count: int) -> Iterator[str]:
+        bases = rng.choices(words, cum_weights=weights, k=count)
+        others = rng.choices(words, cum_weights=weights, k=count)
+
+        for base, other in zip(bases, others):
+            extra = rng.random()
+            if extra < 0.3:
+                affix = rng.choice(affixes)
+                base = base + affix if affix.startswith("-") else affix + base
+            elif extra < 0.6:
+                base += "-" + other
+
+            yield base if rng.random() < 0.9 else f"{base}{rng.randint(0, 99)}"
+
+    # a small probe size has the pruning apply to a few thousand names, as it does to
+    # the full index of PyPI with the default one
+    index = NameIndex(names(5_000), probe_size=50)
+
+    def scan_all(query: str, k: int, min_score: float = 0.0) -> list[float]:
+        # scores every name sharing a trigram with the query
+        grams = trigrams(query)
+        shared: Counter[int] = Counter()
+        for gram in grams:
+            shared.update(index._postings.get(gram, []))
+
+        scores = (
+            count / (len(grams) + index._sizes[name_id] - count)
+            for name_id, count in shared.items()
+        )
+        return sorted((score for score in scores if score >= min_score), reverse=True)[
+            :k
+        ]
+
+    # misspellings of indexed names, as in "did you mean" suggestions
+    queries = []
+    for name in rng.sample(index.names, 40):
+        idx = rng.randrange(1, len(name))
+        queries.append(name[:idx] + name[idx + 1 :])
+
+    for query in [*queries, "py", "python-requests", "django-utils"]:
+        for k, min_score in [(1, 0.0), (10, 0.0), (10, 0.5)]:
+            matches = index.search(query, k, min_score=min_score)
+            expected = scan_all(query, k, min_score)
+            assert [match.score for match in matches] == expected
+
+
+def test_verify_files(tmp_path) -> None:
+    import hashlib
+
+    from pypiwrap.utils import Size
+    from pypiwrap.verify import verify_directory
+
+    contents = {
+        "good-1.0-py3-none-any.whl": b"good",
+        "bad-1.0-py3-none-any.whl": b"tampered",
+        "empty-1.0.tar.gz": b"",
+        "local-1.0-py3-none-any.whl": b"local",
+        "nohash-1.0.tar.gz": b"nohash",
+    }
+    for filename, data in contents.items():
+        (tmp_path / filename).write_bytes(data)
+    (tmp_path / "notes.txt").write_bytes(b"ignored")
+
+    def published(filename: str, data: bytes, **hashes: str) -> DistributionFile:
+        return DistributionFile(filename, "", Size.from_int(len(data)), hashes)
+
+    report = verify_directory(
+        tmp_path,
+        [
+            published(
+                "good-1.0-py3-none-any.whl",
+                b"good",
+                md5="0" * 32,
+                blake2b_256=hashlib.blake2b(b"good", digest_size=32).hexdigest(),
+            ),
+            published(
+                "bad-1.0-py3-none-any.whl",
+                b"bad",
+                sha256=hashlib.sha256(b"bad").hexdigest(),
+            ),
+            published("empty-1.0.tar.gz", b"", sha256=hashlib.sha256(b"").hexdigest()),
+            published("nohash-1.0.tar.gz", b"nohash", custom="abc"),
+        ],
+    )
+
+    assert not report.ok
+    assert [path.name for path in report.verified] == [
+        "empty-1.0.tar.gz",
+        "good-1.0-py3-none-any.whl",
+    ]
+    assert [item.path.name for item in report.mismatched] == [
+        "bad-1.0-py3-none-any.whl"
+    ]
+    assert [path.name for path in report.missing_upstream] == [
+        "local-1.0-py3-none-any.whl"
+    ]
+    assert [path.name for path in report.unverifiable] == ["nohash-1.0.tar.gz"]
@@ -0,0 +1,71 @@
+import json
+from dataclasses import replace
+
+import pytest
+
+from pypiwrap.objects import Project, ProjectPage
+from pypiwrap.store import MetadataStore
+
+
+def test_store_round_trip() -> None:
+    with open("tests/data/pypi_flask.json") as fp:
+        project = Project.from_json(json.load(fp))
+
+    with open("tests/data/simple_repo_colorama_page.json") as fp:
+        page = ProjectPage.from_json(json.load(fp))
+
+    with MetadataStore() as store:
+        assert store.add_projects([project, project]) == 2
+        assert store.add_project_pages([page]) == 1
+
+        assert store.get_project("FLASK") == project
+        assert store.get_project("flask", project.version) == project
+        assert store.get_project("flask", "0.1") is None
+        assert store.get_project_page("Colorama") == page
+        assert store.project_names() == ["colorama", "flask"]
+
+
+def test_store_find_projects() -> None:
+    with open("tests/data/pypi_flask.json") as fp:
+        project = Project.from_json(json.load(fp))
+
+    with MetadataStore() as store:
+        store.add_projects([project])
+
+        classifier = project.classifiers[0]
+
+        assert store.find_projects(classifier=classifier) == [project]
+        assert store.find_projects(classifier="License ::") == [project]
+        assert store.find_projects(classifier="Nonexistent :: Classifier") == []
+        assert store.find_projects(vulnerability="PYSEC-0000-0") == []
+        assert store.find_projects(columns={"requires_python": ">=3.9"})
+        assert store.find_projects(columns={"name": "FLASK", "yanked": None}) == []
+        assert store.find_projects(python_version="3.12") == [project]
+        assert store.find_projects(python_version="3.8") == []
+
+        with pytest.raises(ValueError, match="column"):
+            store.find_projects(columns={"1 OR 1": 1})
+
+        older = replace(project, version="2.3.3", requires_python=">=3.8")
+        store.add_projects([older])
+
+        assert store.find_projects(python_version="3.8") == [older]
+        assert store.find_projects(python_version="3.12") == [project, older]
+
+
+def test_store_latest_release() -> None:
+    with open("tests/data/pypi_flask.json") as fp:
+        data = json.load(fp)
+
+    project = Project.from_json(data)
+    older = replace(project, version="2.3.3")
+    prerelease = replace(project, version="3.2.0rc1")
+
+    with MetadataStore() as store:
+        store.add_projects([project, prerelease, older])
+
+        # the highest final release, not the release stored last
+        assert store.get_project("flask") == project
+
+        with pytest.raises(ValueError, match="name"):
+            store.add_projects([Project.from_json(data, fields=["version"])])